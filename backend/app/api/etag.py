@@ -0,0 +1,69 @@
+"""読み取りAPIの条件付きGET（ETag / If-None-Match）
+
+ETag はレスポンスの元になるテーブルの変更カウンタ（table_versions）とリクエストURLから作る。
+カウンタは主キー1行の参照で済むため、変更がなければ一覧・集計のクエリを実行せずに 304 を返せる。
+圧縮でバイト列が変わるため弱いETag（W/"..."）とする。
+"""
+import hashlib
+from typing import Callable, Dict, Optional
+
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_db
+from app.crud import table_version as crud_table_version
+
+
+def make_etag(request: Request, versions: Dict[str, int]) -> str:
+    """URL（パス・クエリ）とテーブルの変更カウンタから弱いETagを作成"""
+    query = "&".join(f"{key}={value}" for key, value in sorted(request.query_params.multi_items()))
+    stamp = ",".join(f"{name}:{versions[name]}" for name in sorted(versions))
+    digest = hashlib.sha1(f"{request.url.path}?{query}|{stamp}".encode("utf-8")).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match に一致するETagがあるか（弱い比較）"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def table_etag(*table_names: str) -> Callable:
+    """
+    指定テーブルの変更カウンタでETagを付け、If-None-Match が一致すれば 304 を返す依存関係
+
+    エンドポイントの `dependencies=[Depends(table_etag("articles"))]` に指定する。
+    本体より先に実行されるため、304 の場合は一覧・集計のクエリを実行しない。
+    """
+
+    async def check_etag(
+        request: Request,
+        response: Response,
+        db: AsyncSession = Depends(get_db),
+    ) -> None:
+        try:
+            versions = await crud_table_version.get_table_versions(db, table_names)
+        except SQLAlchemyError as e:
+            # マイグレーション未適用等ではETagを付けずに通常どおり返す
+            print(f"[WARN] Failed to load table versions: {e}")
+            await db.rollback()
+            return
+        if len(versions) < len(table_names):
+            return
+
+        etag = make_etag(request, versions)
+        # キャッシュしてよいが、毎回サーバーに確認させる
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=304, headers=headers)
+        response.headers.update(headers)
+
+    return check_etag
@@ -1,55 +1,201 @@
 from fastapi import APIRouter, Depends, Query, HTTPException, BackgroundTasks
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional
+from typing import Annotated, AsyncIterator, Literal, Optional, Union
 from datetime import date
 
 from app.api.deps import get_db
+from app.core.database import AsyncSessionLocal
+from app.api.etag import table_etag
 from app.crud import article as crud_article
 from app.crud import job as crud_job
 from app.schemas import (
     ArticleListResponse,
+    ArticleCompactListResponse,
+    ArticleSearchHit,
+    ArticleSearchResponse,
     ArticleUpdate,
     ArticleAnalysisStats,
     ArticleAnalysisCoefficients,
     ArticleResponse,
     ArticleCreate,
 )
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl
+from app.services.export import article_export_columns, export_filename, export_media_type, iter_export
 
 router = APIRouter()
 
 
-@router.get("", response_model=ArticleListResponse)
+@router.get(
+    "",
+    response_model=Annotated[
+        Union[ArticleListResponse, ArticleCompactListResponse],
+        Field(discriminator="view"),
+    ],
+    dependencies=[Depends(table_etag("articles"))],
+)
 async def list_articles(
     skip: int = 0,
     limit: int = 100,
     company_id: Optional[int] = None,
     category: Optional[str] = Query(None, description="Filter by category"),
     business_area: Optional[str] = Query(None, description="Filter by business area"),
-    tags: Optional[str] = Query(None, description="Filter by tag"),
+    tags: Optional[str] = Query(None, description="Filter by tags (comma-separated, exact match)"),
+    tags_match: Literal["any", "all"] = Query(
+        "any",
+        description="any: articles with any of the tags; all: articles with all of the tags",
+    ),
     start_date: Optional[date] = Query(None, description="Filter by start date"),
     end_date: Optional[date] = Query(None, description="Filter by end date"),
     include_unknown_dates: Optional[bool] = Query(None, description="Include articles with unknown dates"),
     is_reviewed: Optional[bool] = Query(None, description="Filter by review status"),
+    cursor: Optional[str] = Query(
+        None,
+        description="Keyset pagination cursor (next_cursor of the previous page; empty for the first page). "
+                    "When set, skip is ignored",
+    ),
+    total_mode: Literal["exact", "estimate"] = Query(
+        "exact",
+        description="exact: exact total in the same query; estimate: cached or planner-estimated total",
+    ),
+    view: Literal["full", "compact"] = Query(
+        "full",
+        description="full: all fields; compact: list fields only (no content / summary; use GET /articles/{id})",
+    ),
     db: AsyncSession = Depends(get_db)
 ):
-    articles, total = await crud_article.get_articles(
-        db,
-        skip=skip,
-        limit=limit,
+    try:
+        page = await crud_article.get_articles(
+            db,
+            skip=skip,
+            limit=limit,
+            company_id=company_id,
+            category=category,
+            business_area=business_area,
+            tags=tags,
+            tags_match=tags_match,
+            start_date=start_date,
+            end_date=end_date,
+            include_unknown_dates=include_unknown_dates,
+            is_reviewed=is_reviewed,
+            cursor=cursor,
+            total_mode=total_mode,
+            view=view,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if view == "compact":
+        return ArticleCompactListResponse(
+            items=page.items,
+            total=page.total,
+            total_is_exact=page.total_is_exact,
+            next_cursor=page.next_cursor,
+        )
+    return ArticleListResponse(
+        items=page.items,
+        total=page.total,
+        total_is_exact=page.total_is_exact,
+        next_cursor=page.next_cursor,
+    )
+
+
+@router.get(
+    "/search",
+    response_model=ArticleSearchResponse,
+    dependencies=[Depends(table_etag("articles"))],
+)
+async def search_articles(
+    q: str = Query(..., min_length=1, description="Search query (English: \"phrase\", OR, -exclude; CJK: substring match)"),
+    skip: int = 0,
+    limit: int = Query(20, ge=1, le=100),
+    company_id: Optional[int] = None,
+    category: Optional[str] = Query(None, description="Filter by category"),
+    business_area: Optional[str] = Query(None, description="Filter by business area"),
+    tags: Optional[str] = Query(None, description="Filter by tags (comma-separated, exact match)"),
+    tags_match: Literal["any", "all"] = Query("any", description="any / all of the tags"),
+    start_date: Optional[date] = Query(None, description="Filter by start date"),
+    end_date: Optional[date] = Query(None, description="Filter by end date"),
+    include_unknown_dates: Optional[bool] = Query(None, description="Include articles with unknown dates"),
+    is_reviewed: Optional[bool] = Query(None, description="Filter by review status"),
+    db: AsyncSession = Depends(get_db)
+):
+    try:
+        page = await crud_article.search_articles(
+            db,
+            q,
+            skip=skip,
+            limit=limit,
+            company_id=company_id,
+            category=category,
+            business_area=business_area,
+            tags=tags,
+            tags_match=tags_match,
+            start_date=start_date,
+            end_date=end_date,
+            include_unknown_dates=include_unknown_dates,
+            is_reviewed=is_reviewed,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    items = [
+        ArticleSearchHit(
+            **ArticleResponse.model_validate(hit.article).model_dump(),
+            rank=hit.rank,
+            headline=hit.headline,
+        )
+        for hit in page.items
+    ]
+    return ArticleSearchResponse(items=items, total=page.total, mode=page.mode)
+
+
+@router.get("/export")
+async def export_articles(
+    format: Literal["csv", "jsonl", "xlsx"] = Query("csv", description="Export format"),
+    include_content: bool = Query(False, description="Include the article body"),
+    company_id: Optional[int] = None,
+    category: Optional[str] = Query(None, description="Filter by category"),
+    business_area: Optional[str] = Query(None, description="Filter by business area"),
+    tags: Optional[str] = Query(None, description="Filter by tags (comma-separated, exact match)"),
+    tags_match: Literal["any", "all"] = Query("any", description="any / all of the tags"),
+    start_date: Optional[date] = Query(None, description="Filter by start date"),
+    end_date: Optional[date] = Query(None, description="Filter by end date"),
+    include_unknown_dates: Optional[bool] = Query(None, description="Include articles with unknown dates"),
+    is_reviewed: Optional[bool] = Query(None, description="Filter by review status"),
+):
+    """記事一覧と同じ条件の全件をサーバー側カーソルから読みながら返す"""
+    filters = dict(
         company_id=company_id,
         category=category,
         business_area=business_area,
         tags=tags,
+        tags_match=tags_match,
         start_date=start_date,
         end_date=end_date,
         include_unknown_dates=include_unknown_dates,
         is_reviewed=is_reviewed,
     )
-    return ArticleListResponse(items=articles, total=total)
+    columns = article_export_columns(include_content)
+
+    async def body() -> AsyncIterator[bytes]:
+        # レスポンスの送信中も使うため、リクエストの依存関係（get_db）とは別にセッションを開く
+        async with AsyncSessionLocal() as db:
+            rows = crud_article.iter_articles_for_export(db, include_content=include_content, **filters)
+            async for chunk in iter_export(format, columns, rows, sheet_name="articles"):
+                yield chunk
+
+    filename = export_filename("articles", format)
+    return StreamingResponse(
+        body(),
+        media_type=export_media_type(format),
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
-@router.get("/analysis-stats", response_model=ArticleAnalysisStats)
+@router.get(
+    "/analysis-stats",
+    response_model=ArticleAnalysisStats,
+    dependencies=[Depends(table_etag("articles", "companies"))],
+)
 async def get_article_analysis_stats(
     company_id: Optional[int] = None,
     db: AsyncSession = Depends(get_db)
@@ -66,7 +212,11 @@ async def get_article_analysis_stats(
     )
 
 
-@router.get("/analysis-coefficients", response_model=ArticleAnalysisCoefficients)
+@router.get(
+    "/analysis-coefficients",
+    response_model=ArticleAnalysisCoefficients,
+    dependencies=[Depends(table_etag("articles", "companies"))],
+)
 async def get_article_analysis_coefficients(
     company_id: Optional[int] = None,
     db: AsyncSession = Depends(get_db)
@@ -78,6 +228,21 @@ async def get_article_analysis_coefficients(
     return ArticleAnalysisCoefficients(**data)
 
 
+@router.get(
+    "/{article_id}",
+    response_model=ArticleResponse,
+    dependencies=[Depends(table_etag("articles"))],
+)
+async def get_article(
+    article_id: int,
+    db: AsyncSession = Depends(get_db)
+):
+    article = await crud_article.get_article(db, article_id)
+    if not article:
+        raise HTTPException(status_code=404, detail="Article not found")
+    return article
+
+
 @router.put("/{article_id}", response_model=ArticleResponse)
 async def update_article(
     article_id: int,
@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 
 from app.api.deps import get_db
+from app.api.etag import table_etag
 from app.crud import company as crud_company
 from app.crud import source_url as crud_source_url
 from app.schemas import (
@@ -18,7 +19,11 @@ from app.schemas import (
 router = APIRouter()
 
 
-@router.get("", response_model=CompanyListResponse)
+@router.get(
+    "",
+    response_model=CompanyListResponse,
+    dependencies=[Depends(table_etag("companies", "source_urls"))],
+)
 async def list_companies(
     skip: int = 0,
     limit: int = 100,
@@ -31,7 +36,11 @@ async def list_companies(
     return CompanyListResponse(items=companies, total=total)
 
 
-@router.get("/{company_id}", response_model=CompanyResponse)
+@router.get(
+    "/{company_id}",
+    response_model=CompanyResponse,
+    dependencies=[Depends(table_etag("companies", "source_urls"))],
+)
 async def get_company(company_id: int, db: AsyncSession = Depends(get_db)):
     company = await crud_company.get_company(db, company_id)
     if not company:
@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.api.deps import get_db
+from app.api.etag import table_etag
 from app.crud import job as crud_job
 from app.crud import company as crud_company
 from app.models import JobHistory
@@ -16,7 +17,11 @@ from app.services.crawler.research_agent import ResearchAgent
 router = APIRouter()
 
 
-@router.get("", response_model=JobHistoryListResponse)
+@router.get(
+    "",
+    response_model=JobHistoryListResponse,
+    dependencies=[Depends(table_etag("job_histories"))],
+)
 async def list_jobs(
     skip: int = 0,
     limit: int = 20,
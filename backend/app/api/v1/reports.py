@@ -1,10 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date
+from typing import AsyncIterator
 import os
 
 from app.api.deps import get_db
+from app.core.database import AsyncSessionLocal
 from app.services.report.generator import ReportGenerator
 
 router = APIRouter()
@@ -27,6 +29,28 @@ async def generate_report(
     }
 
 
+@router.get("/stream")
+async def stream_report(
+    start_date: date,
+    end_date: date,
+):
+    """レポートをファイルに保存せずに生成しながら返す"""
+    generator = ReportGenerator()
+
+    async def body() -> AsyncIterator[bytes]:
+        # レスポンスの送信中も使うため、リクエストの依存関係（get_db）とは別にセッションを開く
+        async with AsyncSessionLocal() as db:
+            async for chunk in generator.iter_report(db, start_date, end_date):
+                yield chunk.encode("utf-8")
+
+    filename = generator.build_filename(start_date, end_date)
+    return StreamingResponse(
+        body(),
+        media_type="text/markdown; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.get("/download/{filename}")
 async def download_report(filename: str):
     """レポートをダウンロード"""
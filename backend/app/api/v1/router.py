@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.api.v1 import companies, articles, jobs, settings, reports, search_settings, prompts
+from app.api.v1 import companies, articles, jobs, settings, reports, search_settings, prompts, url_filter_rules
 
 api_router = APIRouter()
 
@@ -43,3 +43,9 @@ api_router.include_router(
     prompts.router,
     tags=["prompts"]
 )
+
+api_router.include_router(
+    url_filter_rules.router,
+    prefix="/url-filter-rules",
+    tags=["url-filter-rules"]
+)
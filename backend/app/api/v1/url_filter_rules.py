@@ -0,0 +1,99 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+
+from app.api.deps import get_db
+from app.crud import url_filter_rule as crud_url_filter_rule
+from app.schemas import (
+    UrlFilterRuleCreate,
+    UrlFilterRuleUpdate,
+    UrlFilterRuleResponse,
+    UrlFilterRuleListResponse,
+    UrlFilterCheckResponse,
+)
+from app.services.crawler.url_filter import UrlFilterRegistry, normalize_pattern
+
+router = APIRouter()
+
+
+@router.get("", response_model=UrlFilterRuleListResponse)
+async def list_url_filter_rules(
+    skip: int = 0,
+    limit: int = 100,
+    company_id: Optional[int] = None,
+    rule_type: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    rules, total = await crud_url_filter_rule.get_url_filter_rules(
+        db, skip=skip, limit=limit, company_id=company_id, rule_type=rule_type, is_active=is_active
+    )
+    return UrlFilterRuleListResponse(items=rules, total=total)
+
+
+@router.get("/check", response_model=UrlFilterCheckResponse)
+async def check_url(
+    url: str,
+    company_id: Optional[int] = None,
+    region: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """現在のルールでURLが除外されるか確認"""
+    matcher = await UrlFilterRegistry.get_matcher(db)
+    rule = matcher.match(url, company_id=company_id, region=region)
+    if not rule:
+        return UrlFilterCheckResponse(url=url, blocked=False)
+    return UrlFilterCheckResponse(
+        url=url,
+        blocked=True,
+        rule_id=rule.id,
+        rule_type=rule.rule_type,
+        pattern=rule.pattern,
+        reason=rule.reason,
+    )
+
+
+@router.post("", response_model=UrlFilterRuleResponse)
+async def create_url_filter_rule(
+    rule: UrlFilterRuleCreate,
+    db: AsyncSession = Depends(get_db)
+):
+    try:
+        rule.pattern = normalize_pattern(rule.rule_type, rule.pattern)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    created = await crud_url_filter_rule.create_url_filter_rule(db, rule)
+    UrlFilterRegistry.invalidate()
+    return created
+
+
+@router.put("/{rule_id}", response_model=UrlFilterRuleResponse)
+async def update_url_filter_rule(
+    rule_id: int,
+    rule: UrlFilterRuleUpdate,
+    db: AsyncSession = Depends(get_db)
+):
+    existing = await crud_url_filter_rule.get_url_filter_rule(db, rule_id)
+    if not existing:
+        raise HTTPException(status_code=404, detail="URL filter rule not found")
+    if rule.pattern is not None or rule.rule_type is not None:
+        try:
+            rule.pattern = normalize_pattern(
+                rule.rule_type or existing.rule_type,
+                rule.pattern if rule.pattern is not None else existing.pattern,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    updated = await crud_url_filter_rule.update_url_filter_rule(db, rule_id, rule)
+    UrlFilterRegistry.invalidate()
+    return updated
+
+
+@router.delete("/{rule_id}")
+async def delete_url_filter_rule(rule_id: int, db: AsyncSession = Depends(get_db)):
+    success = await crud_url_filter_rule.delete_url_filter_rule(db, rule_id)
+    if not success:
+        raise HTTPException(status_code=404, detail="URL filter rule not found")
+    UrlFilterRegistry.invalidate()
+    return {"message": "URL filter rule deleted successfully"}
@@ -20,6 +20,61 @@ class Settings(BaseSettings):
     # CORS
     cors_origins: str = "http://localhost:3000"
 
+    # CPU処理用プロセスプール（HTML解析・PDF抽出）
+    cpu_executor_workers: int = 0  # 0 = CPUコア数
+    cpu_executor_max_tasks_per_child: int = 200
+    cpu_task_timeout: float = 60.0
+    cpu_task_memory_mb: int = 1024
+
+    # 記事取得時のダウンロード上限（バイト）
+    fetch_max_html_bytes: int = 2 * 1024 * 1024
+    fetch_max_pdf_bytes: int = 30 * 1024 * 1024
+
+    # 調査ジョブの時間予算（秒、0 = 無制限）
+    # 子の処理は自身の予算と親（ジョブ → 企業 → 記事）の残り時間の小さい方で打ち切る
+    job_time_budget: float = 6 * 60 * 60
+    company_time_budget: float = 30 * 60
+    item_time_budget: float = 10 * 60
+    fetch_time_budget: float = 300
+    llm_time_budget: float = 300
+
+    # ホスト単位のサーキットブレーカー（連続失敗回数・遮断後に再試行するまでの秒数）
+    circuit_failure_threshold: int = 5
+    circuit_recovery_timeout: float = 120.0
+
+    # DuckDuckGo検索（DDGSセッション数・全体のレート制限）
+    search_pool_size: int = 3
+    search_rate_per_second: float = 1.0
+    search_rate_burst: int = 3
+    search_session_max_queries: int = 100
+
+    # DuckDuckGo検索結果のローカルキャッシュ（秒）
+    search_cache_enabled: bool = True
+    search_cache_path: str = "cache/search_cache.sqlite3"
+    search_cache_ttl: float = 12 * 60 * 60
+    search_cache_stale_ttl: float = 7 * 24 * 60 * 60
+
+    # 記事ページのHTTPディスクキャッシュ（Cache-Control/ETag/Last-Modifiedに従う）
+    http_cache_enabled: bool = True
+    http_cache_dir: str = "cache/http"
+    http_cache_max_bytes: int = 512 * 1024 * 1024
+    http_cache_heuristic_max_age: float = 24 * 60 * 60  # Last-Modifiedからの推定鮮度の上限（秒）
+
+    # ジョブ内で共有する記事取得キャッシュの最大件数
+    job_fetch_cache_max_entries: int = 1000
+
+    # 記事一覧の総件数キャッシュの保持秒数（記事の書き込みでも破棄される）
+    article_count_cache_ttl: float = 60.0
+
+    # URLフィルタルールの変更確認間隔（秒）
+    url_filter_reload_interval: float = 30.0
+
+    # リダイレクト・canonical URLの解決結果の保持日数
+    url_alias_ttl_days: int = 30
+
+    # この大きさ（バイト）以上のレスポンスを圧縮（brotli_asgi があれば brotli、なければ gzip）
+    response_compression_minimum_size: int = 1024
+
     # Basic Auth
     basic_auth_username: str = "admin"
     basic_auth_password: str = "admin123"
@@ -3,6 +3,8 @@ from app.crud import source_url
 from app.crud import article
 from app.crud import job
 from app.crud import schedule_setting
+from app.crud import url_filter_rule
+from app.crud import url_alias
 
 __all__ = [
     "company",
@@ -10,4 +12,6 @@ __all__ = [
     "article",
     "job",
     "schedule_setting",
+    "url_filter_rule",
+    "url_alias",
 ]
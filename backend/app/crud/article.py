@@ -1,48 +1,184 @@
-from sqlalchemy import select, func, and_, case, or_
+import base64
+import binascii
+import json
+import re
+import time
+from sqlalchemy import Text, select, func, and_, or_, case, tuple_, literal, literal_column, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import load_only
+from sqlalchemy.engine import Row
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.expression import ClauseElement, Executable
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional, List
+from typing import AsyncIterator, Dict, NamedTuple, Optional, List, Tuple, Union
 from datetime import date
 
-from app.models import Article, Company
+from app.config import get_settings
+from app.models import Article, ArticleRollup, Company
 from app.schemas import ArticleCreate, ArticleUpdate
+from app.utils.tags import parse_tags
 
 
-async def get_articles(
-    db: AsyncSession,
-    skip: int = 0,
-    limit: int = 100,
+# 記事一覧の並び順: 日付降順、ただしNULL（日付なし）は最後。同じ日付の場合はID降順（追加順）
+# migrations/004 の部分インデックス（published_date DESC NULLS LAST, id DESC）と同じ順序
+ARTICLE_LIST_ORDER = (Article.published_date.desc().nulls_last(), Article.id.desc())
+
+# 一覧の compact 表示で読み込む列（本文・要約等の長いテキストは記事詳細で取得する）
+ARTICLE_COMPACT_COLUMNS = (
+    Article.id,
+    Article.company_id,
+    Article.title,
+    Article.url,
+    Article.published_date,
+    Article.category,
+    Article.business_area,
+    Article.tags,
+    Article.is_inappropriate,
+    Article.is_reviewed,
+    Article.created_at,
+)
+
+
+def _select_articles(view: str = "full", *columns) -> Select:
+    """記事の SELECT（compact の場合は一覧に必要な列だけを読み込む）"""
+    query = select(Article, *columns)
+    if view == "compact":
+        query = query.options(load_only(*ARTICLE_COMPACT_COLUMNS, raiseload=True))
+    return query
+
+
+class ArticleCursor(NamedTuple):
+    """キーセットページネーションの位置（直前のページの最後の記事）"""
+
+    is_null_date: bool
+    published_date: Optional[date]
+    id: int
+
+
+def encode_article_cursor(article: Article) -> str:
+    """記事の位置を不透明なカーソル文字列に変換"""
+    payload = [
+        1 if article.published_date is None else 0,
+        article.published_date.isoformat() if article.published_date else None,
+        article.id,
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_article_cursor(cursor: str) -> ArticleCursor:
+    """
+    カーソル文字列を位置に変換
+
+    Raises:
+        ValueError: 不正なカーソル
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        null_flag, date_value, article_id = json.loads(raw)
+        is_null_date = bool(null_flag)
+        published_date = None if is_null_date else date.fromisoformat(date_value)
+        return ArticleCursor(is_null_date, published_date, int(article_id))
+    except (ValueError, TypeError, binascii.Error) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+class ArticlePage(NamedTuple):
+    """記事一覧の1ページ"""
+
+    items: List[Article]
+    total: int
+    next_cursor: Optional[str]
+    total_is_exact: bool
+
+
+# 絞り込み条件ごとの総件数キャッシュ {条件: (件数, 保存時刻)}
+# 記事の書き込みで無効化する。別プロセスでの書き込みは article_count_cache_ttl 秒以内に反映される
+_total_cache: Dict[Tuple, Tuple[int, float]] = {}
+
+
+def invalidate_article_counts() -> None:
+    """記事の追加・更新・削除時に総件数キャッシュを破棄"""
+    _total_cache.clear()
+
+
+def _get_cached_total(key: Tuple) -> Optional[int]:
+    cached = _total_cache.get(key)
+    if cached is None:
+        return None
+    total, stored_at = cached
+    if time.monotonic() - stored_at > get_settings().article_count_cache_ttl:
+        _total_cache.pop(key, None)
+        return None
+    return total
+
+
+def _set_cached_total(key: Tuple, total: int) -> None:
+    _total_cache[key] = (total, time.monotonic())
+
+
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) でクエリの推定行数を取得するための構文"""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def _count_articles(db: AsyncSession, filters: dict) -> int:
+    count_query = _apply_article_filters(select(func.count(Article.id)), **filters)
+    count_result = await db.execute(count_query)
+    return count_result.scalar() or 0
+
+
+async def _estimate_articles(db: AsyncSession, filters: dict) -> int:
+    """プランナーの推定行数（統計情報ベース、テーブルを走査しない）"""
+    result = await db.execute(_Explain(_apply_article_filters(select(Article.id), **filters)))
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _apply_article_filters(
+    query: Select,
     company_id: Optional[int] = None,
     category: Optional[str] = None,
     business_area: Optional[str] = None,
     tags: Optional[str] = None,
+    tags_match: str = "any",
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     include_unknown_dates: Optional[bool] = None,
     is_reviewed: Optional[bool] = None,
-) -> tuple[List[Article], int]:
-    query = select(Article)
-    count_query = select(func.count(Article.id))
-
+) -> Select:
+    """記事一覧の絞り込み条件をクエリに追加（一覧・件数で共通）"""
     # 不適切フラグがついた記事を除外
     query = query.where(Article.is_inappropriate == False)
-    count_query = count_query.where(Article.is_inappropriate == False)
 
     if company_id:
         query = query.where(Article.company_id == company_id)
-        count_query = count_query.where(Article.company_id == company_id)
 
     if category:
         query = query.where(Article.category == category)
-        count_query = count_query.where(Article.category == category)
 
     if business_area:
         query = query.where(Article.business_area == business_area)
-        count_query = count_query.where(Article.business_area == business_area)
 
-    if tags:
-        # タグは部分一致で検索（カンマ区切りのリストに含まれるか）
-        query = query.where(Article.tags.contains(tags))
-        count_query = count_query.where(Article.tags.contains(tags))
+    tag_list = parse_tags(tags)
+    if tag_list:
+        # タグは完全一致（GINインデックスで検索）。any: いずれかを含む（&&）、all: すべてを含む（@>）
+        if tags_match == "all":
+            query = query.where(Article.tags.contains(tag_list))
+        else:
+            query = query.where(Article.tags.overlap(tag_list))
 
     # 日付フィルタリング
     if start_date or end_date:
@@ -62,39 +198,376 @@ async def get_articles(
             # NULLまたは日付範囲内の条件
             date_conditions.append(Article.published_date.is_(None))
             query = query.where(or_(*date_conditions))
-            count_query = count_query.where(or_(*date_conditions))
         else:
             # 日付不明を含まない場合は、範囲内のもののみ
             if start_date:
                 query = query.where(Article.published_date >= start_date)
-                count_query = count_query.where(Article.published_date >= start_date)
             if end_date:
                 query = query.where(Article.published_date <= end_date)
-                count_query = count_query.where(Article.published_date <= end_date)
     elif include_unknown_dates:
         # 日付範囲の指定なしで、日付不明のみを取得
         query = query.where(Article.published_date.is_(None))
-        count_query = count_query.where(Article.published_date.is_(None))
 
     if is_reviewed is not None:
         query = query.where(Article.is_reviewed == is_reviewed)
-        count_query = count_query.where(Article.is_reviewed == is_reviewed)
 
-    # 日付降順、ただしNULL（日付なし）は最後
-    # 同じ日付の場合はID降順（追加順）でソート
-    query = query.order_by(
-        case((Article.published_date.is_(None), 1), else_=0),
-        Article.published_date.desc(),
-        Article.id.desc()
-    ).offset(skip).limit(limit)
+    return query
 
-    result = await db.execute(query)
-    articles = result.scalars().all()
 
-    count_result = await db.execute(count_query)
-    total = count_result.scalar()
+async def _get_articles_after_cursor(
+    db: AsyncSession,
+    filters: dict,
+    position: Optional[ArticleCursor],
+    limit: int,
+    view: str = "full",
+) -> List[Article]:
+    """
+    カーソル位置の次から limit 件を取得（キーセットページネーション）
+
+    日付ありの区間と日付なし（NULL）の区間を別々のクエリで読むことで、
+    どちらもインデックスの範囲走査で済ませる（ページの深さによらずコストが一定）。
+    """
+    articles: List[Article] = []
+
+    if position is None or not position.is_null_date:
+        query = _apply_article_filters(_select_articles(view), **filters).where(Article.published_date.isnot(None))
+        if position is not None:
+            query = query.where(
+                tuple_(Article.published_date, Article.id) < tuple_(literal(position.published_date), literal(position.id))
+            )
+        result = await db.execute(query.order_by(*ARTICLE_LIST_ORDER).limit(limit))
+        articles.extend(result.scalars().all())
+
+    remaining = limit - len(articles)
+    if remaining > 0:
+        query = _apply_article_filters(_select_articles(view), **filters).where(Article.published_date.is_(None))
+        if position is not None and position.is_null_date:
+            query = query.where(Article.id < position.id)
+        result = await db.execute(query.order_by(Article.id.desc()).limit(remaining))
+        articles.extend(result.scalars().all())
+
+    return articles
+
+
+async def get_articles(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    company_id: Optional[int] = None,
+    category: Optional[str] = None,
+    business_area: Optional[str] = None,
+    tags: Optional[str] = None,
+    tags_match: str = "any",
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    include_unknown_dates: Optional[bool] = None,
+    is_reviewed: Optional[bool] = None,
+    cursor: Optional[str] = None,
+    total_mode: str = "exact",
+    view: str = "full",
+) -> ArticlePage:
+    """
+    記事一覧を取得
+
+    Args:
+        tags: カンマ区切りのタグ（完全一致）
+        tags_match: "any"（いずれかのタグを含む）/ "all"（すべてのタグを含む）
+        cursor: 指定時はキーセットページネーション（skip は無視）。空文字は先頭ページ
+        total_mode: 総件数の求め方
+            - "exact": 正確な件数（オフセット指定時はウィンドウ関数で一覧と同じクエリで取得）
+            - "estimate": キャッシュ済みの件数、なければプランナーの推定値（件数クエリを実行しない）
+        view: "full"（全列）/ "compact"（ARTICLE_COMPACT_COLUMNS のみ。他の列にアクセスすると例外）
+
+    Returns:
+        ArticlePage。次ページがない場合の next_cursor はNone
+
+    Raises:
+        ValueError: 不正なカーソル
+    """
+    filters = dict(
+        company_id=company_id,
+        category=category,
+        business_area=business_area,
+        tags=",".join(parse_tags(tags)) or None,
+        tags_match=tags_match,
+        start_date=start_date,
+        end_date=end_date,
+        include_unknown_dates=include_unknown_dates,
+        is_reviewed=is_reviewed,
+    )
+    cache_key = tuple(filters.items())
+    total = _get_cached_total(cache_key)
+    total_is_exact = True
+
+    if cursor is None and total is None and total_mode == "exact":
+        # 1回のクエリで一覧と総件数を取得（count(*) OVER () は LIMIT/OFFSET の前に数えられる）
+        query = _apply_article_filters(
+            _select_articles(view, func.count().over().label("total_count")), **filters
+        )
+        query = query.order_by(*ARTICLE_LIST_ORDER).offset(skip).limit(limit)
+        result = await db.execute(query)
+        rows = result.all()
+        articles = [row[0] for row in rows]
+        if rows:
+            total = rows[0].total_count
+        elif skip == 0:
+            total = 0
+        else:
+            # 範囲外のページでは件数が取れないため個別に数える
+            total = await _count_articles(db, filters)
+        _set_cached_total(cache_key, total)
+    else:
+        if cursor is None:
+            query = _apply_article_filters(_select_articles(view), **filters)
+            query = query.order_by(*ARTICLE_LIST_ORDER).offset(skip).limit(limit)
+            result = await db.execute(query)
+            articles = list(result.scalars().all())
+        else:
+            position = decode_article_cursor(cursor) if cursor else None
+            articles = await _get_articles_after_cursor(db, filters, position, limit, view)
+
+        if total is None:
+            if total_mode == "estimate":
+                total = await _estimate_articles(db, filters)
+                total_is_exact = False
+            else:
+                total = await _count_articles(db, filters)
+                _set_cached_total(cache_key, total)
+
+    # 1ページ分取得できた場合のみ次ページがありうる（オフセット指定でも続きをカーソルで読める）
+    next_cursor = encode_article_cursor(articles[-1]) if articles and len(articles) == limit else None
 
-    return articles, total
+    return ArticlePage(articles, total, next_cursor, total_is_exact)
+
+
+# 全文検索の設定（migrations/007 の search_vector と同じ設定にすること）
+SEARCH_TS_CONFIG = "english"
+_TS_CONFIG = literal_column(f"'{SEARCH_TS_CONFIG}'::regconfig")
+_HEADLINE_OPTIONS = 'StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2, FragmentDelimiter=" ... "'
+# 日本語・中国語・韓国語を含むクエリは単語に分割できないため、部分一致で検索する
+# （文字の範囲は migrations/009 の cjk_bigrams と同じにすること）
+_CJK_PATTERN = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uac00-\ud7af\uff66-\uff9f]")
+_MAX_SEARCH_TERMS = 5
+_SNIPPET_CONTEXT = 60
+
+
+class ArticleSearchHit(NamedTuple):
+    """検索結果の1件"""
+
+    article: Article
+    rank: float
+    headline: Optional[str]
+
+
+class ArticleSearchPage(NamedTuple):
+    """検索結果の1ページ"""
+
+    items: List[ArticleSearchHit]
+    total: int
+    # fulltext: 英語の全文検索 / bigram: CJKの部分一致
+    mode: str
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _cjk_bigrams(term: str) -> List[str]:
+    """語に含まれる CJK 文字2文字の組（migrations/009 の cjk_bigrams と同じ規則）"""
+    return sorted({
+        term[i:i + 2]
+        for i in range(len(term) - 1)
+        if _CJK_PATTERN.match(term[i]) and _CJK_PATTERN.match(term[i + 1])
+    })
+
+
+def _bigram_search_clause(terms: List[str]):
+    """
+    すべての語がタイトル・要約・本文のいずれかに含まれる条件と、含まれる列に応じたスコア
+
+    語のバイグラムをすべて含む記事をインデックス（idx_articles_search_bigrams）で絞り込んでから部分一致を確認する。
+
+    Raises:
+        ValueError: どの語からもバイグラムが取れず、インデックスで絞り込めない場合
+    """
+    bigrams = sorted({gram for term in terms for gram in _cjk_bigrams(term)})
+    if not bigrams:
+        raise ValueError("Japanese / CJK search terms must contain at least 2 consecutive CJK characters")
+    # インデックスの式と同じ式で比較すること
+    article_bigrams = func.article_search_bigrams(
+        Article.title, Article.summary, Article.content, type_=ARRAY(Text)
+    )
+    conditions = [article_bigrams.contains(bigrams)]
+    rank = None
+    for term in terms:
+        pattern = f"%{_escape_like(term)}%"
+        in_title = Article.title.ilike(pattern, escape="\\")
+        in_summary = Article.summary.ilike(pattern, escape="\\")
+        in_content = Article.content.ilike(pattern, escape="\\")
+        conditions.append(or_(in_title, in_summary, in_content))
+        term_rank = (
+            case((in_title, literal_column("1.0")), else_=literal_column("0.0"))
+            + case((in_summary, literal_column("0.4")), else_=literal_column("0.0"))
+            + case((in_content, literal_column("0.1")), else_=literal_column("0.0"))
+        )
+        rank = term_rank if rank is None else rank + term_rank
+    return and_(*conditions), rank
+
+
+def _make_snippet(article: Article, terms: List[str]) -> Optional[str]:
+    """最初に見つかった語の前後を切り出し、語を <mark> で囲む（ts_headline と同じ形式）"""
+    lowered_terms = [term.lower() for term in terms]
+    for text_value in (article.summary, article.content, article.title):
+        if not text_value:
+            continue
+        lowered = text_value.lower()
+        positions = [lowered.find(term) for term in lowered_terms]
+        positions = [pos for pos in positions if pos >= 0]
+        if not positions:
+            continue
+        first = min(positions)
+        start = max(first - _SNIPPET_CONTEXT, 0)
+        end = min(first + _SNIPPET_CONTEXT * 2, len(text_value))
+        snippet = text_value[start:end]
+        highlight = re.compile("|".join(re.escape(term) for term in terms), re.IGNORECASE)
+        snippet = highlight.sub(lambda m: f"<mark>{m.group(0)}</mark>", snippet)
+        return ("... " if start > 0 else "") + snippet + (" ..." if end < len(text_value) else "")
+    return None
+
+
+async def search_articles(
+    db: AsyncSession,
+    query: str,
+    skip: int = 0,
+    limit: int = 20,
+    **filters,
+) -> ArticleSearchPage:
+    """
+    記事をタイトル・要約・本文から検索（関連度順）
+
+    英語等は search_vector（GINインデックス）の全文検索で、語幹の一致・"フレーズ"・OR・-除外に対応。
+    日本語等のCJKを含むクエリは、空白区切りの各語をタイトル・要約・本文の部分一致（バイグラムインデックス）で検索する。
+
+    Args:
+        query: 検索語
+        filters: 記事一覧と同じ絞り込み条件（company_id, category, start_date 等）
+
+    Raises:
+        ValueError: 検索語が空の場合、CJKのクエリに2文字以上続くCJK文字の語がない場合
+    """
+    query = " ".join((query or "").split())
+    if not query:
+        raise ValueError("Search query must not be empty")
+
+    headline = None
+    terms: List[str] = []
+    if _CJK_PATTERN.search(query):
+        mode = "bigram"
+        terms = query.split()[:_MAX_SEARCH_TERMS]
+        condition, rank = _bigram_search_clause(terms)
+    else:
+        mode = "fulltext"
+        ts_query = func.websearch_to_tsquery(_TS_CONFIG, query)
+        condition = Article.search_vector.op("@@")(ts_query)
+        rank = func.ts_rank(Article.search_vector, ts_query)
+        headline = func.ts_headline(
+            _TS_CONFIG,
+            func.concat_ws(" ", Article.summary, Article.content),
+            ts_query,
+            _HEADLINE_OPTIONS,
+        )
+
+    # 一致した記事のIDとスコアを先に1ページ分に絞り、ハイライト（ts_headline）はそのページの記事だけで計算する
+    rank = rank.label("rank")
+    matched = (
+        _apply_article_filters(
+            select(Article.id, rank, func.count().over().label("total_count")),
+            **filters,
+        )
+        .where(condition)
+        .order_by(rank.desc(), *ARTICLE_LIST_ORDER)
+        .offset(skip)
+        .limit(limit)
+        .subquery()
+    )
+    columns = [Article, matched.c.rank, matched.c.total_count]
+    if headline is not None:
+        columns.append(headline.label("headline"))
+    result = await db.execute(
+        select(*columns)
+        .join(matched, Article.id == matched.c.id)
+        .order_by(matched.c.rank.desc(), *ARTICLE_LIST_ORDER)
+    )
+    rows = result.all()
+
+    hits = [
+        ArticleSearchHit(
+            article=row.Article,
+            rank=float(row.rank),
+            headline=row.headline if headline is not None else _make_snippet(row.Article, terms),
+        )
+        for row in rows
+    ]
+
+    if rows:
+        total = rows[0].total_count
+    elif skip == 0:
+        total = 0
+    else:
+        # 範囲外のページでは件数が取れないため個別に数える
+        count_query = _apply_article_filters(select(func.count(Article.id)), **filters).where(condition)
+        total = (await db.execute(count_query)).scalar() or 0
+
+    return ArticleSearchPage(hits, total, mode)
+
+
+async def iter_articles_for_export(
+    db: AsyncSession,
+    include_content: bool = False,
+    batch_size: int = 500,
+    **filters,
+) -> AsyncIterator[Row]:
+    """
+    エクスポート用に記事を一覧と同じ条件・順序で1行ずつ返す
+
+    サーバー側カーソルから batch_size 行ずつ読むため、件数によらずメモリ使用量は一定。
+    ORMオブジェクトにせず列の値だけを返す（セッションに記事を保持しない）。
+
+    Args:
+        include_content: 本文も読み込むか
+        filters: 記事一覧と同じ絞り込み条件（company_id, category, tags, start_date 等）
+    """
+    columns = [
+        Article.id,
+        Article.company_id,
+        Company.name.label("company_name"),
+        Company.country,
+        Article.title,
+        Article.url,
+        Article.published_date,
+        Article.category,
+        Article.business_area,
+        Article.tags,
+        Article.summary,
+        Article.is_reviewed,
+        Article.created_at,
+    ]
+    if include_content:
+        columns.append(Article.content)
+    query = (
+        _apply_article_filters(select(*columns).join(Company, Article.company_id == Company.id), **filters)
+        .order_by(*ARTICLE_LIST_ORDER)
+        .execution_options(yield_per=batch_size)
+    )
+    result = await db.stream(query)
+    async for row in result:
+        yield row
+
+
+async def get_article(db: AsyncSession, article_id: int) -> Optional[Article]:
+    query = select(Article).where(Article.id == article_id)
+    result = await db.execute(query)
+    return result.scalar_one_or_none()
 
 
 async def get_article_by_url(db: AsyncSession, url: str) -> Optional[Article]:
@@ -104,9 +577,12 @@ async def get_article_by_url(db: AsyncSession, url: str) -> Optional[Article]:
 
 
 async def create_article(db: AsyncSession, article: ArticleCreate) -> Article:
-    db_article = Article(**article.model_dump())
+    data = article.model_dump()
+    data["tags"] = parse_tags(data.get("tags")) or None
+    db_article = Article(**data)
     db.add(db_article)
     await db.commit()
+    invalidate_article_counts()
     await db.refresh(db_article)
     return db_article
 
@@ -124,10 +600,13 @@ async def update_article(
         return None
 
     update_data = article_update.model_dump(exclude_unset=True)
+    if "tags" in update_data:
+        update_data["tags"] = parse_tags(update_data["tags"]) or None
     for field, value in update_data.items():
         setattr(db_article, field, value)
 
     await db.commit()
+    invalidate_article_counts()
     await db.refresh(db_article)
     return db_article
 
@@ -136,73 +615,76 @@ async def get_analysis_stats(
     db: AsyncSession,
     company_id: Optional[int] = None,
 ) -> tuple[int, int]:
-    filters = [Article.is_inappropriate == False]
-    if company_id:
-        filters.append(Article.company_id == company_id)
-
-    total_query = select(func.count(Article.id))
-    analyzed_query = select(func.count(Article.id)).where(
-        and_(
-            Article.summary.isnot(None),
-            Article.summary != "",
-            Article.category.isnot(None),
-            Article.category != "",
-            Article.business_area.isnot(None),
-            Article.business_area != "",
-            Article.tags.isnot(None),
-            Article.tags != "",
-        )
+    # 集計テーブル（トリガーで維持）から読むため記事数に関係なく一定の行数で済む
+    query = select(
+        func.coalesce(func.sum(ArticleRollup.article_count), 0),
+        func.coalesce(
+            func.sum(ArticleRollup.article_count).filter(ArticleRollup.is_analyzed == True), 0
+        ),
     )
+    if company_id:
+        query = query.where(ArticleRollup.company_id == company_id)
 
-    if filters:
-        total_query = total_query.where(*filters)
-        analyzed_query = analyzed_query.where(*filters)
-
-    total_result = await db.execute(total_query)
-    analyzed_result = await db.execute(analyzed_query)
-
-    total = total_result.scalar() or 0
-    analyzed = analyzed_result.scalar() or 0
-
-    return total, analyzed
+    result = await db.execute(query)
+    total, analyzed = result.one()
+    return int(total), int(analyzed)
 
 
 async def get_analysis_coefficients(
     db: AsyncSession,
     company_id: Optional[int] = None,
 ) -> dict:
+    # 集計テーブルの行を4種類の内訳ごとにGROUPING SETSで合算し、結果（数十行）だけを受け取る
+    count = func.sum(ArticleRollup.article_count)
     query = select(
-        Article.category,
-        Article.business_area,
-        Article.published_date,
-        Company.country,
-    ).join(Company, Article.company_id == Company.id).where(Article.is_inappropriate == False)
+        func.grouping(ArticleRollup.category).label("by_category"),
+        func.grouping(ArticleRollup.business_area).label("by_business_area"),
+        func.grouping(ArticleRollup.country).label("by_region"),
+        ArticleRollup.category,
+        ArticleRollup.business_area,
+        ArticleRollup.country,
+        ArticleRollup.month,
+        count.label("count"),
+    )
 
     if company_id:
-        query = query.where(Article.company_id == company_id)
+        query = query.where(ArticleRollup.company_id == company_id)
+
+    query = query.group_by(
+        func.grouping_sets(
+            ArticleRollup.category,
+            ArticleRollup.business_area,
+            ArticleRollup.country,
+            ArticleRollup.month,
+        )
+    )
 
     result = await db.execute(query)
     rows = result.all()
 
-    total = len(rows)
+    total = 0
     category_counts: dict[str, int] = {}
     business_area_counts: dict[str, int] = {}
     region_counts: dict[str, int] = {}
     month_counts: dict[str, int] = {}
 
-    for category, business_area, published_date, country in rows:
-        category_label = category or "未分類"
-        business_area_label = business_area or "未分類"
-        region_label = country or "不明"
-        if published_date:
-            month_label = published_date.strftime("%Y-%m")
+    # GROUPING() が 0 の列がその行の集計キー。NULLと空文字は同じラベルにまとめる
+    for row in rows:
+        # bigint の SUM は numeric で返るため int にそろえる
+        count = int(row.count)
+        if row.by_category == 0:
+            label = row.category or "未分類"
+            category_counts[label] = category_counts.get(label, 0) + count
+            total += count
+        elif row.by_business_area == 0:
+            label = row.business_area or "未分類"
+            business_area_counts[label] = business_area_counts.get(label, 0) + count
+        elif row.by_region == 0:
+            label = row.country or "不明"
+            region_counts[label] = region_counts.get(label, 0) + count
         else:
-            month_label = "不明"
-
-        category_counts[category_label] = category_counts.get(category_label, 0) + 1
-        business_area_counts[business_area_label] = business_area_counts.get(business_area_label, 0) + 1
-        region_counts[region_label] = region_counts.get(region_label, 0) + 1
-        month_counts[month_label] = month_counts.get(month_label, 0) + 1
+            label = row.month.strftime("%Y-%m") if row.month else "不明"
+            month_counts[label] = month_counts.get(label, 0) + count
 
     def to_sorted_list(items: dict[str, int]) -> list[dict]:
         return [
@@ -226,13 +708,28 @@ async def get_analysis_coefficients(
     }
 
 
+async def rebuild_article_rollups(db: AsyncSession) -> int:
+    """
+    集計テーブル（article_rollups）を articles から作り直す
+
+    通常はトリガーで増減が反映されるため、初回投入・不整合の修復時のみ使う。
+
+    Returns:
+        作成した集計行の数
+    """
+    result = await db.execute(text("SELECT rebuild_article_rollups()"))
+    rows = result.scalar() or 0
+    await db.commit()
+    return int(rows)
+
+
 async def update_article_summary(
     db: AsyncSession,
     article_id: int,
     summary: str,
     category: str,
     business_area: str,
-    tags: str
+    tags: Union[str, List[str], None]
 ) -> Optional[Article]:
     query = select(Article).where(Article.id == article_id)
     result = await db.execute(query)
@@ -244,8 +741,9 @@ async def update_article_summary(
     db_article.summary = summary
     db_article.category = category
     db_article.business_area = business_area
-    db_article.tags = tags
+    db_article.tags = parse_tags(tags) or None
     
     await db.commit()
+    invalidate_article_counts()
     await db.refresh(db_article)
     return db_article
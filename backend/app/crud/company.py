@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from typing import Optional, List
 
+from app.crud import article as crud_article
 from app.models import Company, SourceUrl
 from app.schemas import CompanyCreate, CompanyUpdate
 
@@ -99,4 +100,6 @@ async def delete_company(db: AsyncSession, company_id: int) -> bool:
     
     await db.delete(db_company)
     await db.commit()
+    # 企業の記事も削除されるため記事の総件数キャッシュを破棄
+    crud_article.invalidate_article_counts()
     return True
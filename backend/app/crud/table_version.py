@@ -0,0 +1,16 @@
+"""CRUD operations for table version stamps."""
+from typing import Dict, Iterable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import TableVersion
+
+
+async def get_table_versions(db: AsyncSession, table_names: Iterable[str]) -> Dict[str, int]:
+    """テーブル名 → 変更カウンタ（未登録のテーブルは含まない）"""
+    query = select(TableVersion.table_name, TableVersion.version).where(
+        TableVersion.table_name.in_(list(table_names))
+    )
+    result = await db.execute(query)
+    return {name: version for name, version in result.all()}
@@ -0,0 +1,63 @@
+"""CRUD operations for URL aliases (redirect / canonical resolution cache)."""
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+from sqlalchemy import select, delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import UrlAlias
+
+
+async def get_canonical_url(db: AsyncSession, alias_url: str) -> Optional[str]:
+    """有効期限内の対応があれば正規URLを返す"""
+    query = select(UrlAlias.canonical_url).where(
+        UrlAlias.alias_url == alias_url,
+        UrlAlias.expires_at > datetime.utcnow(),
+    )
+    result = await db.execute(query)
+    return result.scalar_one_or_none()
+
+
+async def save_url_aliases(
+    db: AsyncSession,
+    alias_urls: Iterable[str],
+    canonical_url: str,
+    source: str,
+    ttl_days: int,
+) -> None:
+    """別名URL → 正規URLの対応を登録（既存の対応は上書きして有効期限を延長）"""
+    now = datetime.utcnow()
+    rows = [
+        {
+            "alias_url": alias_url,
+            "canonical_url": canonical_url,
+            "source": source,
+            "resolved_at": now,
+            "expires_at": now + timedelta(days=ttl_days),
+        }
+        for alias_url in sorted(set(alias_urls))
+        if alias_url and alias_url != canonical_url
+    ]
+    if not rows:
+        return
+
+    stmt = insert(UrlAlias).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[UrlAlias.alias_url],
+        set_={
+            "canonical_url": stmt.excluded.canonical_url,
+            "source": stmt.excluded.source,
+            "resolved_at": stmt.excluded.resolved_at,
+            "expires_at": stmt.excluded.expires_at,
+        },
+    )
+    await db.execute(stmt)
+    await db.commit()
+
+
+async def delete_expired_url_aliases(db: AsyncSession) -> int:
+    """有効期限切れの対応を削除"""
+    result = await db.execute(delete(UrlAlias).where(UrlAlias.expires_at <= datetime.utcnow()))
+    await db.commit()
+    return result.rowcount or 0
@@ -0,0 +1,99 @@
+"""CRUD operations for URL filter rules."""
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, List, Tuple
+
+from app.models import UrlFilterRule
+from app.schemas import UrlFilterRuleCreate, UrlFilterRuleUpdate
+
+
+async def get_url_filter_rules(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    company_id: Optional[int] = None,
+    rule_type: Optional[str] = None,
+    is_active: Optional[bool] = None,
+) -> Tuple[List[UrlFilterRule], int]:
+    query = select(UrlFilterRule)
+    count_query = select(func.count(UrlFilterRule.id))
+
+    filters = []
+    if company_id is not None:
+        filters.append(UrlFilterRule.company_id == company_id)
+    if rule_type:
+        filters.append(UrlFilterRule.rule_type == rule_type)
+    if is_active is not None:
+        filters.append(UrlFilterRule.is_active == is_active)
+    if filters:
+        query = query.where(*filters)
+        count_query = count_query.where(*filters)
+
+    query = query.order_by(UrlFilterRule.id).offset(skip).limit(limit)
+    result = await db.execute(query)
+    rules = result.scalars().all()
+
+    count_result = await db.execute(count_query)
+    total = count_result.scalar()
+
+    return rules, total
+
+
+async def get_active_url_filter_rules(db: AsyncSession) -> List[UrlFilterRule]:
+    """有効なルールをすべて取得（フィルタのコンパイル用）"""
+    query = select(UrlFilterRule).where(UrlFilterRule.is_active.is_(True)).order_by(UrlFilterRule.id)
+    result = await db.execute(query)
+    return result.scalars().all()
+
+
+async def get_url_filter_rules_version(db: AsyncSession) -> Tuple[int, Optional[str]]:
+    """ルールの変更検知用のバージョン（件数と最終更新日時）"""
+    query = select(func.count(UrlFilterRule.id), func.max(UrlFilterRule.updated_at))
+    result = await db.execute(query)
+    count, last_updated = result.one()
+    return count, last_updated.isoformat() if last_updated else None
+
+
+async def get_url_filter_rule(db: AsyncSession, rule_id: int) -> Optional[UrlFilterRule]:
+    query = select(UrlFilterRule).where(UrlFilterRule.id == rule_id)
+    result = await db.execute(query)
+    return result.scalar_one_or_none()
+
+
+async def create_url_filter_rule(
+    db: AsyncSession,
+    rule: UrlFilterRuleCreate,
+) -> UrlFilterRule:
+    db_rule = UrlFilterRule(**rule.model_dump())
+    db.add(db_rule)
+    await db.commit()
+    await db.refresh(db_rule)
+    return db_rule
+
+
+async def update_url_filter_rule(
+    db: AsyncSession,
+    rule_id: int,
+    rule: UrlFilterRuleUpdate,
+) -> Optional[UrlFilterRule]:
+    db_rule = await get_url_filter_rule(db, rule_id)
+    if not db_rule:
+        return None
+
+    update_data = rule.model_dump(exclude_unset=True)
+    for field, value in update_data.items():
+        setattr(db_rule, field, value)
+
+    await db.commit()
+    await db.refresh(db_rule)
+    return db_rule
+
+
+async def delete_url_filter_rule(db: AsyncSession, rule_id: int) -> bool:
+    db_rule = await get_url_filter_rule(db, rule_id)
+    if not db_rule:
+        return False
+
+    await db.delete(db_rule)
+    await db.commit()
+    return True
@@ -1,5 +1,6 @@
 from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
 import logging
 
@@ -8,6 +9,14 @@ from app.api.v1.router import api_router
 from app.core.database import engine, Base
 from app.security.basic_auth import require_basic_auth
 from app.logging_config import setup_logging
+from app.utils.cpu_executor import CpuExecutor
+from app.services.crawler.search_service import SearchService
+
+try:
+    from brotli_asgi import BrotliMiddleware
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
 
 # ロギング設定を初期化
 setup_logging()
@@ -26,6 +35,8 @@ async def lifespan(app: FastAPI):
     #     await conn.run_sync(Base.metadata.create_all)
     yield
     # 終了時
+    CpuExecutor.shutdown()
+    SearchService.shutdown()
     await engine.dispose()
 
 
@@ -43,8 +54,20 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # 条件付きGET（If-None-Match / 304）のためフロントエンドからETagを参照できるようにする
+    expose_headers=["ETag"],
 )
 
+# レスポンス圧縮（brotli_asgi があれば brotli。brotli 非対応のクライアントには gzip）
+if BROTLI_AVAILABLE:
+    app.add_middleware(
+        BrotliMiddleware,
+        minimum_size=settings.response_compression_minimum_size,
+        gzip_fallback=True,
+    )
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=settings.response_compression_minimum_size)
+
 # APIルーター
 app.include_router(
     api_router,
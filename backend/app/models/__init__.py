@@ -1,16 +1,24 @@
 from app.models.company import Company
 from app.models.source_url import SourceUrl
 from app.models.article import Article
+from app.models.article_rollup import ArticleRollup
 from app.models.job_history import JobHistory
 from app.models.schedule_setting import ScheduleSetting
 from app.models.search_settings import SearchSettings, CompanySearchSettings
+from app.models.url_filter_rule import UrlFilterRule
+from app.models.url_alias import UrlAlias
+from app.models.table_version import TableVersion
 
 __all__ = [
     "Company",
     "SourceUrl",
     "Article",
+    "ArticleRollup",
     "JobHistory",
     "ScheduleSetting",
     "SearchSettings",
     "CompanySearchSettings",
+    "UrlFilterRule",
+    "UrlAlias",
+    "TableVersion",
 ]
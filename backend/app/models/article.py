@@ -1,5 +1,6 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Date, Boolean, func
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Computed, Integer, String, Text, DateTime, ForeignKey, Date, Boolean, func
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from app.core.database import Base
 
 
@@ -15,12 +16,24 @@ class Article(Base):
     published_date = Column(Date, nullable=True)
     category = Column(String(100), nullable=True)
     business_area = Column(String(100), nullable=True)
-    tags = Column(String(500), nullable=True)  # カンマ区切り
+    tags = Column(ARRAY(Text), nullable=True)  # 1要素1タグ（GINインデックスで完全一致検索）
     is_inappropriate = Column(Boolean, default=False, nullable=False)
     inappropriate_reason = Column(Text, nullable=True)  # 不適切な理由
     is_reviewed = Column(Boolean, default=False, nullable=False)  # 人間による確認済みフラグ
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    # 全文検索用（タイトル > 要約 > 本文の重み付き）。DB側で生成するため一覧の取得では読み込まない
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                "setweight(to_tsvector('english', coalesce(title, '')), 'A')"
+                " || setweight(to_tsvector('english', coalesce(summary, '')), 'B')"
+                " || setweight(to_tsvector('english', coalesce(content, '')), 'C')",
+                persisted=True,
+            ),
+        )
+    )
 
     # Relationships
     company = relationship("Company", back_populates="articles")
@@ -0,0 +1,28 @@
+from sqlalchemy import BigInteger, Boolean, Column, Date, ForeignKey, Integer, String, UniqueConstraint
+from app.core.database import Base
+
+
+class ArticleRollup(Base):
+    """記事数の集計（ダッシュボード用）
+
+    articles / companies のトリガーで増減を反映する（migrations/005_add_article_rollups.sql）。
+    不適切記事は含まない。カテゴリ・事業領域・国の空文字は NULL として保持する。
+    """
+
+    __tablename__ = "article_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "company_id", "category", "business_area", "country", "month", "is_analyzed",
+            name="uq_article_rollups_key",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+    id = Column(BigInteger, primary_key=True)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
+    category = Column(String(100), nullable=True)
+    business_area = Column(String(100), nullable=True)
+    country = Column(String(100), nullable=True)
+    month = Column(Date, nullable=True)  # 公開月の初日（公開日不明はNULL）
+    is_analyzed = Column(Boolean, nullable=False)  # 要約・カテゴリ・事業領域・タグがすべて入っている
+    article_count = Column(BigInteger, nullable=False)
@@ -0,0 +1,12 @@
+from sqlalchemy import BigInteger, Column, DateTime, String, func
+from app.core.database import Base
+
+
+class TableVersion(Base):
+    """テーブルごとの変更カウンタ（文単位のトリガーで加算。migrations/008_add_table_versions.sql）"""
+
+    __tablename__ = "table_versions"
+
+    table_name = Column(String(100), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime, server_default=func.now(), nullable=False)
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, String, Text, DateTime, func
+from app.core.database import Base
+
+
+class UrlAlias(Base):
+    """別名URL → 正規URLの対応（リダイレクト・canonicalの解決結果）"""
+
+    __tablename__ = "url_aliases"
+
+    alias_url = Column(Text, primary_key=True)
+    canonical_url = Column(Text, nullable=False, index=True)
+    # redirect / canonical
+    source = Column(String(20), nullable=False)
+    resolved_at = Column(DateTime, server_default=func.now(), nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
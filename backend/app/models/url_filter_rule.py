@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, func
+from app.core.database import Base
+
+
+class UrlFilterRule(Base):
+    """記事候補URLのフィルタルール（リスト記事・信頼性の低いソース等）"""
+
+    __tablename__ = "url_filter_rules"
+
+    id = Column(Integer, primary_key=True, index=True)
+    # domain / path_prefix / path_contains / path_regex
+    rule_type = Column(String(20), nullable=False)
+    pattern = Column(String(500), nullable=False)
+    # allow / deny（allowはdenyより優先）
+    action = Column(String(10), nullable=False, default="deny")
+    # 適用範囲（NULLは全企業・全リージョン）
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=True, index=True)
+    region = Column(String(10), nullable=True)
+    reason = Column(String(255), nullable=True)
+    is_active = Column(Boolean, nullable=False, default=True)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -15,6 +15,10 @@ from app.schemas.article import (
     ArticleUpdate,
     ArticleResponse,
     ArticleListResponse,
+    ArticleCompactResponse,
+    ArticleCompactListResponse,
+    ArticleSearchHit,
+    ArticleSearchResponse,
     ArticleAnalysisStats,
     ArticleAnalysisGroup,
     ArticleAnalysisTimeSeries,
@@ -33,6 +37,14 @@ from app.schemas.schedule_setting import (
     ScheduleSettingUpdate,
     ScheduleSettingResponse,
 )
+from app.schemas.url_filter_rule import (
+    UrlFilterRuleBase,
+    UrlFilterRuleCreate,
+    UrlFilterRuleUpdate,
+    UrlFilterRuleResponse,
+    UrlFilterRuleListResponse,
+    UrlFilterCheckResponse,
+)
 
 __all__ = [
     # Company schemas
@@ -52,6 +64,10 @@ __all__ = [
     "ArticleUpdate",
     "ArticleResponse",
     "ArticleListResponse",
+    "ArticleCompactResponse",
+    "ArticleCompactListResponse",
+    "ArticleSearchHit",
+    "ArticleSearchResponse",
     "ArticleAnalysisStats",
     "ArticleAnalysisGroup",
     "ArticleAnalysisTimeSeries",
@@ -67,4 +83,11 @@ __all__ = [
     "ScheduleSettingCreate",
     "ScheduleSettingUpdate",
     "ScheduleSettingResponse",
+    # URL filter rule schemas
+    "UrlFilterRuleBase",
+    "UrlFilterRuleCreate",
+    "UrlFilterRuleUpdate",
+    "UrlFilterRuleResponse",
+    "UrlFilterRuleListResponse",
+    "UrlFilterCheckResponse",
 ]
@@ -1,6 +1,8 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 from datetime import datetime, date
-from typing import Optional, List
+from typing import Literal, Optional, List
+
+from app.utils.tags import format_tags, parse_tags
 
 
 class ArticleBase(BaseModel):
@@ -16,6 +18,12 @@ class ArticleBase(BaseModel):
     inappropriate_reason: Optional[str] = None
     is_reviewed: bool = False
 
+    @field_validator("tags", mode="before")
+    @classmethod
+    def normalize_tags(cls, value):
+        # DB（text[]）・LLMの結果はリスト、APIはカンマ区切りの文字列
+        return format_tags(parse_tags(value))
+
 
 class ArticleCreate(ArticleBase):
     company_id: int
@@ -32,6 +40,11 @@ class ArticleUpdate(BaseModel):
     inappropriate_reason: Optional[str] = None
     is_reviewed: Optional[bool] = None
 
+    @field_validator("tags", mode="before")
+    @classmethod
+    def normalize_tags(cls, value):
+        return format_tags(parse_tags(value))
+
 
 class ArticleResponse(ArticleBase):
     id: int
@@ -42,9 +55,59 @@ class ArticleResponse(ArticleBase):
         from_attributes = True
 
 
+class ArticleCompactResponse(BaseModel):
+    """一覧の compact 表示（本文・要約等の長いテキストは記事詳細 GET /articles/{id} で取得）"""
+
+    id: int
+    company_id: int
+    title: str
+    url: str
+    published_date: Optional[date] = None
+    category: Optional[str] = None
+    business_area: Optional[str] = None
+    tags: Optional[str] = None
+    is_inappropriate: bool = False
+    is_reviewed: bool = False
+    created_at: datetime
+
+    @field_validator("tags", mode="before")
+    @classmethod
+    def normalize_tags(cls, value):
+        return format_tags(parse_tags(value))
+
+    class Config:
+        from_attributes = True
+
+
 class ArticleListResponse(BaseModel):
+    view: Literal["full"] = "full"
     items: List[ArticleResponse]
     total: int
+    # False の場合 total はプランナーの推定値
+    total_is_exact: bool = True
+    next_cursor: Optional[str] = None
+
+
+class ArticleCompactListResponse(BaseModel):
+    view: Literal["compact"] = "compact"
+    items: List[ArticleCompactResponse]
+    total: int
+    total_is_exact: bool = True
+    next_cursor: Optional[str] = None
+
+
+class ArticleSearchHit(ArticleResponse):
+    # 関連度（大きいほど上位。全文検索とCJKの部分一致で尺度は異なる）
+    rank: float
+    # 一致箇所を <mark> で囲んだ抜粋
+    headline: Optional[str] = None
+
+
+class ArticleSearchResponse(BaseModel):
+    items: List[ArticleSearchHit]
+    total: int
+    # fulltext: 英語の全文検索 / bigram: 日本語等の部分一致
+    mode: str
 
 
 class ArticleAnalysisStats(BaseModel):
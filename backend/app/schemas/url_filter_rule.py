@@ -0,0 +1,66 @@
+"""URL filter rule schemas for request/response validation."""
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import Optional, List, Literal
+
+RuleType = Literal["domain", "path_prefix", "path_contains", "path_regex"]
+RuleAction = Literal["allow", "deny"]
+
+
+class UrlFilterRuleBase(BaseModel):
+    """Base URL filter rule schema."""
+
+    rule_type: RuleType
+    pattern: str = Field(min_length=1, max_length=500)
+    action: RuleAction = "deny"
+    company_id: Optional[int] = None
+    region: Optional[str] = Field(default=None, max_length=10)
+    reason: Optional[str] = Field(default=None, max_length=255)
+    is_active: bool = True
+
+
+class UrlFilterRuleCreate(UrlFilterRuleBase):
+    """Schema for creating URL filter rules."""
+
+    pass
+
+
+class UrlFilterRuleUpdate(BaseModel):
+    """Schema for updating URL filter rules."""
+
+    rule_type: Optional[RuleType] = None
+    pattern: Optional[str] = Field(default=None, min_length=1, max_length=500)
+    action: Optional[RuleAction] = None
+    company_id: Optional[int] = None
+    region: Optional[str] = Field(default=None, max_length=10)
+    reason: Optional[str] = Field(default=None, max_length=255)
+    is_active: Optional[bool] = None
+
+
+class UrlFilterRuleResponse(UrlFilterRuleBase):
+    """Schema for URL filter rule responses."""
+
+    id: int
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class UrlFilterRuleListResponse(BaseModel):
+    """Schema for URL filter rule list responses."""
+
+    items: List[UrlFilterRuleResponse]
+    total: int
+
+
+class UrlFilterCheckResponse(BaseModel):
+    """Schema for URL filter check results."""
+
+    url: str
+    blocked: bool
+    rule_id: Optional[int] = None
+    rule_type: Optional[str] = None
+    pattern: Optional[str] = None
+    reason: Optional[str] = None
@@ -1,8 +1,9 @@
 import asyncio
 from datetime import date
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
-from ddgs import DDGS
+from app.services.crawler.search_cache import STALE, get_search_cache, make_cache_key
+from app.services.crawler.search_service import SearchRequest, SearchService
 from app.services.llm.relevance import AiRelevanceClassifier
 from app.settings.search_config import SearchConfig
 
@@ -10,14 +11,20 @@ from app.settings.search_config import SearchConfig
 class DuckDuckGoSearcher:
     """DuckDuckGo Search APIを使った検索クラス"""
 
-    def __init__(self, config: Optional[SearchConfig] = None):
+    # 再検索中のキャッシュキーとバックグラウンドタスク（インスタンス間で共有）
+    _revalidating: Set[str] = set()
+    _background_tasks: Set[asyncio.Task] = set()
+
+    def __init__(self, config: Optional[SearchConfig] = None, use_cache: bool = True):
         """
         Initialize DuckDuckGo searcher.
 
         Args:
             config: SearchConfig instance. If None, loads default config.
+            use_cache: Whether to use the local search result cache.
         """
         self._config = config or SearchConfig()
+        self._use_cache = use_cache
     
     async def search(
         self,
@@ -50,71 +57,101 @@ class DuckDuckGoSearcher:
         # glパラメータをそのまま使用（sg-en, jp-jp等の形式）
         region = gl if gl else "wt-wt"
 
-        def _run_search() -> List[Dict]:
-            with DDGS() as ddgs:
-                return list(
-                    ddgs.text(
-                        query=query,
-                        region=region,
-                        safesearch="off",
-                        timelimit=timelimit,
-                        max_results=num_results,
-                    )
-                )
-
-        def _run_search_no_timelimit() -> List[Dict]:
-            with DDGS() as ddgs:
-                return list(
-                    ddgs.text(
-                        query=query,
-                        region=region,
-                        safesearch="off",
-                        timelimit=None,
-                        max_results=num_results,
-                    )
-                )
+        cache = get_search_cache() if self._use_cache else None
+        if cache is not None:
+            cached = cache.get(query, region, timelimit, num_results)
+            if cached is not None:
+                results, state = cached
+                if debug:
+                    print(f"[debug] cache {state}: region={region} timelimit={timelimit} query={query}")
+                if state == STALE:
+                    # 古い結果をすぐ返し、裏で再検索して更新する
+                    self._schedule_revalidate(query, region, timelimit, num_results)
+                return results
+
+        results = await self._search_remote(query, region, timelimit, num_results, debug=debug)
+        if results is None:
+            return []
+        if cache is not None:
+            cache.set(query, region, timelimit, num_results, results)
+        return results
 
-        results = []
+    async def _search_remote(
+        self,
+        query: str,
+        region: str,
+        timelimit: Optional[str],
+        num_results: int,
+        debug: bool = False,
+    ) -> Optional[List[Dict]]:
+        """
+        DuckDuckGoに問い合わせて正規化済みの結果を返す
 
+        Returns:
+            検索結果のリスト。検索エラーの場合はNone（キャッシュしない）
+        """
+        # レート制限はSearchServiceで全検索共通に行うため、ここでは待たない
+        request = SearchRequest(query=query, region=region, timelimit=timelimit, max_results=num_results)
         try:
-            items = await asyncio.to_thread(_run_search)
-            if debug:
-                print(f"[debug] region={region} timelimit={timelimit} query={query}")
-                print(f"[debug] results={len(items)}")
-            for item in items:
-                title = item.get("title") or ""
-                url = item.get("href") or ""
-                snippet = item.get("body") or ""
-                if title and url:
-                    results.append({
-                        "title": title,
-                        "url": url,
-                        "snippet": snippet,
-                    })
+            items = await SearchService.text(request)
         except Exception as e:
-            if timelimit:
-                try:
-                    if debug:
-                        print(f"[debug] timelimit failed ({e}), retrying without timelimit")
-                    items = await asyncio.to_thread(_run_search_no_timelimit)
-                    for item in items:
-                        title = item.get("title") or ""
-                        url = item.get("href") or ""
-                        snippet = item.get("body") or ""
-                        if title and url:
-                            results.append({
-                                "title": title,
-                                "url": url,
-                                "snippet": snippet,
-                            })
-                except Exception as inner:
-                    print(f"DuckDuckGo search error: {inner}")
-            else:
+            if not timelimit:
                 print(f"DuckDuckGo search error: {e}")
+                return None
+            if debug:
+                print(f"[debug] timelimit failed ({e}), retrying without timelimit")
+            try:
+                items = await SearchService.text(
+                    SearchRequest(query=query, region=region, timelimit=None, max_results=num_results)
+                )
+            except Exception as inner:
+                print(f"DuckDuckGo search error: {inner}")
+                return None
 
-        await asyncio.sleep(1)
+        if debug:
+            print(f"[debug] region={region} timelimit={timelimit} query={query}")
+            print(f"[debug] results={len(items)}")
+
+        results = []
+        for item in items:
+            title = item.get("title") or ""
+            url = item.get("href") or ""
+            snippet = item.get("body") or ""
+            if title and url:
+                results.append({
+                    "title": title,
+                    "url": url,
+                    "snippet": snippet,
+                })
         return results
 
+    def _schedule_revalidate(
+        self,
+        query: str,
+        region: str,
+        timelimit: Optional[str],
+        num_results: int,
+    ) -> None:
+        """古いキャッシュの再検索をバックグラウンドで開始（同じキーは同時に1つまで）"""
+        key = make_cache_key(query, region, timelimit, num_results)
+        if key in self._revalidating:
+            return
+        self._revalidating.add(key)
+
+        async def _revalidate() -> None:
+            try:
+                results = await self._search_remote(query, region, timelimit, num_results)
+                cache = get_search_cache()
+                if results is not None and cache is not None:
+                    cache.set(query, region, timelimit, num_results, results)
+            finally:
+                self._revalidating.discard(key)
+
+        task = asyncio.create_task(_revalidate())
+        # タスクが途中でGCされないよう参照を保持
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
     async def search_ai_related(
         self,
         query: str,
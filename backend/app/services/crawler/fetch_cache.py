@@ -0,0 +1,88 @@
+"""ジョブ内で共有する記事取得キャッシュ
+
+同じニュース記事が複数企業の検索結果に現れることが多いため、
+1ジョブ内では正規化URLごとに取得・解析を1回だけ行い、結果（タイトル・本文・日付等）を再利用する。
+同じURLの取得が同時に要求された場合は、最初の取得の完了を待って結果を共有する。
+キャッシュするのは取得結果と恒久的な失敗（404・非対応の種別等）のみで、
+タイムアウト・サーキットブレーカー等による一時的な失敗は次に要求されたときに取得し直す。
+企業ごとのLLM処理（AI関連判定・要約・分類）はキャッシュした本文に対して企業ごとに実行する。
+"""
+import asyncio
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional
+
+
+class TransientFetchError(Exception):
+    """一時的な取得失敗（キャッシュしない）"""
+
+
+class JobFetchCache:
+    """正規化URLをキーとした取得結果のキャッシュ（恒久的な取得失敗はNoneとして保持）"""
+
+    def __init__(self, max_entries: int = 1000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Optional[Dict]]" = OrderedDict()
+        self._pending: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Optional[Dict]]],
+    ) -> Optional[Dict]:
+        """
+        キャッシュ済みの結果を返す。なければ fetch を実行して保存
+
+        Args:
+            key: 正規化URL
+            fetch: 取得処理（恒久的な失敗はNoneを返し、一時的な失敗は TransientFetchError を送出すること）
+
+        Returns:
+            取得結果のコピー（呼び出し側で変更してもキャッシュに影響しない）。失敗時はNone
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return _copy(self._entries[key])
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            self.hits += 1
+            return _copy(await asyncio.shield(pending))
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            result = await fetch()
+        except TransientFetchError:
+            # 待機中の呼び出しにもNoneを返すが、キャッシュはしない
+            future.set_result(None)
+            return None
+        except BaseException:
+            # キャンセル等で取得が中断された場合は待機中の呼び出しにNoneを返し、キャッシュしない
+            future.set_result(None)
+            raise
+        finally:
+            self._pending.pop(key, None)
+
+        future.set_result(result)
+        self.put(key, result)
+        return _copy(result)
+
+    def put(self, key: str, data: Optional[Dict]) -> None:
+        """取得結果を保存（正規URL等の別キーでも引けるようにする場合にも使う）"""
+        self._entries[key] = data
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def _copy(data: Optional[Dict]) -> Optional[Dict]:
+    return dict(data) if data is not None else None
@@ -1,18 +1,82 @@
 import httpx
 from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import date
 import asyncio
 import re
 import json
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit
 
 from app.services.llm.ollama_client import OllamaClient
 from app.services.llm.relevance import AiRelevanceClassifier
+from app.utils.cpu_executor import CpuExecutor
+from app.utils.date_scanner import find_date, find_date_in_url
+from app.utils.http_client import HTTPClient
+from app.utils.retry_handler import CircuitBreakerRegistry, RetryConfig, retry_async
+from app.utils.service_error import CircuitOpenError, ErrorCode, RetryableError
+
+
+def parse_press_list_page(
+    html: bytes,
+    encoding: Optional[str],
+    page_url: str,
+    config: Dict,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    find_archives: bool = False,
+    debug: bool = False,
+) -> Dict:
+    """
+    一覧ページを解析（ワーカープロセスで実行）
+
+    Args:
+        html: レスポンスボディ（生のバイト列）
+        encoding: HTTPヘッダー等から得た文字コード
+        page_url: 一覧ページのURL
+        config: サイト別のスクレイピング設定
+        start_date: 期間の開始日（年別アーカイブの選定用）
+        end_date: 期間の終了日（年別アーカイブの選定用）
+        find_archives: 年別アーカイブを探すか
+        debug: デバッグログを出力するか
+
+    Returns:
+        {links, llm_candidates, next_url, year_archives}
+        （year_archives は (アーカイブに含まれる最後の年, URL) の新しい順のリスト）
+    """
+    scraper = PressScraper()
+    soup = BeautifulSoup(scraper._decode_html(html, encoding), "lxml")
+
+    links = [scraper._link_record(a) for a in scraper._select_links(soup, config, debug=debug)[:500]]
+    return {
+        "links": links,
+        "llm_candidates": [] if links else scraper._build_llm_candidates(soup),
+        "next_url": scraper._find_next_page_url(soup, page_url),
+        "year_archives": (
+            scraper._find_year_archives(soup, page_url, start_date, end_date)
+            if find_archives and start_date else []
+        ),
+    }
+
 
 class PressScraper:
     """企業の公式プレスリリース一覧をスクレイピング"""
 
+    # リンク周辺テキストの最大文字数（日付抽出用）
+    CONTEXT_MAX_CHARS = 1000
+
+    # 1回の一覧取得で辿る最大ページ数（ページ送り + 年別アーカイブ）
+    MAX_LIST_PAGES = 20
+
+    # 「次へ」リンクのラベル
+    NEXT_PAGE_LABEL_PATTERN = re.compile(
+        r"^(次へ|次のページ|次|next|next page|older|older posts|older entries|›|»|>|→|>>)$",
+        re.IGNORECASE,
+    )
+    # ページ番号（?page=2, /page/2/, ?p=2 など）
+    PAGE_NUMBER_PATTERN = re.compile(r"([?&](?:page|p|pg|paged)=|/page/)(\d+)", re.IGNORECASE)
+    # 年別アーカイブのラベル（2024, 2024年, 2024年度, FY2024 など）
+    YEAR_ARCHIVE_LABEL_PATTERN = re.compile(r"^(?:FY\s*)?((?:19|20)\d{2})(?:年)?(年度)?$", re.IGNORECASE)
+
     def __init__(self):
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -49,121 +113,362 @@ class PressScraper:
         debug: bool = False,
         use_llm_fallback: bool = False,
         extract_date_with_llm: bool = False,
+        max_pages: Optional[int] = None,
     ) -> List[Dict]:
-        """プレスリリース一覧を取得"""
+        """
+        プレスリリース一覧を取得
+
+        start_dateが指定されている場合は「次へ」リンクを新しい順に辿り、
+        ページ内の全記事がstart_dateより古くなった時点で打ち切る。
+        「次へ」リンクがなくなってもstart_dateに届いていない場合のみ、
+        まだ辿っていない年の年別アーカイブを新しい順に辿る。
+        """
         config = self._get_config(url)
         results = []
-        
+        seen_urls = set()
+        visited_pages = set()
+        max_pages = max_pages or self.MAX_LIST_PAGES
+        # 期間指定がない場合は打ち切り条件がないため、1ページ目のみ取得
+        paginate = start_date is not None
+
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, headers=self.headers)
-                response.raise_for_status()
-
-                html = self._decode_html(response)
-                if debug:
-                    print(f"[debug] status={response.status_code} url={response.url}")
-                    print("[debug] response head:")
-                    print(html[:1000])
-                
-                soup = BeautifulSoup(html, "lxml")
-                
-                # リンクを取得
-                links = soup.select(config["list_selector"])
-                if debug:
-                    print(f"[debug] list_selector={config['list_selector']}")
-                    print(f"[debug] links_found={len(links)}")
-
-                if not links:
-                    # Fallback: collect all anchors and filter by common news patterns
-                    candidates = soup.select("a[href]")
-                    if debug:
-                        print(f"[debug] fallback_candidates={len(candidates)}")
-                    links = [
-                        a for a in candidates
-                        if "/news/" in a.get("href", "")
-                        or a.get("href", "").endswith(".pdf")
-                    ]
-                    if debug:
-                        print(f"[debug] fallback_links={len(links)}")
-                
-                if not links and use_llm_fallback:
-                    candidates = self._build_llm_candidates(soup)
-                    if debug:
-                        print(f"[debug] llm_candidates={len(candidates)}")
-                    llm_links = await self._select_links_with_llm(url, candidates, debug=debug)
-                    links = llm_links
-                
+            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
                 llm_client = None
                 if extract_date_with_llm:
                     llm_client = await self._get_llm_client(debug=debug)
 
-                for link in links[:500]:  # 最大500件
-                    href = link.get("href", "") if hasattr(link, "get") else link.get("url", "")
-                    if not href:
+                # 取得待ちのページ（新しい順）。「次へ」リンクが途切れたら年別アーカイブに移る
+                pending_pages = [url]
+                archive_pages: List[Tuple[int, str]] = []
+                # これまでに辿ったページで最も古い記事の日付（それより新しい年のアーカイブは取得済み）
+                oldest_seen: Optional[date] = None
+
+                while pending_pages and len(visited_pages) < max_pages:
+                    page_url = pending_pages.pop(0)
+                    if page_url in visited_pages:
                         continue
-                    
-                    # 相対URLを絶対URLに変換
-                    full_url = urljoin(url, href)
-                    
-                    # タイトル取得
-                    title = ""
-                    if hasattr(link, "get_text"):
-                        title = link.get_text(strip=True)
-                    if not title and hasattr(link, "get"):
-                        title = link.get("title", "").strip()
-                    if not title:
-                        if hasattr(link, "get"):
-                            title = link.get("aria-label", "").strip()
-                    if not title:
-                        title = full_url
-
-                    extracted_date = self._extract_date_from_link(link, title, full_url)
-                    if not extracted_date and extract_date_with_llm and llm_client:
-                        extracted_date = await self._extract_date_with_llm(
-                            llm_client,
-                            link=link,
-                            title=title,
-                            url=full_url,
-                            debug=debug,
-                        )
-
-                    if start_date or end_date:
-                        if not extracted_date:
-                            continue
-                        if start_date and extracted_date < start_date:
-                            continue
-                        if end_date and extracted_date > end_date:
-                            continue
-
-                    if title and full_url:
-                        results.append({
-                            "title": title,
-                            "url": full_url,
-                            "published_date": extracted_date,
-                            "date_validated": bool(start_date or end_date),
-                            "source": "press_list",
-                        })
-                
-                await asyncio.sleep(1)
-                
+                    visited_pages.add(page_url)
+
+                    try:
+                        response = await self._get_page(client, page_url)
+                    except CircuitOpenError as e:
+                        # ホストが応答しない状態のため、残りのページも取得しない
+                        print(f"Press list fetch skipped ({page_url}): {e}")
+                        break
+                    except Exception as e:
+                        print(f"Press list page fetch error ({page_url}): {e}")
+                        pending_pages = self._next_archive_page(archive_pages, oldest_seen, visited_pages, start_date)
+                        continue
+
+                    if debug:
+                        print(f"[debug] status={response.status_code} url={response.url}")
+                        print("[debug] response head:")
+                        print(self._decode_html(response.content[:4000], response.encoding)[:1000])
+
+                    # HTML解析はワーカープロセスで実行
+                    page = await CpuExecutor.run(
+                        parse_press_list_page,
+                        response.content,
+                        response.encoding,
+                        page_url,
+                        config,
+                        start_date,
+                        end_date,
+                        paginate and len(visited_pages) == 1,
+                        debug,
+                        service_name="PressScraper",
+                        error_code=ErrorCode.HTML_PARSE_ERROR,
+                    )
+                    links = page["links"]
+
+                    # LLMによるリンク抽出は1ページ目のみ（コスト抑制）
+                    if not links and use_llm_fallback and len(visited_pages) == 1:
+                        candidates = page["llm_candidates"]
+                        if debug:
+                            print(f"[debug] llm_candidates={len(candidates)}")
+                        links = await self._select_links_with_llm(page_url, candidates, debug=debug)
+
+                    page_items, page_dates = await self._collect_items(
+                        links,
+                        page_url,
+                        start_date,
+                        end_date,
+                        seen_urls,
+                        llm_client=llm_client,
+                        debug=debug,
+                    )
+                    results.extend(page_items)
+
+                    await asyncio.sleep(1)
+
+                    if not paginate:
+                        break
+
+                    if len(visited_pages) == 1:
+                        archive_pages = list(page["year_archives"])
+                        if debug:
+                            print(f"[debug] year_archives={archive_pages}")
+
+                    if page_dates:
+                        page_oldest = min(page_dates)
+                        oldest_seen = page_oldest if oldest_seen is None else min(oldest_seen, page_oldest)
+
+                    # ページ内の日付付き記事がすべて開始日より古ければ期間を辿り終えた
+                    # （年別アーカイブは新しい順に辿るため、残りのアーカイブはさらに古い）
+                    reached_start = bool(page_dates) and all(d < start_date for d in page_dates)
+                    if debug:
+                        print(f"[debug] page={len(visited_pages)} items={len(page_items)} "
+                              f"reached_start={reached_start} next={page['next_url']}")
+                    if reached_start:
+                        break
+
+                    next_url = page["next_url"]
+                    if next_url and next_url not in visited_pages:
+                        pending_pages = [next_url]
+                    else:
+                        pending_pages = self._next_archive_page(archive_pages, oldest_seen, visited_pages, start_date)
+
         except Exception as e:
             print(f"Press list fetch error: {e}")
-        
+
         return results
 
-    def _decode_html(self, response: httpx.Response) -> str:
+    @staticmethod
+    def _next_archive_page(
+        archive_pages: List[Tuple[int, str]],
+        oldest_seen: Optional[date],
+        visited_pages: set,
+        start_date: date,
+    ) -> List[str]:
+        """
+        次に辿る年別アーカイブ（取り出したものは archive_pages から除く）
+
+        最も古い記事より新しい年だけを含むアーカイブは、辿ったページで網羅済みのため飛ばす。
+        開始日より前に終わる年に達したら、残り（さらに古い年）は辿らない。
+        """
+        while archive_pages:
+            last_year, archive_url = archive_pages.pop(0)
+            if last_year < start_date.year:
+                archive_pages.clear()
+                return []
+            if archive_url in visited_pages:
+                continue
+            if oldest_seen is not None and last_year > oldest_seen.year:
+                continue
+            return [archive_url]
+        return []
+
+    async def _get_page(self, client: httpx.AsyncClient, page_url: str) -> httpx.Response:
+        """一覧ページを取得（ホスト単位のサーキットブレーカーを確認）"""
+        retry_config = RetryConfig(
+            max_attempts=1,
+            retryable_errors=[httpx.TimeoutException, httpx.ConnectError, RetryableError],
+            circuit_breaker=CircuitBreakerRegistry.for_url(page_url),
+        )
+        return await retry_async(self._get_page_once, retry_config, client, page_url)
+
+    async def _get_page_once(self, client: httpx.AsyncClient, page_url: str) -> httpx.Response:
+        response = await client.get(page_url, headers=self.headers)
+        HTTPClient.raise_for_status(response, "PressScraper")
+        return response
+
+    def _link_record(self, link) -> Dict:
+        """リンク要素をプロセス間で受け渡せるdictに変換"""
+        title = link.get_text(strip=True)
+        if not title:
+            title = link.get("title", "").strip()
+        if not title:
+            title = link.get("aria-label", "").strip()
+
+        parent = link.find_parent()
+        context = parent.get_text(" ", strip=True) if parent else ""
+        return {
+            "href": link.get("href", ""),
+            "title": title,
+            "text": link.get_text(" ", strip=True),
+            "context": context[:self.CONTEXT_MAX_CHARS],
+        }
+
+    def _select_links(self, soup: BeautifulSoup, config: Dict, debug: bool = False) -> List:
+        """一覧ページから記事リンク候補を抽出"""
+        links = soup.select(config["list_selector"])
+        if debug:
+            print(f"[debug] list_selector={config['list_selector']}")
+            print(f"[debug] links_found={len(links)}")
+
+        if not links:
+            # Fallback: collect all anchors and filter by common news patterns
+            candidates = soup.select("a[href]")
+            if debug:
+                print(f"[debug] fallback_candidates={len(candidates)}")
+            links = [
+                a for a in candidates
+                if "/news/" in a.get("href", "")
+                or a.get("href", "").endswith(".pdf")
+            ]
+            if debug:
+                print(f"[debug] fallback_links={len(links)}")
+        return links
+
+    async def _collect_items(
+        self,
+        links: List[Dict],
+        page_url: str,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        seen_urls: set,
+        llm_client: Optional[OllamaClient] = None,
+        debug: bool = False,
+    ) -> Tuple[List[Dict], List[date]]:
+        """
+        リンク（_link_record形式のdict）を記事データに変換
+
+        Returns:
+            (期間内の記事リスト, ページ内で抽出できた日付のリスト)
+        """
+        items = []
+        page_dates = []
+
+        for link in links[:500]:  # 1ページあたり最大500件
+            href = link.get("href", "")
+            if not href:
+                continue
+
+            # 相対URLを絶対URLに変換
+            full_url = urljoin(page_url, href)
+            if full_url in seen_urls:
+                continue
+
+            title = link.get("title", "") or full_url
+
+            # ページ送り・年別アーカイブのリンクは記事ではない
+            if self._is_navigation_label(title):
+                continue
+
+            extracted_date = self._extract_date_from_link(link, title, full_url)
+            if not extracted_date and llm_client:
+                extracted_date = await self._extract_date_with_llm(
+                    llm_client,
+                    link=link,
+                    title=title,
+                    url=full_url,
+                    debug=debug,
+                )
+            if extracted_date:
+                page_dates.append(extracted_date)
+
+            if start_date or end_date:
+                if not extracted_date:
+                    continue
+                if start_date and extracted_date < start_date:
+                    continue
+                if end_date and extracted_date > end_date:
+                    continue
+
+            if title and full_url:
+                seen_urls.add(full_url)
+                items.append({
+                    "title": title,
+                    "url": full_url,
+                    "published_date": extracted_date,
+                    "date_validated": bool(start_date or end_date),
+                    "source": "press_list",
+                })
+
+        return items, page_dates
+
+    def _find_next_page_url(self, soup: BeautifulSoup, page_url: str) -> Optional[str]:
+        """一覧ページの「次へ」（より古い記事）リンクを検出"""
+        # 1. rel="next"
+        for elem in soup.select("link[rel~=next][href], a[rel~=next][href]"):
+            next_url = self._same_site_url(page_url, elem.get("href", ""))
+            if next_url:
+                return next_url
+
+        # 2. ページネーション内の「次へ」ラベル・classを持つリンク
+        for anchor in soup.select("a[href]"):
+            text = anchor.get_text(" ", strip=True) or anchor.get("aria-label", "") or anchor.get("title", "")
+            classes = " ".join(anchor.get("class", [])).lower()
+            if self.NEXT_PAGE_LABEL_PATTERN.match(text.strip()) or re.search(r"(^|[\s_-])next([\s_-]|$)", classes):
+                next_url = self._same_site_url(page_url, anchor.get("href", ""))
+                if next_url:
+                    return next_url
+
+        # 3. page=N / /page/N/ 形式の連番
+        match = self.PAGE_NUMBER_PATTERN.search(page_url)
+        current = int(match.group(2)) if match else 1
+        wanted = str(current + 1)
+        for anchor in soup.select("a[href]"):
+            next_url = self._same_site_url(page_url, anchor.get("href", ""))
+            if not next_url:
+                continue
+            candidate = self.PAGE_NUMBER_PATTERN.search(next_url)
+            if candidate and candidate.group(2) == wanted:
+                return next_url
+
+        return None
+
+    def _find_year_archives(
+        self,
+        soup: BeautifulSoup,
+        page_url: str,
+        start_date: date,
+        end_date: Optional[date] = None,
+    ) -> List[Tuple[int, str]]:
+        """
+        期間に該当する年別アーカイブページを新しい年順に返す
+
+        Returns:
+            (アーカイブに含まれる最後の年, URL) のリスト（年度アーカイブは翌年の3月までを含む）
+        """
+        last_year = (end_date or date.today()).year
+        archives: Dict[int, str] = {}
+
+        for anchor in soup.select("a[href]"):
+            text = anchor.get_text(" ", strip=True)
+            label = self.YEAR_ARCHIVE_LABEL_PATTERN.match(text)
+            if not label:
+                continue
+            year = int(label.group(1))
+            href = anchor.get("href", "")
+            if str(year) not in href:
+                continue
+
+            # 年度（4月始まり）は前年の年度アーカイブにも期間が含まれうる
+            first_year = start_date.year - 1 if label.group(2) else start_date.year
+            if year < first_year or year > last_year or year in archives:
+                continue
+
+            archive_url = self._same_site_url(page_url, href)
+            if archive_url and archive_url != page_url:
+                archives[year] = (year + 1 if label.group(2) else year, archive_url)
+
+        return [archives[year] for year in sorted(archives, reverse=True)]
+
+    def _is_navigation_label(self, text: str) -> bool:
+        """ページ送り・年別アーカイブのラベルか判定"""
+        text = (text or "").strip()
+        return bool(
+            self.NEXT_PAGE_LABEL_PATTERN.match(text)
+            or self.YEAR_ARCHIVE_LABEL_PATTERN.match(text)
+            or text.isdigit()
+        )
+
+    def _same_site_url(self, page_url: str, href: str) -> Optional[str]:
+        """同一ホストの絶対URLに変換（無効なリンクはNone）"""
+        href = (href or "").strip()
+        if not href or href.startswith("#") or href.lower().startswith("javascript:"):
+            return None
+        full_url = urljoin(page_url, href).split("#")[0]
+        if urlsplit(full_url).netloc != urlsplit(page_url).netloc:
+            return None
+        if full_url == page_url:
+            return None
+        return full_url
+
+    def _decode_html(self, content: bytes, encoding: Optional[str] = None) -> str:
         """Decode HTML with charset hints from meta tags."""
-        content = response.content
-        charset = None
-        match = re.search(br'charset=["\']?([a-zA-Z0-9_-]+)', content[:1000])
-        if match:
-            charset = match.group(1).decode("ascii", errors="ignore")
-        if not charset:
-            charset = response.encoding or "utf-8"
-        try:
-            return content.decode(charset, errors="replace")
-        except LookupError:
-            return content.decode("utf-8", errors="replace")
+        return HTTPClient.decode_html(content, encoding)
 
     def _build_llm_candidates(self, soup: BeautifulSoup, limit: int = 200) -> List[Dict]:
         """Collect anchor candidates for LLM filtering."""
@@ -230,8 +535,10 @@ class PressScraper:
             if not url:
                 continue
             results.append({
+                "href": url,
                 "title": title or url,
-                "url": url,
+                "text": title,
+                "context": "",
             })
         return results
 
@@ -258,17 +565,13 @@ class PressScraper:
     async def _extract_date_with_llm(
         self,
         client: OllamaClient,
-        link,
+        link: Dict,
         title: str,
         url: str,
         debug: bool = False,
     ) -> Optional[date]:
         """Ask LLM to extract date from nearby HTML text."""
-        if hasattr(link, "find_parent"):
-            parent = link.find_parent()
-            context = parent.get_text(" ", strip=True) if parent else ""
-        else:
-            context = ""
+        context = link.get("context", "")
 
         payload = {
             "title": title,
@@ -298,40 +601,20 @@ class PressScraper:
 
     def _extract_date_from_text(self, text: str) -> Optional[date]:
         """Extract a date from text if present."""
-        if not text:
-            return None
-
-        patterns = [
-            r"(\d{4})[/-](\d{1,2})[/-](\d{1,2})",
-            r"(\d{4})年(\d{1,2})月(\d{1,2})日",
-            r"(\d{4})(\d{2})(\d{2})",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text)
-            if not match:
-                continue
-            try:
-                return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
-            except ValueError:
-                continue
-        return None
+        return find_date(text)
 
     def _extract_date_from_link(
         self,
-        link,
+        link: Dict,
         title: str,
         url: str,
     ) -> Optional[date]:
         """Try to extract a date near the link or from title/url."""
-        text_candidates = []
-
-        if hasattr(link, "get_text"):
-            parent = link.find_parent()
-            if parent:
-                text_candidates.append(parent.get_text(" ", strip=True))
-            text_candidates.append(link.get_text(" ", strip=True))
-
-        text_candidates.append(title)
+        text_candidates = [
+            link.get("context", ""),
+            link.get("text", ""),
+            title,
+        ]
         text_candidates.append(url)
 
         url_date = self._extract_date_from_url(url)
@@ -346,19 +629,4 @@ class PressScraper:
 
     def _extract_date_from_url(self, url: str) -> Optional[date]:
         """Extract a date from common URL patterns."""
-        if not url:
-            return None
-
-        # Pattern: /newsYYYY/.../newsMMDD(.pdf)
-        match = re.search(r"/news(20\d{2})/.+?/news(\d{4})", url)
-        if match:
-            year = int(match.group(1))
-            month = int(match.group(2)[:2])
-            day = int(match.group(2)[2:])
-            try:
-                return date(year, month, day)
-            except ValueError:
-                return None
-
-        # Pattern: YYYYMMDD in URL
-        return self._extract_date_from_text(url)
+        return find_date_in_url(url)
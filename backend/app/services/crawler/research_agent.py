@@ -4,21 +4,27 @@ from datetime import date
 from typing import List, Dict, Optional
 from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_settings
 from app.core.database import AsyncSessionLocal
 from app.models import Company, Article
 from app.crud import company as crud_company
 from app.crud import article as crud_article
 from app.crud import job as crud_job
 from app.crud import schedule_setting as crud_schedule_setting
+from app.crud import url_alias as crud_url_alias
 from app.services.crawler.duckduckgo_search import DuckDuckGoSearcher
+from app.services.crawler.fetch_cache import JobFetchCache, TransientFetchError
 from app.services.crawler.press_scraper import PressScraper
+from app.services.crawler.url_filter import UrlFilterRegistry
 from app.services.parser.article_fetcher import ArticleFetcher
 from app.services.llm.summarizer import ArticleSummarizer
 from app.services.llm.classifier import ArticleClassifier
 from app.services.llm.date_extractor import DateExtractor
 from app.services.llm.relevance import AiRelevanceClassifier
+from app.utils.deadline import DeadlineExceeded, check_deadline, deadline_scope, run_with_deadline
 from app.utils.region_keywords import get_keywords_by_region
 
 logger = logging.getLogger(__name__)
@@ -27,10 +33,6 @@ logger = logging.getLogger(__name__)
 class ResearchAgent:
     """事例調査AIエージェント"""
 
-    # タイムアウト設定（秒）
-    FETCH_TIMEOUT = 300  # 記事取得のタイムアウト（5分）
-    LLM_TIMEOUT = 300    # LLM処理のタイムアウト（5分）
-
     def __init__(self):
         self.ddg_searcher = DuckDuckGoSearcher()
         self.press_scraper = PressScraper()
@@ -39,6 +41,15 @@ class ResearchAgent:
         self.classifier = ArticleClassifier()
         self.date_extractor = DateExtractor()
         self.ai_classifier = AiRelevanceClassifier()
+        # 複数企業で同じ記事を取得し直さないためのジョブ内キャッシュ
+        self.fetch_cache = JobFetchCache(get_settings().job_fetch_cache_max_entries)
+        # 時間予算（秒）。各段階は自身の予算と親（記事・企業・ジョブ）の残り時間の小さい方で打ち切る
+        settings = get_settings()
+        self.job_time_budget = settings.job_time_budget
+        self.company_time_budget = settings.company_time_budget
+        self.item_time_budget = settings.item_time_budget
+        self.fetch_time_budget = settings.fetch_time_budget
+        self.llm_time_budget = settings.llm_time_budget
     
     async def run(self, job_id: int) -> None:
         """
@@ -57,6 +68,16 @@ class ResearchAgent:
                 
                 start_date = setting.search_start_date
                 end_date = setting.search_end_date
+                self.fetch_cache.clear()
+
+                # 有効期限切れのURL別名を削除
+                try:
+                    purged = await crud_url_alias.delete_expired_url_aliases(db)
+                    if purged:
+                        logger.info(f"Purged {purged} expired URL aliases")
+                except SQLAlchemyError as e:
+                    logger.warning(f"Failed to purge expired URL aliases: {e}")
+                    await db.rollback()
                 
                 # アクティブな企業を取得
                 companies, total = await crud_company.get_companies(db, is_active=True)
@@ -69,37 +90,80 @@ class ResearchAgent:
                 await crud_job.update_job_progress(db, job_id, 0, 0)
                 
                 total_articles = 0
-                
-                # 企業ごとに順番に処理
-                for i, company in enumerate(companies):
-                    logger.info(f"Processing {i+1}/{total}: {company.name}")
-
-                    try:
-                        # 企業処理を実行（タイムアウトなし）
-                        # job_id, company_index, current_total_articlesを渡す
-                        articles = await self._process_company(
-                            db, company, start_date, end_date, job_id, i + 1, total_articles
-                        )
-                        total_articles += len(articles)
-
-                        # 企業処理完了後に進捗更新
-                        await crud_job.update_job_progress(
-                            db, job_id, i + 1, total_articles
-                        )
-
-                    except Exception as e:
-                        logger.info(f"Error processing {company.name}: {e}")
-                        # エラーが発生しても続行
-                        await crud_job.update_job_progress(
-                            db, job_id, i + 1, total_articles
-                        )
-                        continue
-
-                    # レート制限対策
-                    await asyncio.sleep(3)
-                
+
+                # 検索は記事処理と独立しているため、全企業分を先に並行して開始する
+                # （実行数はSearchServiceの共有レート制限で抑えられる）
+                search_tasks = {
+                    company.id: asyncio.create_task(self._search_duckduckgo(company, start_date, end_date))
+                    for company in companies
+                }
+
+                budget_report = []
+                job_note = None
+
+                try:
+                    with deadline_scope("job", self.job_time_budget):
+                        # 企業ごとに順番に処理
+                        for i, company in enumerate(companies):
+                            logger.info(f"Processing {i+1}/{total}: {company.name}")
+
+                            try:
+                                check_deadline()
+                                # 企業処理を実行（企業の時間予算とジョブの残り時間の小さい方まで）
+                                # job_id, company_index, current_total_articlesを渡す
+                                with deadline_scope("company", self.company_time_budget) as company_deadline:
+                                    try:
+                                        articles = await self._process_company(
+                                            db, company, start_date, end_date, job_id, i + 1, total_articles,
+                                            search_task=search_tasks[company.id],
+                                        )
+                                    finally:
+                                        budget_report.append((company.name, company_deadline.elapsed()))
+                                        logger.info(
+                                            f"[BUDGET] {company.name}: {company_deadline.elapsed():.1f}s used "
+                                            f"(remaining {max(0.0, company_deadline.remaining()):.0f}s)"
+                                        )
+                                total_articles += len(articles)
+
+                                # 企業処理完了後に進捗更新
+                                await crud_job.update_job_progress(
+                                    db, job_id, i + 1, total_articles
+                                )
+
+                            except DeadlineExceeded as e:
+                                await crud_job.update_job_progress(
+                                    db, job_id, i + 1, total_articles
+                                )
+                                if e.name == "job":
+                                    # ジョブの予算切れ → 残りの企業は処理しない
+                                    job_note = f"時間予算切れのため {i + 1}/{total} 社目で打ち切り"
+                                    logger.warning(f"[BUDGET] Job budget exhausted at {company.name}: {e}")
+                                    break
+                                logger.warning(f"[BUDGET] Company budget exhausted, moving on: {company.name}: {e}")
+                                continue
+
+                            except Exception as e:
+                                logger.info(f"Error processing {company.name}: {e}")
+                                # エラーが発生しても続行
+                                await crud_job.update_job_progress(
+                                    db, job_id, i + 1, total_articles
+                                )
+                                continue
+                finally:
+                    for task in search_tasks.values():
+                        if not task.done():
+                            task.cancel()
+
+                logger.info(
+                    f"Fetch cache: {self.fetch_cache.misses} fetched, {self.fetch_cache.hits} reused"
+                )
+                logger.info(
+                    "[BUDGET] Time per company: "
+                    + ", ".join(f"{name}={elapsed:.0f}s" for name, elapsed in budget_report)
+                )
+
                 # ジョブ完了
-                await crud_job.complete_job(db, job_id, "completed")
+                await crud_job.complete_job(db, job_id, "completed", job_note)
                 logger.info(f"Job completed: {total_articles} articles processed")
                 
             except Exception as e:
@@ -115,6 +179,7 @@ class ResearchAgent:
         job_id: int,
         company_index: int,
         base_article_count: int,
+        search_task: Optional[asyncio.Task] = None,
     ) -> List[Article]:
         """
         1企業の調査を実行
@@ -127,6 +192,7 @@ class ResearchAgent:
             job_id: ジョブID
             company_index: 現在の企業インデックス（1-based）
             base_article_count: この企業処理開始時点の記事数
+            search_task: 先行して開始したDuckDuckGo検索（省略時はここで検索）
 
         Returns:
             取得した記事リスト
@@ -135,7 +201,16 @@ class ResearchAgent:
 
         # 1. DuckDuckGo検索
         logger.info(f"[STEP] Starting DuckDuckGo search for {company.name}")
-        search_results = await self._search_duckduckgo(company, start_date, end_date)
+        try:
+            search_results = await run_with_deadline(
+                search_task if search_task is not None else self._search_duckduckgo(company, start_date, end_date),
+                "search",
+                self.fetch_time_budget,
+            )
+        except asyncio.TimeoutError as e:
+            check_deadline()
+            logger.warning(f"[TIMEOUT] DuckDuckGo search for {company.name}: {e}")
+            search_results = []
         logger.info(f"[STEP] DuckDuckGo search completed for {company.name}, processing {len(search_results)} items")
         articles.extend(
             await self._process_items_in_order(
@@ -172,19 +247,23 @@ class ResearchAgent:
         collected = []
         seen = set()
 
+        # URLフィルタ（リスト記事・信頼性の低いソース等）。ルール変更時のみ再コンパイルされる
+        url_filter = await UrlFilterRegistry.get_matcher(db)
+        region = company.search_settings.region if company.search_settings else None
+
         for idx, item in enumerate(items, 1):
+            # 企業・ジョブの予算切れなら残りの記事は処理しない
+            check_deadline()
             raw_url = item.get("url", "")
             title = item.get("title", "")
             logger.info(f"[ITEM {idx}/{len(items)}] Processing: {title[:50]}...")
 
-            # リスト記事のURLパターンチェック
-            if self._is_list_article_url(raw_url):
-                logger.info(f"[ITEM {idx}/{len(items)}] Skipped: list article URL pattern detected")
-                continue
-
-            # 信頼性の低いソースチェック
-            if self._is_unreliable_source(raw_url):
-                logger.info(f"[ITEM {idx}/{len(items)}] Skipped: unreliable source detected")
+            filter_rule = url_filter.match(raw_url, company_id=company.id, region=region)
+            if filter_rule:
+                logger.info(
+                    f"[ITEM {idx}/{len(items)}] Skipped: {filter_rule.reason or 'URL filter rule'} "
+                    f"({filter_rule.rule_type}: {filter_rule.pattern})"
+                )
                 continue
 
             normalized_url = self._normalize_url(raw_url)
@@ -197,18 +276,36 @@ class ResearchAgent:
             seen.add(normalized_url)
             item["normalized_url"] = normalized_url
 
+            # 既知の別名URL（リダイレクト元・AMP/モバイル版等）は正規URLでも重複チェック
+            canonical_url = await crud_url_alias.get_canonical_url(db, normalized_url)
+            if canonical_url:
+                if canonical_url in seen:
+                    logger.info(f"[ITEM {idx}/{len(items)}] Skipped: duplicate URL (alias of {canonical_url})")
+                    continue
+                seen.add(canonical_url)
+                item["canonical_url"] = canonical_url
+
             existing = await crud_article.get_article_by_url(db, normalized_url)
             if not existing:
                 if raw_url and raw_url != normalized_url:
                     existing = await crud_article.get_article_by_url(db, raw_url)
+            if not existing and canonical_url:
+                existing = await crud_article.get_article_by_url(db, canonical_url)
             if existing:
                 logger.info(f"[ITEM {idx}/{len(items)}] Skipped: already exists in DB")
                 continue
 
             logger.info(f"[ITEM {idx}/{len(items)}] Fetching and processing article...")
-            article_data = await self._fetch_and_process_article(
-                db, company, item, start_date, end_date
-            )
+            try:
+                with deadline_scope("item", self.item_time_budget):
+                    article_data = await self._fetch_and_process_article(
+                        db, company, item, start_date, end_date, seen=seen
+                    )
+            except DeadlineExceeded as e:
+                if e.name != "item":
+                    raise
+                logger.warning(f"[ITEM {idx}/{len(items)}] Skipped: {e}")
+                article_data = None
             if article_data:
                 collected.append(article_data)
                 # 記事が保存されたら即座に進捗を更新
@@ -253,13 +350,9 @@ class ResearchAgent:
         logger.info(f"  Query (native): {query}")
 
         # 本文チェックで判定するため、タイトル+スニペットチェックは不要
-        ddg_results = await self.ddg_searcher.search(
-            query, start_date, end_date, num_results=10, gl=region
-        )
-        # DuckDuckGo検索結果にソースタグを付ける
-        for item in ddg_results:
-            item["source"] = "duckduckgo"
-        results.extend(ddg_results)
+        searches = [
+            self.ddg_searcher.search(query, start_date, end_date, num_results=10, gl=region)
+        ]
 
         if company.name_en:
             # 英語名での検索は英語キーワードを使用
@@ -268,15 +361,16 @@ class ResearchAgent:
                 keywords=["AI", "generative AI", "agentic AI", "digital transformation", "automation", "case study"],
             )
             logger.info(f"  Query (English): {query_en}")
-
-            # 本文チェックで判定するため、タイトル+スニペットチェックは不要
-            ddg_results_en = await self.ddg_searcher.search(
-                query_en, start_date, end_date, num_results=5, gl=region
+            searches.append(
+                self.ddg_searcher.search(query_en, start_date, end_date, num_results=5, gl=region)
             )
+
+        # 現地語・英語のクエリを並行して実行（結果は現地語→英語の順に結合）
+        for ddg_results in await asyncio.gather(*searches):
             # DuckDuckGo検索結果にソースタグを付ける
-            for item in ddg_results_en:
+            for item in ddg_results:
                 item["source"] = "duckduckgo"
-            results.extend(ddg_results_en)
+            results.extend(ddg_results)
 
         logger.info(f"  Found {len(results)} results from DuckDuckGo")
 
@@ -296,13 +390,23 @@ class ResearchAgent:
             if not source_url.is_active:
                 continue
             
-            press_items = await self.press_scraper.fetch_press_list(
-                source_url.url,
-                start_date,
-                end_date,
-                use_llm_fallback=True,
-                extract_date_with_llm=True,
-            )
+            # 一覧のページ送りは件数が読めないため、企業の残り時間の範囲で実行
+            try:
+                press_items = await run_with_deadline(
+                    self.press_scraper.fetch_press_list(
+                        source_url.url,
+                        start_date,
+                        end_date,
+                        use_llm_fallback=True,
+                        extract_date_with_llm=True,
+                    ),
+                    "press_list",
+                    None,
+                )
+            except asyncio.TimeoutError as e:
+                check_deadline()
+                logger.warning(f"[TIMEOUT] Press release fetch: {source_url.url}: {e}")
+                press_items = []
             results.extend(press_items)
             
             await asyncio.sleep(1)
@@ -316,24 +420,40 @@ class ResearchAgent:
         item: Dict,
         start_date: date,
         end_date: date,
+        seen: Optional[set] = None,
     ) -> Optional[Article]:
-        """記事を取得して処理"""
+        """
+        記事を取得して処理
+
+        Args:
+            seen: 処理済みURLの集合（指定時は正規URLでの重複もチェック）
+        """
         url = item.get("url", "")
         normalized_url = item.get("normalized_url", url)
         title = item.get("title", "")
 
-        # 記事内容を取得（タイムアウト付き）
-        try:
-            article_data = await asyncio.wait_for(
-                self.article_fetcher.fetch_content(url),
-                timeout=self.FETCH_TIMEOUT
-            )
-        except asyncio.TimeoutError:
-            logger.warning(f"[TIMEOUT] Article fetch timed out after {self.FETCH_TIMEOUT}s: {url}")
-            article_data = None
-        except Exception as e:
-            logger.info(f"[ERROR] Article fetch failed: {url} - {e}")
-            article_data = None
+        # 記事内容を取得（同一ジョブ内で取得済みのURLはキャッシュを再利用）
+        cache_key = item.get("canonical_url") or normalized_url
+        article_data = await self.fetch_cache.get_or_fetch(
+            cache_key, lambda: self._fetch_article_data(url)
+        )
+
+        # リダイレクト先・canonical URLで重複チェック（保存済み記事の別名ならLLM処理の前に打ち切る）
+        if article_data:
+            canonical_url = await self._resolve_canonical_url(db, company, url, normalized_url, article_data)
+            if canonical_url != normalized_url:
+                if canonical_url != item.get("canonical_url"):
+                    if seen is not None:
+                        if canonical_url in seen:
+                            logger.info(f"[SKIP] Duplicate of {canonical_url} in this run: {url}")
+                            return None
+                        seen.add(canonical_url)
+                    if await crud_article.get_article_by_url(db, canonical_url):
+                        logger.info(f"[SKIP] Alias of stored article {canonical_url}: {url}")
+                        return None
+                normalized_url = canonical_url
+                # 別の企業の検索結果に正規URLで現れた場合も再取得しない
+                self.fetch_cache.put(canonical_url, article_data)
 
         # AI関連性チェック（本文優先、失敗時はタイトル+スニペット）
         content = ""
@@ -341,16 +461,18 @@ class ResearchAgent:
             # 本文取得成功 → 本文でAI判定（厳密、タイムアウト付き）
             content = article_data.get("content", "")
             try:
-                is_ai_related = await asyncio.wait_for(
+                is_ai_related = await run_with_deadline(
                     self.ai_classifier.classify_article_content(
                         title=article_data.get("title", title),
                         content=content,
                         debug=False,
                     ),
-                    timeout=self.LLM_TIMEOUT
+                    "llm",
+                    self.llm_time_budget,
                 )
-            except asyncio.TimeoutError:
-                logger.warning(f"[TIMEOUT] AI classification timed out after {self.LLM_TIMEOUT}s: {title}")
+            except asyncio.TimeoutError as e:
+                check_deadline()
+                logger.warning(f"[TIMEOUT] AI classification timed out ({e}): {title}")
                 is_ai_related = None
             except Exception as e:
                 logger.info(f"[ERROR] AI classification failed: {title} - {e}")
@@ -366,15 +488,17 @@ class ResearchAgent:
             logger.info(f"[INFO] Content fetch failed, using title+snippet for AI check: {url}")
             snippet = item.get("snippet", "")
             try:
-                is_ai_related = await asyncio.wait_for(
+                is_ai_related = await run_with_deadline(
                     self.ai_classifier.classify_text(
                         title=title,
                         snippet=snippet,
                     ),
-                    timeout=self.LLM_TIMEOUT
+                    "llm",
+                    self.llm_time_budget,
                 )
-            except asyncio.TimeoutError:
-                logger.warning(f"[TIMEOUT] AI classification (title+snippet) timed out after {self.LLM_TIMEOUT}s: {title}")
+            except asyncio.TimeoutError as e:
+                check_deadline()
+                logger.warning(f"[TIMEOUT] AI classification (title+snippet) timed out ({e}): {title}")
                 is_ai_related = None
             except Exception as e:
                 logger.info(f"[ERROR] AI classification (title+snippet) failed: {title} - {e}")
@@ -398,21 +522,38 @@ class ResearchAgent:
                 }
 
         # 日付検証（発行日不明は保存しない）
-        pub_date = article_data.get("published_date") or item.get("published_date")
+        # 構造化メタデータ等から得た日付は信頼度 high/medium ならそのまま採用し、
+        # low（更新日時等の代替値）は正規表現・LLM抽出のいずれでも取れなかった場合のみ使う
+        pub_date = None
+        fallback_date = None
+        if article_data.get("published_date"):
+            if article_data.get("date_confidence") == "low":
+                fallback_date = article_data["published_date"]
+            else:
+                pub_date = article_data["published_date"]
+                if article_data.get("date_source"):
+                    logger.info(
+                        f"[DATE] {pub_date} from {article_data['date_source']} "
+                        f"({article_data.get('date_confidence')}): {title}"
+                    )
+        pub_date = pub_date or item.get("published_date")
         if not pub_date:
             try:
-                pub_date = await asyncio.wait_for(
+                pub_date = await run_with_deadline(
                     self.date_extractor.extract_date(
                         title=article_data.get("title", title),
                         snippet=item.get("snippet", ""),
                         url=url,
                         content=content,
+                        fallback_date=fallback_date,
                     ),
-                    timeout=self.LLM_TIMEOUT
+                    "llm",
+                    self.llm_time_budget,
                 )
-            except asyncio.TimeoutError:
-                logger.warning(f"[TIMEOUT] Date extraction timed out after {self.LLM_TIMEOUT}s: {title}")
-                pub_date = None
+            except asyncio.TimeoutError as e:
+                check_deadline()
+                logger.warning(f"[TIMEOUT] Date extraction timed out ({e}): {title}")
+                pub_date = fallback_date
         if not pub_date:
             # 日付が取得できない場合は今日の日付を使用
             from datetime import datetime
@@ -432,31 +573,35 @@ class ResearchAgent:
         
         # LLMで要約
         try:
-            summary_data = await asyncio.wait_for(
+            summary_data = await run_with_deadline(
                 self.summarizer.summarize(
                     title=article_data.get("title", title),
                     content=content,
                     company_name=company.name,
                 ),
-                timeout=self.LLM_TIMEOUT
+                "llm",
+                self.llm_time_budget,
             )
-        except asyncio.TimeoutError:
-            logger.warning(f"[TIMEOUT] Summarization timed out after {self.LLM_TIMEOUT}s: {title}")
+        except asyncio.TimeoutError as e:
+            check_deadline()
+            logger.warning(f"[TIMEOUT] Summarization timed out ({e}): {title}")
             summary_data = None
         
         # LLMで分類
         try:
-            classify_data = await asyncio.wait_for(
+            classify_data = await run_with_deadline(
                 self.classifier.classify(
                     title=article_data.get("title", title),
                     content=content,
                     summary=summary_data.get("summary", "") if summary_data else "",
                     company_name=company.name,
                 ),
-                timeout=self.LLM_TIMEOUT
+                "llm",
+                self.llm_time_budget,
             )
-        except asyncio.TimeoutError:
-            logger.warning(f"[TIMEOUT] Classification timed out after {self.LLM_TIMEOUT}s: {title}")
+        except asyncio.TimeoutError as e:
+            check_deadline()
+            logger.warning(f"[TIMEOUT] Classification timed out ({e}): {title}")
             classify_data = None
 
         # 要約を整形
@@ -485,12 +630,6 @@ class ResearchAgent:
         from app.schemas import ArticleCreate
         from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 
-        # タグを500文字以内に切り詰め
-        tags_str = ",".join(classify_data.get("tags", []))
-        if len(tags_str) > 500:
-            logger.warning(f"[WARN] Tags too long ({len(tags_str)} chars), truncating to 500: {title}")
-            tags_str = tags_str[:500]
-
         # タイトルを500文字以内に切り詰め
         article_title = article_data.get("title", title)
         if len(article_title) > 500:
@@ -506,7 +645,7 @@ class ResearchAgent:
             published_date=pub_date,
             category=classify_data.get("category", "その他"),
             business_area=classify_data.get("business_area", "その他"),
-            tags=tags_str,
+            tags=classify_data.get("tags", []),
             is_inappropriate=is_inappropriate,
             inappropriate_reason=inappropriate_reason,
         )
@@ -540,84 +679,68 @@ class ResearchAgent:
             await db.refresh(company)
             return None
 
-    def _is_list_article_url(self, url: str) -> bool:
-        """リスト記事・まとめ記事のURLパターンを検出
-
-        実際のデータベース分析から抽出したパターンに基づく
-
-        Args:
-            url: チェック対象URL
-
-        Returns:
-            リスト記事の場合True
+    async def _fetch_article_data(self, url: str) -> Optional[Dict]:
         """
-        if not url:
-            return False
-
-        url_lower = url.lower()
-
-        # 実データから抽出したリスト記事のパターン
-        list_patterns = [
-            '/tags/',       # https://www.ncblibrary.com/tags/247
-            '/tag/',        # https://tech.eu/tag/agentic-ai
-            '/theme/',      # https://xtech.nikkei.com/theme/ai
-            '/keyword/',    # https://www.yomiuri.co.jp/keyword/135446
-            '/category/',   # https://mobiili.fi/category/muut
-            '/corner/',     # https://markezine.jp/article/corner/1164
-            '/case',        # https://www.consulting-headwaters.co.jp/case (事例一覧)
-            '/events',      # https://whatson.cityofsydney.nsw.gov.au/events
-            '/insights',    # https://www.expat.hsbc.com/wealth/insights
-        ]
+        記事内容を取得（タイムアウト付き）
 
-        for pattern in list_patterns:
-            if pattern in url_lower:
-                return True
+        Returns:
+            記事データ。恒久的な失敗（404等）はNone
 
-        # ドメインルート（パスが / のみ、またはパスなし）
-        # 例: https://www.headwaters.co.jp/, https://made-in-europe.nu/
+        Raises:
+            TransientFetchError: タイムアウト・5xx・サーキットブレーカー等による一時的な失敗
+                （ジョブ内キャッシュに残さず、別の企業で現れたときに再取得する）
+        """
         try:
-            parts = urlsplit(url)
-            path = parts.path or "/"
-            # ルートドメインまたは / のみ
-            if path == "/" or path == "":
-                return True
-        except ValueError:
-            pass
-
-        return False
-
-    def _is_unreliable_source(self, url: str) -> bool:
-        """信頼性の低いソースドメインを検出
-
-        個人ブログなど信頼性が不明なソースをフィルタ
-        実データから抽出
+            return await run_with_deadline(
+                self.article_fetcher.fetch_content(url, raise_errors=True),
+                "fetch",
+                self.fetch_time_budget,
+            )
+        except asyncio.TimeoutError as e:
+            check_deadline()
+            logger.warning(f"[TIMEOUT] Article fetch timed out ({e}): {url}")
+            raise TransientFetchError(str(e)) from e
+        except Exception as e:
+            logger.info(f"[ERROR] Article fetch failed: {url} - {e}")
+            if ArticleFetcher.is_permanent_failure(e):
+                return None
+            raise TransientFetchError(str(e)) from e
 
-        Args:
-            url: チェック対象URL
+    async def _resolve_canonical_url(
+        self,
+        db: AsyncSession,
+        company: Company,
+        url: str,
+        normalized_url: str,
+        article_data: Dict,
+    ) -> str:
+        """
+        リダイレクト先・<link rel="canonical">から正規URLを決定し、別名として記録
 
         Returns:
-            信頼性が低い場合True
+            正規化済みの正規URL（解決できない場合は normalized_url）
         """
-        if not url:
-            return False
+        final_url = self._normalize_url(article_data.get("final_url") or "")
+        canonical_url = self._normalize_url(article_data.get("canonical_url") or "")
+        target = canonical_url or final_url
+        if not target or target == normalized_url:
+            return normalized_url
 
+        source = "canonical" if canonical_url else "redirect"
         try:
-            parts = urlsplit(url)
-            domain = parts.netloc.lower()
-        except ValueError:
-            return False
-
-        # 実データから確認された個人ブログドメイン
-        unreliable_domains = [
-            'note.com',    # 日本の個人ブログ (10件確認)
-            'medium.com',  # 個人ブログ (10件確認)
-        ]
-
-        for unreliable in unreliable_domains:
-            if unreliable in domain:
-                return True
-
-        return False
+            await crud_url_alias.save_url_aliases(
+                db,
+                [normalized_url, self._normalize_url(url), final_url],
+                target,
+                source,
+                get_settings().url_alias_ttl_days,
+            )
+        except SQLAlchemyError as e:
+            logger.warning(f"[WARN] Failed to save URL aliases for {url}: {e}")
+            await db.rollback()
+            await db.refresh(company)
+        logger.info(f"[ALIAS] {normalized_url} -> {target} ({source})")
+        return target
 
     def _normalize_url(self, url: str) -> str:
         """重複排除用にURLを正規化（追跡パラメータ除去 + フラグメント削除）"""
@@ -0,0 +1,185 @@
+"""DuckDuckGo検索結果のローカルキャッシュ
+
+同じクエリ（企業名＋リージョン別キーワード）は実行・再実行・スクリプトのたびに
+繰り返し発行されるため、正規化済みの検索結果を SQLite に保存して再利用する。
+
+- キー: (クエリ, リージョン, timelimit, 取得件数)
+- TTL内: キャッシュを返す（DuckDuckGoにはアクセスしない）
+- TTL切れ〜stale期限内: 古い結果をすぐ返し、バックグラウンドで再検索して更新（stale-while-revalidate）
+- 再検索に失敗した場合も stale期限内であれば古い結果を返す
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from app.config import get_settings
+
+FRESH = "fresh"
+STALE = "stale"
+
+
+def normalize_query(query: str) -> str:
+    """空白の違いだけのクエリを同一視する"""
+    return " ".join((query or "").split())
+
+
+def make_cache_key(query: str, region: str, timelimit: Optional[str], num_results: int) -> str:
+    raw = json.dumps(
+        [normalize_query(query), (region or "wt-wt").lower(), timelimit or "", num_results],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class SearchCache:
+    """SQLiteに保存する検索結果キャッシュ"""
+
+    def __init__(self, path: str, ttl: float, stale_ttl: float):
+        """
+        Args:
+            path: SQLiteファイルのパス
+            ttl: 新鮮とみなす秒数
+            stale_ttl: TTL切れ後も古い結果として返してよい秒数
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=5, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS search_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    query TEXT NOT NULL,
+                    region TEXT NOT NULL,
+                    timelimit TEXT,
+                    num_results INTEGER NOT NULL,
+                    results TEXT NOT NULL,
+                    fetched_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_search_cache_fetched_at ON search_cache(fetched_at)")
+            self._conn = conn
+        return self._conn
+
+    def get(
+        self,
+        query: str,
+        region: str,
+        timelimit: Optional[str],
+        num_results: int,
+    ) -> Optional[Tuple[List[Dict], str]]:
+        """
+        キャッシュを取得
+
+        Returns:
+            (検索結果, FRESH または STALE)。ない・stale期限切れの場合はNone
+        """
+        key = make_cache_key(query, region, timelimit, num_results)
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT results, fetched_at FROM search_cache WHERE cache_key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"[WARN] Search cache read failed: {e}")
+            return None
+        if row is None:
+            return None
+
+        age = time.time() - row[1]
+        if age < self.ttl:
+            state = FRESH
+        elif age < self.ttl + self.stale_ttl:
+            state = STALE
+        else:
+            return None
+        return json.loads(row[0]), state
+
+    def set(
+        self,
+        query: str,
+        region: str,
+        timelimit: Optional[str],
+        num_results: int,
+        results: List[Dict],
+    ) -> None:
+        """検索結果を保存"""
+        key = make_cache_key(query, region, timelimit, num_results)
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO search_cache
+                        (cache_key, query, region, timelimit, num_results, results, fetched_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        key,
+                        normalize_query(query),
+                        (region or "wt-wt").lower(),
+                        timelimit,
+                        num_results,
+                        json.dumps(results, ensure_ascii=False),
+                        time.time(),
+                    ),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"[WARN] Search cache write failed: {e}")
+
+    def purge_expired(self) -> int:
+        """stale期限も過ぎたエントリを削除"""
+        cutoff = time.time() - (self.ttl + self.stale_ttl)
+        try:
+            with self._lock:
+                conn = self._connect()
+                cursor = conn.execute("DELETE FROM search_cache WHERE fetched_at < ?", (cutoff,))
+                conn.commit()
+                return cursor.rowcount
+        except sqlite3.Error as e:
+            print(f"[WARN] Search cache purge failed: {e}")
+            return 0
+
+    def clear(self) -> None:
+        """全エントリを削除"""
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("DELETE FROM search_cache")
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"[WARN] Search cache clear failed: {e}")
+
+
+_cache: Optional[SearchCache] = None
+
+
+def get_search_cache() -> Optional[SearchCache]:
+    """設定に従った共有キャッシュを取得（無効化されている場合はNone）"""
+    global _cache
+    settings = get_settings()
+    if not settings.search_cache_enabled:
+        return None
+    if _cache is None:
+        _cache = SearchCache(
+            settings.search_cache_path,
+            ttl=settings.search_cache_ttl,
+            stale_ttl=settings.search_cache_stale_ttl,
+        )
+        purged = _cache.purge_expired()
+        if purged:
+            print(f"[INFO] Purged {purged} expired search cache entries")
+    return _cache
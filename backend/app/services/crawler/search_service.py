@@ -0,0 +1,122 @@
+"""DuckDuckGo検索の実行基盤
+
+ddgsのDDGSは同期APIのため、専用のスレッドプールで実行する。
+スレッドごとにDDGSセッションを保持して使い回し（接続・エンジンの初期化を省く）、
+全体で共有するレート制限の範囲で複数クエリを同時に実行する。
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from ddgs import DDGS
+
+from app.config import get_settings
+from app.utils.rate_limiter import AsyncRateLimiter
+
+# ワーカースレッドごとのDDGSセッション
+_thread_state = threading.local()
+
+
+def _get_session(max_queries: int) -> DDGS:
+    """ワーカースレッドのDDGSセッションを取得（一定回数使ったら作り直す）"""
+    session = getattr(_thread_state, "session", None)
+    if session is None or _thread_state.queries >= max_queries:
+        session = DDGS()
+        _thread_state.session = session
+        _thread_state.queries = 0
+    _thread_state.queries += 1
+    return session
+
+
+def _discard_session() -> None:
+    """エラー後のセッションは状態が不明なため破棄"""
+    _thread_state.session = None
+
+
+def _run_text_search(
+    query: str,
+    region: str,
+    timelimit: Optional[str],
+    max_results: int,
+    max_queries: int,
+) -> List[Dict]:
+    """ワーカースレッドで検索を実行"""
+    session = _get_session(max_queries)
+    try:
+        return list(
+            session.text(
+                query=query,
+                region=region,
+                safesearch="off",
+                timelimit=timelimit,
+                max_results=max_results,
+            )
+        )
+    except Exception:
+        _discard_session()
+        raise
+
+
+@dataclass(frozen=True)
+class SearchRequest:
+    """検索リクエスト"""
+
+    query: str
+    region: str = "wt-wt"
+    timelimit: Optional[str] = None
+    max_results: int = 10
+
+
+class SearchService:
+    """DDGSセッションプールと共有レート制限で検索を実行する共通クラス"""
+
+    _executor: Optional[ThreadPoolExecutor] = None
+    _rate_limiter: Optional[AsyncRateLimiter] = None
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(
+                max_workers=max(1, get_settings().search_pool_size),
+                thread_name_prefix="ddgs",
+            )
+        return cls._executor
+
+    @classmethod
+    def _get_rate_limiter(cls) -> AsyncRateLimiter:
+        if cls._rate_limiter is None:
+            settings = get_settings()
+            cls._rate_limiter = AsyncRateLimiter(settings.search_rate_per_second, settings.search_rate_burst)
+        return cls._rate_limiter
+
+    @classmethod
+    async def text(cls, request: SearchRequest) -> List[Dict]:
+        """
+        テキスト検索を実行
+
+        Returns:
+            ddgsの検索結果（{title, href, body} のリスト）
+
+        Raises:
+            Exception: ddgsの検索エラー
+        """
+        await cls._get_rate_limiter().acquire()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            cls._get_executor(),
+            _run_text_search,
+            request.query,
+            request.region,
+            request.timelimit,
+            request.max_results,
+            get_settings().search_session_max_queries,
+        )
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """スレッドプールを終了（アプリ終了時）"""
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=False, cancel_futures=True)
+            cls._executor = None
@@ -0,0 +1,363 @@
+"""URLフィルタルールエンジン
+
+記事候補URLに対するフィルタ（リスト記事・信頼性の低いソース等）を
+DBのルール（url_filter_rules）から1つのマッチャーにコンパイルして判定する。
+
+- domain: ドメインのラベル単位の接尾辞木（"medium.com" は medium.com と *.medium.com に一致し、
+  notmedium.com には一致しない）
+- path_prefix: パスの前方一致（文字単位の接頭辞木）
+- path_contains: パスの部分一致（Aho-Corasick法で全パターンを1回の走査で判定）
+- path_regex: パスの正規表現一致（グループを含まないパターンは結合した正規表現で事前判定）
+
+判定はURL長に比例する計算量で済み、ルール数が増えても候補ごとのコストはほぼ一定。
+allow ルールは deny ルールより優先する（特定企業・リージョンでの例外指定用）。
+ルールはバージョン（件数・最終更新日時）が変わったときだけ再コンパイルする。
+"""
+import re
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.crud import url_filter_rule as crud_url_filter_rule
+
+RULE_TYPE_DOMAIN = "domain"
+RULE_TYPE_PATH_PREFIX = "path_prefix"
+RULE_TYPE_PATH_CONTAINS = "path_contains"
+RULE_TYPE_PATH_REGEX = "path_regex"
+RULE_TYPES = (RULE_TYPE_DOMAIN, RULE_TYPE_PATH_PREFIX, RULE_TYPE_PATH_CONTAINS, RULE_TYPE_PATH_REGEX)
+
+ACTION_ALLOW = "allow"
+ACTION_DENY = "deny"
+
+_LEADING_IGNORECASE_FLAG = re.compile(r"^\(\?i+\)")
+
+
+@dataclass(frozen=True)
+class FilterRule:
+    """コンパイル済みマッチャーが保持するルール"""
+
+    id: Optional[int]
+    rule_type: str
+    pattern: str
+    action: str = ACTION_DENY
+    company_id: Optional[int] = None
+    region: Optional[str] = None
+    reason: Optional[str] = None
+
+    def applies_to(self, company_id: Optional[int], region: Optional[str]) -> bool:
+        """企業・リージョンの適用範囲内か"""
+        if self.company_id is not None and self.company_id != company_id:
+            return False
+        if self.region and (region or "").lower() != self.region.lower():
+            return False
+        return True
+
+    @classmethod
+    def from_model(cls, rule) -> "FilterRule":
+        return cls(
+            id=rule.id,
+            rule_type=rule.rule_type,
+            pattern=normalize_pattern(rule.rule_type, rule.pattern),
+            action=rule.action,
+            company_id=rule.company_id,
+            region=rule.region,
+            reason=rule.reason,
+        )
+
+
+# ドメインルート（トップページ）は記事ではないため常に除外（DBルールでは表現しない組み込みルール）
+ROOT_PATH_RULE = FilterRule(
+    id=None,
+    rule_type="root_path",
+    pattern="/",
+    reason="ドメインルート（記事ページではない）",
+)
+
+
+def normalize_pattern(rule_type: str, pattern: str) -> str:
+    """
+    ルールのパターンを正規化・検証
+
+    Raises:
+        ValueError: 不明なルール種別・不正なパターンの場合
+    """
+    if rule_type not in RULE_TYPES:
+        raise ValueError(f"Unknown rule_type: {rule_type}")
+    pattern = (pattern or "").strip()
+    if not pattern:
+        raise ValueError("pattern must not be empty")
+
+    if rule_type == RULE_TYPE_DOMAIN:
+        # "https://www.example.com/path" のような入力もドメイン部分だけにする
+        if "//" in pattern:
+            pattern = urlsplit(pattern).hostname or ""
+        pattern = pattern.lower().strip(".").split("/")[0].split(":")[0]
+        if pattern.startswith("*."):
+            pattern = pattern[2:]
+        if not pattern or " " in pattern:
+            raise ValueError(f"Invalid domain pattern: {pattern}")
+        return pattern
+
+    if rule_type == RULE_TYPE_PATH_REGEX:
+        # 判定は常に大文字・小文字を区別しないため、先頭の (?i) は不要（他の位置の (?i) は結合時にエラーになる）
+        pattern = _LEADING_IGNORECASE_FLAG.sub("", pattern)
+        try:
+            # 他のルールと結合しても壊れないか（インラインのグローバルフラグは先頭以外に置けない）
+            re.compile(f"(?:{pattern})", re.IGNORECASE)
+        except re.error as e:
+            raise ValueError(f"Invalid regex pattern (use scoped flags such as (?i:...) instead of global ones): {e}")
+        if not pattern:
+            raise ValueError("pattern must not be empty")
+        return pattern
+
+    return pattern.lower()
+
+
+class _DomainSuffixTrie:
+    """ドメインのラベルを逆順にたどる接尾辞木"""
+
+    def __init__(self):
+        self.root: Dict = {}
+
+    def add(self, domain: str, rule: FilterRule) -> None:
+        node = self.root
+        for label in reversed(domain.split(".")):
+            node = node.setdefault(label, {})
+        node.setdefault(None, []).append(rule)
+
+    def match(self, host: str) -> List[FilterRule]:
+        hits: List[FilterRule] = []
+        node = self.root
+        for label in reversed(host.split(".")):
+            node = node.get(label)
+            if node is None:
+                break
+            hits.extend(node.get(None, ()))
+        return hits
+
+
+class _PrefixTrie:
+    """文字単位の接頭辞木"""
+
+    def __init__(self):
+        self.root: Dict = {}
+
+    def add(self, prefix: str, rule: FilterRule) -> None:
+        node = self.root
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node.setdefault(None, []).append(rule)
+
+    def match(self, text: str) -> List[FilterRule]:
+        hits: List[FilterRule] = list(self.root.get(None, ()))
+        node = self.root
+        for char in text:
+            node = node.get(char)
+            if node is None:
+                break
+            hits.extend(node.get(None, ()))
+        return hits
+
+
+class _AhoCorasick:
+    """複数パターンの部分一致を1回の走査で判定するオートマトン"""
+
+    def __init__(self):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[List[FilterRule]] = [[]]
+
+    def add(self, pattern: str, rule: FilterRule) -> None:
+        state = 0
+        for char in pattern:
+            next_state = self.goto[state].get(char)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+                self.goto[state][char] = next_state
+            state = next_state
+        self.output[state].append(rule)
+
+    def build(self) -> None:
+        """失敗遷移を幅優先で構築（パターン追加後に1回呼ぶ）"""
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(char, 0)
+                self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+
+    def match(self, text: str) -> List[FilterRule]:
+        hits: List[FilterRule] = []
+        state = 0
+        for char in text:
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+            if self.output[state]:
+                hits.extend(self.output[state])
+        return hits
+
+
+class CompiledUrlFilter:
+    """ルール一式をコンパイルしたURLマッチャー"""
+
+    def __init__(self, rules: Iterable[FilterRule] = ()):
+        self.domains = _DomainSuffixTrie()
+        self.prefixes = _PrefixTrie()
+        self.contains = _AhoCorasick()
+        self.regex_rules: List[Tuple[re.Pattern, FilterRule]] = []
+        # 結合した事前判定に含めず、常に個別に評価する正規表現ルール
+        self.standalone_regex_rules: List[Tuple[re.Pattern, FilterRule]] = []
+        self.rule_count = 0
+
+        for rule in rules:
+            if rule.rule_type == RULE_TYPE_DOMAIN:
+                self.domains.add(rule.pattern, rule)
+            elif rule.rule_type == RULE_TYPE_PATH_PREFIX:
+                self.prefixes.add(rule.pattern, rule)
+            elif rule.rule_type == RULE_TYPE_PATH_CONTAINS:
+                self.contains.add(rule.pattern, rule)
+            elif rule.rule_type == RULE_TYPE_PATH_REGEX:
+                try:
+                    compiled = re.compile(rule.pattern, re.IGNORECASE)
+                except re.error as e:
+                    print(f"[WARN] Skipping invalid URL filter regex (id={rule.id}): {e}")
+                    continue
+                # グループを含むパターンは結合すると番号付き後方参照がずれ、名前付きグループが重複しうる
+                if compiled.groups:
+                    self.standalone_regex_rules.append((compiled, rule))
+                else:
+                    self.regex_rules.append((compiled, rule))
+            else:
+                continue
+            self.rule_count += 1
+
+        self.contains.build()
+        # どれか1つでも一致するかを1本の正規表現で事前判定し、一致した場合のみ個別に評価する
+        self.combined_regex: Optional[re.Pattern] = None
+        if self.regex_rules:
+            try:
+                self.combined_regex = re.compile(
+                    "|".join(f"(?:{p.pattern})" for p, _ in self.regex_rules), re.IGNORECASE
+                )
+            except re.error as e:
+                # 結合できないパターン（インラインのグローバルフラグ等）がある場合はすべて個別に評価する
+                print(f"[WARN] Could not combine URL filter regexes, matching them one by one: {e}")
+                self.standalone_regex_rules.extend(self.regex_rules)
+                self.regex_rules = []
+
+    def match(
+        self,
+        url: str,
+        company_id: Optional[int] = None,
+        region: Optional[str] = None,
+    ) -> Optional[FilterRule]:
+        """
+        URLを除外すべきか判定
+
+        Args:
+            url: チェック対象URL
+            company_id: 処理中の企業ID（企業別ルールの適用範囲）
+            region: 処理中の検索リージョン（リージョン別ルールの適用範囲）
+
+        Returns:
+            除外の根拠となったルール。除外しない場合はNone
+        """
+        if not url:
+            return None
+        try:
+            parts = urlsplit(url)
+            host = (parts.hostname or "").rstrip(".")
+        except ValueError:
+            return None
+        path = parts.path or "/"
+        path_lower = path.lower()
+
+        hits = self.domains.match(host)
+        hits.extend(self.prefixes.match(path_lower))
+        hits.extend(self.contains.match(path_lower))
+        if self.combined_regex is not None and self.combined_regex.search(path):
+            hits.extend(rule for pattern, rule in self.regex_rules if pattern.search(path))
+        hits.extend(rule for pattern, rule in self.standalone_regex_rules if pattern.search(path))
+
+        denied: Optional[FilterRule] = None
+        for rule in hits:
+            if not rule.applies_to(company_id, region):
+                continue
+            if rule.action == ACTION_ALLOW:
+                return None
+            if denied is None:
+                denied = rule
+
+        if denied is None and path == "/":
+            denied = ROOT_PATH_RULE
+        return denied
+
+
+class UrlFilterRegistry:
+    """コンパイル済みマッチャーのキャッシュ（ルール変更時のみ再コンパイル）"""
+
+    _matcher: Optional[CompiledUrlFilter] = None
+    _version: Optional[Tuple] = None
+    _checked_at: float = 0.0
+
+    @classmethod
+    async def get_matcher(cls, db: AsyncSession) -> CompiledUrlFilter:
+        """
+        最新のルールでコンパイルされたマッチャーを取得
+
+        バージョンの確認は url_filter_reload_interval 秒に1回まで。
+        """
+        interval = get_settings().url_filter_reload_interval
+        now = time.monotonic()
+        if cls._matcher is not None and now - cls._checked_at < interval:
+            return cls._matcher
+
+        try:
+            version = await crud_url_filter_rule.get_url_filter_rules_version(db)
+            if cls._matcher is None or version != cls._version:
+                rules = await crud_url_filter_rule.get_active_url_filter_rules(db)
+                compiled = []
+                for rule in rules:
+                    try:
+                        compiled.append(FilterRule.from_model(rule))
+                    except ValueError as e:
+                        print(f"[WARN] Skipping invalid URL filter rule (id={rule.id}): {e}")
+                try:
+                    matcher = CompiledUrlFilter(compiled)
+                except (re.error, ValueError, RecursionError) as e:
+                    # コンパイルできないルールがあっても直前のマッチャー（なければ組み込みルールのみ）で判定を続ける
+                    print(f"[WARN] Failed to compile URL filter rules, keeping the previous rules: {e}")
+                    if cls._matcher is None:
+                        cls._matcher = CompiledUrlFilter()
+                else:
+                    cls._matcher = matcher
+                    cls._version = version
+                    print(f"[INFO] URL filter compiled: {cls._matcher.rule_count} rules")
+        except SQLAlchemyError as e:
+            # テーブル未作成等でもクロール自体は止めない（組み込みルールのみで判定）
+            print(f"[WARN] Failed to load URL filter rules: {e}")
+            await db.rollback()
+            if cls._matcher is None:
+                cls._matcher = CompiledUrlFilter()
+
+        cls._checked_at = now
+        return cls._matcher
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """次回取得時にバージョンを確認させる（API経由でルールを変更したとき）"""
+        cls._checked_at = 0.0
@@ -0,0 +1,19 @@
+from app.services.export.writers import (
+    EXPORT_FORMATS,
+    ExportColumn,
+    export_filename,
+    export_media_type,
+    iter_export,
+)
+from app.services.export.xlsx import XlsxStreamWriter
+from app.services.export.articles import article_export_columns
+
+__all__ = [
+    "EXPORT_FORMATS",
+    "ExportColumn",
+    "export_filename",
+    "export_media_type",
+    "iter_export",
+    "XlsxStreamWriter",
+    "article_export_columns",
+]
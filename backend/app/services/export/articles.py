@@ -0,0 +1,30 @@
+"""記事エクスポートの列定義（crud.article.iter_articles_for_export の行から取り出す）"""
+from typing import List
+
+from app.services.export.writers import ExportColumn
+from app.utils.tags import format_tags
+
+_ARTICLE_COLUMNS = [
+    ExportColumn("id", "ID", lambda row: row.id),
+    ExportColumn("company_id", "企業ID", lambda row: row.company_id),
+    ExportColumn("company_name", "企業名", lambda row: row.company_name),
+    ExportColumn("country", "国", lambda row: row.country),
+    ExportColumn("title", "タイトル", lambda row: row.title),
+    ExportColumn("url", "URL", lambda row: row.url),
+    ExportColumn("published_date", "公開日", lambda row: row.published_date),
+    ExportColumn("category", "カテゴリ", lambda row: row.category),
+    ExportColumn("business_area", "ビジネス領域", lambda row: row.business_area),
+    ExportColumn("tags", "タグ", lambda row: format_tags(row.tags)),
+    ExportColumn("summary", "サマリー", lambda row: row.summary),
+    ExportColumn("is_reviewed", "確認済み", lambda row: row.is_reviewed),
+    ExportColumn("created_at", "登録日時", lambda row: row.created_at),
+]
+
+_CONTENT_COLUMN = ExportColumn("content", "本文", lambda row: row.content)
+
+
+def article_export_columns(include_content: bool = False) -> List[ExportColumn]:
+    """エクスポートする列（本文は指定時のみ）"""
+    if include_content:
+        return _ARTICLE_COLUMNS + [_CONTENT_COLUMN]
+    return list(_ARTICLE_COLUMNS)
@@ -0,0 +1,141 @@
+"""行データを CSV / JSON Lines / XLSX のバイト列に逐次変換
+
+行はサーバー側カーソルから少しずつ受け取り、変換したバイト列をそのままレスポンスに流す。
+全行をメモリに載せないため、件数によらずメモリ使用量は一定。
+"""
+import csv
+import io
+import json
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Callable, Iterable, List, NamedTuple, Optional, Sequence
+
+from app.services.export.xlsx import XlsxStreamWriter
+
+EXPORT_FORMATS = ("csv", "jsonl", "xlsx")
+
+_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "jsonl": "application/x-ndjson; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+# この行数ごとにまとめてレスポンスに書き出す
+EXPORT_FLUSH_ROWS = 200
+
+
+class ExportColumn(NamedTuple):
+    """出力する列"""
+
+    # JSON Lines のキー
+    key: str
+    # CSV / XLSX の見出し
+    label: str
+    # 行から値を取り出す関数
+    getter: Callable[[Any], Any]
+
+
+def export_media_type(fmt: str) -> str:
+    return _MEDIA_TYPES[fmt]
+
+
+def export_filename(prefix: str, fmt: str) -> str:
+    return f"{prefix}_{datetime.now().strftime('%Y%m%d%H%M%S')}.{fmt}"
+
+
+async def iter_export(
+    fmt: str,
+    columns: Sequence[ExportColumn],
+    rows: AsyncIterator[Any],
+    sheet_name: str = "Sheet1",
+) -> AsyncIterator[bytes]:
+    """
+    行を指定形式のバイト列として順に返す
+
+    Args:
+        fmt: "csv" / "jsonl" / "xlsx"
+        columns: 出力する列
+        rows: 行の非同期イテレータ（サーバー側カーソル等）
+
+    Raises:
+        ValueError: 不明な形式
+    """
+    if fmt == "csv":
+        chunks = _iter_csv(columns, rows)
+    elif fmt == "jsonl":
+        chunks = _iter_jsonl(columns, rows)
+    elif fmt == "xlsx":
+        chunks = _iter_xlsx(columns, rows, sheet_name)
+    else:
+        raise ValueError(f"Unknown export format: {fmt}")
+    async for chunk in chunks:
+        yield chunk
+
+
+async def _iter_csv(columns: Sequence[ExportColumn], rows: AsyncIterator[Any]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # Excel で文字化けしないよう BOM を付ける
+    buffer.write("\ufeff")
+    writer.writerow([column.label for column in columns])
+    count = 0
+    async for row in rows:
+        writer.writerow([_format_text(column.getter(row)) for column in columns])
+        count += 1
+        if count % EXPORT_FLUSH_ROWS == 0:
+            yield _drain(buffer).encode("utf-8")
+    yield _drain(buffer).encode("utf-8")
+
+
+async def _iter_jsonl(columns: Sequence[ExportColumn], rows: AsyncIterator[Any]) -> AsyncIterator[bytes]:
+    lines: List[str] = []
+    async for row in rows:
+        record = {column.key: _json_value(column.getter(row)) for column in columns}
+        lines.append(json.dumps(record, ensure_ascii=False))
+        if len(lines) >= EXPORT_FLUSH_ROWS:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+            lines = []
+    if lines:
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+async def _iter_xlsx(
+    columns: Sequence[ExportColumn],
+    rows: AsyncIterator[Any],
+    sheet_name: str,
+) -> AsyncIterator[bytes]:
+    writer = XlsxStreamWriter(sheet_name=sheet_name)
+    writer.write_row([column.label for column in columns])
+    count = 0
+    async for row in rows:
+        writer.write_row([column.getter(row) for column in columns])
+        count += 1
+        if count % EXPORT_FLUSH_ROWS == 0:
+            chunk = writer.drain()
+            if chunk:
+                yield chunk
+    yield writer.close()
+
+
+def _drain(buffer: io.StringIO) -> str:
+    value = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return value
+
+
+def _format_text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def _json_value(value: Any) -> Optional[Any]:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Iterable) and not isinstance(value, (str, bytes, dict)):
+        return list(value)
+    return value
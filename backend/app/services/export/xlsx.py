@@ -0,0 +1,190 @@
+"""ストリーミング書き込みの XLSX ライター
+
+XLSX は XML ファイル群の ZIP。ZIP をシーク不可の出力に書く（各エントリの後にデータ記述子を置く）ことで、
+ワークシートの XML を行ごとに圧縮しながら、書き込んだ分のバイト列をすぐに取り出せる。
+文字列はセル内に直接書く（inlineStr）ため共有文字列表を持たず、メモリ使用量は行数によらず一定。
+"""
+import re
+import zipfile
+from datetime import date, datetime
+from typing import Any, List, Sequence
+from xml.sax.saxutils import escape
+
+# Excel の1セルの最大文字数
+XLSX_MAX_CELL_CHARS = 32767
+# Excel の日付シリアル値の起点（1900年うるう年バグを考慮した 1899-12-30）
+_EXCEL_EPOCH = date(1899, 12, 30)
+# XML 1.0 で使えない制御文字
+_ILLEGAL_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+# シート名に使えない文字
+_ILLEGAL_SHEET_CHARS = re.compile(r"[\[\]:*?/\\]")
+
+# cellXfs のインデックス
+_STYLE_DATE = 1
+_STYLE_DATETIME = 2
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '</Types>'
+)
+
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    '</Relationships>'
+)
+
+# 0: 標準 / 1: 日付（yyyy-mm-dd） / 2: 日時（yyyy-mm-dd hh:mm:ss）
+_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<numFmts count="2">'
+    '<numFmt numFmtId="164" formatCode="yyyy-mm-dd"/>'
+    '<numFmt numFmtId="165" formatCode="yyyy-mm-dd hh:mm:ss"/>'
+    '</numFmts>'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="3">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '<xf numFmtId="165" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '</cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+_SHEET_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    # 見出し行を固定
+    '<sheetViews><sheetView workbookViewId="0">'
+    '<pane ySplit="1" topLeftCell="A2" activePane="bottomLeft" state="frozen"/>'
+    '</sheetView></sheetViews>'
+    '<sheetData>'
+)
+_SHEET_FOOTER = '</sheetData></worksheet>'
+
+
+class _ChunkBuffer:
+    """ZipFile の出力先。書き込まれたバイト列をため、drain で取り出す（シーク不可）"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class XlsxStreamWriter:
+    """
+    1シートの XLSX を行ごとに書き込み、生成済みのバイト列を順に取り出す
+
+    使い方:
+        writer = XlsxStreamWriter()
+        writer.write_row(["見出し", ...])
+        writer.write_row([...]); chunk = writer.drain()  # 任意のタイミングで取り出す
+        last_chunk = writer.close()
+    """
+
+    def __init__(self, sheet_name: str = "Sheet1"):
+        self._buffer = _ChunkBuffer()
+        self._zip = zipfile.ZipFile(self._buffer, mode="w", compression=zipfile.ZIP_DEFLATED)
+        self._zip.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        self._zip.writestr("_rels/.rels", _ROOT_RELS)
+        self._zip.writestr("xl/workbook.xml", _workbook_xml(sheet_name))
+        self._zip.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS)
+        self._zip.writestr("xl/styles.xml", _STYLES)
+        # 行数が多い場合に4GBを超えてもよいよう ZIP64 で書く
+        self._sheet = self._zip.open("xl/worksheets/sheet1.xml", mode="w", force_zip64=True)
+        self._sheet.write(_SHEET_HEADER.encode("utf-8"))
+        self._closed = False
+
+    def write_row(self, values: Sequence[Any]) -> None:
+        cells = "".join(_cell_xml(value) for value in values)
+        self._sheet.write(f"<row>{cells}</row>".encode("utf-8"))
+
+    def drain(self) -> bytes:
+        """これまでに生成された ZIP のバイト列を取り出す"""
+        return self._buffer.drain()
+
+    def close(self) -> bytes:
+        """シートと ZIP を閉じ、残りのバイト列（中央ディレクトリを含む）を返す"""
+        if not self._closed:
+            self._sheet.write(_SHEET_FOOTER.encode("utf-8"))
+            self._sheet.close()
+            self._zip.close()
+            self._closed = True
+        return self._buffer.drain()
+
+
+def _workbook_xml(sheet_name: str) -> str:
+    name = _ILLEGAL_SHEET_CHARS.sub("_", sheet_name)[:31] or "Sheet1"
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        f'<sheets><sheet name="{escape(name, {chr(34): "&quot;"})}" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>'
+    )
+
+
+def _cell_xml(value: Any) -> str:
+    """セル1つ分の XML（位置 r は省略し、書いた順に A, B, C... とする）"""
+    if value is None:
+        return "<c/>"
+    if isinstance(value, bool):
+        return f'<c t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f"<c><v>{value}</v></c>"
+    if isinstance(value, datetime):
+        serial = _excel_serial(value)
+        return f'<c s="{_STYLE_DATETIME}"><v>{serial}</v></c>'
+    if isinstance(value, date):
+        return f'<c s="{_STYLE_DATE}"><v>{(value - _EXCEL_EPOCH).days}</v></c>'
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{_text(value)}</t></is></c>'
+
+
+def _excel_serial(value: datetime) -> float:
+    delta = value.replace(tzinfo=None) - datetime(1899, 12, 30)
+    return delta.days + (delta.seconds + delta.microseconds / 1_000_000) / 86400
+
+
+def _text(value: Any) -> str:
+    text = _ILLEGAL_XML_CHARS.sub("", str(value))
+    return escape(text[:XLSX_MAX_CELL_CHARS])
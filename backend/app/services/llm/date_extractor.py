@@ -1,10 +1,10 @@
 from typing import Optional
 from datetime import date
 import json
-import re
 
 from app.services.llm.ollama_client import OllamaClient
 from app.services.llm.relevance import AiRelevanceClassifier
+from app.utils.date_scanner import find_date
 
 
 class DateExtractor:
@@ -20,6 +20,7 @@ class DateExtractor:
         snippet: str = "",
         url: str = "",
         content: str = "",
+        fallback_date: Optional[date] = None,
     ) -> Optional[date]:
         """
         タイトル・スニペット・URL・コンテンツから公開日を抽出
@@ -29,6 +30,8 @@ class DateExtractor:
             snippet: スニペット（検索結果の抜粋など）
             url: 記事URL
             content: 記事本文（最初の部分）
+            fallback_date: 正規表現・LLMのいずれでも取れなかった場合に使う代替日付
+                （HTML解析時に得た更新日時等。動的ページでは取得時刻のことが多いため最後の手段）
 
         Returns:
             date object or None
@@ -39,9 +42,9 @@ class DateExtractor:
             if extracted:
                 return extracted
 
-        # LLMで抽出を試みる
+        # LLMで抽出を試みる（LLMが使えない・日付が取れない場合は代替日付）
         if not await self._is_llm_available():
-            return None
+            return fallback_date
 
         payload = {
             "title": title,
@@ -62,7 +65,7 @@ class DateExtractor:
         )
 
         if not response:
-            return None
+            return fallback_date
 
         data = AiRelevanceClassifier().parse_json_object(response)
         if isinstance(data, dict):
@@ -73,28 +76,11 @@ class DateExtractor:
                 except ValueError:
                     pass
 
-        return None
+        return fallback_date
 
     def _extract_date_from_text(self, text: str) -> Optional[date]:
         """正規表現でテキストから日付を抽出"""
-        if not text:
-            return None
-
-        patterns = [
-            r"(\d{4})[/-](\d{1,2})[/-](\d{1,2})",
-            r"(\d{4})年(\d{1,2})月(\d{1,2})日",
-            r"(\d{4})\.(\d{1,2})\.(\d{1,2})",
-            r"(\d{4})(\d{2})(\d{2})",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text)
-            if not match:
-                continue
-            try:
-                return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
-            except ValueError:
-                continue
-        return None
+        return find_date(text)
 
     async def _is_llm_available(self) -> bool:
         """Ollamaが利用可能かチェック"""
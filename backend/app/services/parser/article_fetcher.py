@@ -1,33 +1,149 @@
-from bs4 import BeautifulSoup
-from typing import Dict, Optional
-from datetime import date
+from typing import Dict, NamedTuple, Optional, Tuple
 import asyncio
+from urllib.parse import urljoin, urlsplit
 import httpx
+from lxml import etree
 
+from app.config import get_settings
 from app.services.parser.pdf_extractor import PdfExtractor
+from app.services.parser.content_extractor import extract_main_content, parse_html
+from app.services.parser.metadata_extractor import (
+    extract_published_date,
+    CONFIDENCE_HIGH,
+    CONFIDENCE_MEDIUM,
+)
 from app.utils.http_client import HTTPClient
+from app.utils.http_cache import get_http_cache
 from app.utils.date_parser import DateParser
-from app.utils.retry_handler import retry_async, RetryConfig
-from app.utils.service_error import RetryableError, ErrorCode
+from app.utils.retry_handler import retry_async, RetryConfig, CircuitBreakerRegistry
+from app.utils.service_error import RetryableError, NonRetryableError, CircuitOpenError, ErrorCode
+from app.utils.cpu_executor import CpuExecutor
+
+
+def _select_text(tree, selector: Optional[str]) -> str:
+    """CSSセレクタに最初に一致した要素のテキスト"""
+    if not selector:
+        return ""
+    try:
+        elements = tree.cssselect(selector)
+    except Exception:
+        return ""
+    return " ".join(elements[0].text_content().split()) if elements else ""
+
+
+def parse_article_html(
+    html: bytes,
+    encoding: Optional[str],
+    url: str,
+    config: Dict,
+    last_modified: Optional[str] = None,
+) -> Dict:
+    """
+    HTMLから記事データを抽出（ワーカープロセスで実行）
+
+    Args:
+        html: レスポンスボディ（生のバイト列）
+        encoding: HTTPヘッダー等から得た文字コード（不明ならNone）
+        url: 記事のURL
+        config: サイト別のHTML抽出設定
+        last_modified: HTTPレスポンスのLast-Modifiedヘッダー
+
+    Returns:
+        記事データ {title, content, url, published_date, date_confidence, date_source, canonical_url}
+        （date_confidence が "low" の日付は公開日ではなく更新日時等の代替値。
+        canonical_url は <link rel="canonical"> の href をそのまま返す）
+    """
+    try:
+        tree = parse_html(HTTPClient.decode_html(html, encoding))
+    except (ValueError, etree.ParserError):
+        return {
+            "title": "",
+            "content": "",
+            "url": url,
+            "published_date": None,
+            "date_confidence": None,
+            "date_source": None,
+            "canonical_url": None,
+        }
+
+    # タイトル
+    title = _select_text(tree, config["title_selector"])
+    if not title:
+        title = " ".join((tree.findtext(".//title") or "").split())
+
+    # 日付（構造化メタデータ → 日付要素 → 更新日時等の代替値の順）
+    published_date, date_confidence, date_source = extract_published_date(tree, last_modified)
+    if date_confidence != CONFIDENCE_HIGH:
+        date_text = _select_text(tree, config["date_selector"])
+        selector_date = DateParser.parse(date_text, config["date_format"]) if date_text else None
+        if selector_date and date_confidence != CONFIDENCE_MEDIUM:
+            published_date, date_confidence, date_source = selector_date, CONFIDENCE_MEDIUM, "date_selector"
+
+    # 正規URL（相対URLの解決は呼び出し側で最終URLを基準に行う）
+    canonical_url = None
+    for link in tree.xpath('//link[@rel and @href]'):
+        if "canonical" in link.get("rel", "").lower().split():
+            canonical_url = link.get("href").strip() or None
+            break
+
+    # 本文（サイト別の本文セレクタがあればその範囲内で抽出。ツリーを変更するため最後に行う）
+    root = tree
+    if config.get("content_selector"):
+        try:
+            matched = tree.cssselect(config["content_selector"])
+        except Exception:
+            matched = []
+        if matched:
+            root = matched[0]
+    content = extract_main_content(root)
+
+    return {
+        "title": title,
+        "content": content[:5000],  # 最大5000文字
+        "url": url,
+        "published_date": published_date,
+        "date_confidence": date_confidence,
+        "date_source": date_source,
+        "canonical_url": canonical_url,
+    }
+
+
+class FetchedDocument(NamedTuple):
+    """ダウンロード（またはHTTPキャッシュから読み込み）したレスポンス"""
+
+    kind: str
+    body: bytes
+    final_url: str
+    headers: Dict[str, str]
+    encoding: Optional[str]
+    from_network: bool
 
 
 class ArticleFetcher:
     """記事コンテンツを取得する共通クラス（HTML/PDF両対応）"""
 
+    # 種別判定に使う先頭バイト数
+    SNIFF_BYTES = 1024
+
     def __init__(self):
         self.pdf_extractor = PdfExtractor()
 
+        # 種別ごとのダウンロード上限（バイト）
+        settings = get_settings()
+        self.max_html_bytes = settings.fetch_max_html_bytes
+        self.max_pdf_bytes = settings.fetch_max_pdf_bytes
+
         # サイト別のHTML抽出設定
         self.site_configs = {
             "smbc.co.jp": {
                 "title_selector": "h1, .news-title, .title",
-                "content_selector": "div.news-content, .content, article, main",
+                # 本文はcontent_extractorで推定する（サイト別に範囲を絞る場合のみ指定）
+                "content_selector": "div.news-content",
                 "date_selector": ".date, .news-date, time",
                 "date_format": ["%Y年%m月%d日", "%Y.%m.%d", "%Y/%m/%d"],
             },
             "default": {
                 "title_selector": "h1, .title, .headline",
-                "content_selector": "article, .content, main, .body",
                 "date_selector": ".date, time, .published",
                 "date_format": ["%Y-%m-%d", "%Y年%m月%d日", "%Y.%m.%d", "%Y/%m/%d"],
             }
@@ -40,78 +156,236 @@ class ArticleFetcher:
                 return config
         return self.site_configs["default"]
 
-    async def fetch_content(self, url: str) -> Optional[Dict]:
+    async def fetch_content(self, url: str, raise_errors: bool = False) -> Optional[Dict]:
         """
         記事の詳細を取得（HTML or PDF）- リトライ機構付き
 
         Args:
             url: 記事のURL
+            raise_errors: 取得失敗時に None を返さず例外を送出する
+                （呼び出し側で is_permanent_failure により恒久的な失敗かを判別する場合）
 
         Returns:
-            記事データ {title, content, url, published_date} または None
+            記事データ {title, content, url, published_date, ..., final_url, canonical_url} または None
+            （final_url はリダイレクト後のURL、canonical_url は <link rel="canonical"> の絶対URL）
         """
         # リトライ設定（最大3回、タイムアウトとコネクションエラーのみ）
+        # 同じホストで失敗が続いている場合はサーキットブレーカーで即座に打ち切る
         retry_config = RetryConfig(
             max_attempts=3,
             initial_delay=2.0,
-            retryable_errors=[httpx.TimeoutException, httpx.ConnectError, RetryableError]
+            retryable_errors=[httpx.TimeoutException, httpx.ConnectError, RetryableError],
+            circuit_breaker=CircuitBreakerRegistry.for_url(url),
         )
 
         try:
             return await retry_async(self._fetch_content_internal, retry_config, url)
         except Exception as e:
+            if raise_errors:
+                raise
             print(f"Article fetch error ({url}): {e}")
             return None
 
+    @staticmethod
+    def is_permanent_failure(error: BaseException) -> bool:
+        """
+        再取得しても結果が変わらない失敗か
+
+        404等の4xx（408/429を除く）、非対応の種別、サイズ超過は恒久的な失敗。
+        タイムアウト・接続エラー・5xx/429・サーキットブレーカーによる打ち切り等は一時的な失敗とみなす。
+        """
+        if isinstance(error, httpx.HTTPStatusError):
+            status = error.response.status_code
+            return 400 <= status < 500 and status not in (408, 429)
+        if isinstance(error, NonRetryableError) and not isinstance(error, CircuitOpenError):
+            return error.error_code in (ErrorCode.UNSUPPORTED_CONTENT_TYPE, ErrorCode.CONTENT_TOO_LARGE)
+        return False
+
     async def _fetch_content_internal(self, url: str) -> Optional[Dict]:
         """内部実装: 記事コンテンツ取得"""
         config = self._get_config(url)
 
+        document = await self._fetch_document(url)
+
+        if document.kind == "pdf":
+            content_type = document.headers.get('content-type', '').lower()
+            print(f"Detected PDF: {url} (content-type: {content_type})")
+            result = await self.pdf_extractor.extract_from_bytes(url, document.body)
+            if result:
+                result["final_url"] = document.final_url
+                result["canonical_url"] = None
+            return result
+
+        # HTMLの場合（解析はワーカープロセスで実行）
+        result = await CpuExecutor.run(
+            parse_article_html,
+            document.body,
+            document.encoding,
+            url,
+            config,
+            document.headers.get("last-modified"),
+            service_name="ArticleFetcher",
+            error_code=ErrorCode.HTML_PARSE_ERROR,
+        )
+
+        result["final_url"] = document.final_url
+        result["canonical_url"] = self._resolve_canonical_url(result.get("canonical_url"), document.final_url)
+
+        if document.from_network:
+            await asyncio.sleep(1)
+
+        return result
+
+    async def _fetch_document(self, url: str) -> FetchedDocument:
+        """
+        HTTPキャッシュを考慮してレスポンスを取得
+
+        - 鮮度内のキャッシュがあればネットワークにアクセスしない
+        - 期限切れでも検証子（ETag/Last-Modified）があれば条件付きリクエストで再検証し、
+          304ならキャッシュ済みのボディを使う
+        """
+        cache = get_http_cache()
+        entry = await cache.lookup(url) if cache else None
+        if entry is not None and entry.is_fresh():
+            body = await cache.read_body(entry)
+            if body is not None:
+                print(f"[CACHE] HTTP cache hit: {url}")
+                return FetchedDocument(entry.kind, body, entry.final_url, entry.headers, entry.encoding, False)
+            entry = None
+
         async with HTTPClient.create_client(timeout=30.0) as client:
-            response = await client.get(url)
-            response.raise_for_status()
+            validators = entry.validators() if entry else None
+            kind, body, response = await self._download(client, url, headers=validators)
+            headers = dict(response.headers)
+
+            if kind == "not_modified":
+                cached_body = await cache.read_body(entry)
+                if cached_body is not None:
+                    print(f"[CACHE] HTTP cache revalidated (304): {url}")
+                    entry = await cache.refresh(entry, headers)
+                    return FetchedDocument(
+                        entry.kind, cached_body, entry.final_url, entry.headers, entry.encoding, True
+                    )
+                # キャッシュのボディが読めない場合は条件なしで取り直す
+                kind, body, response = await self._download(client, url)
+                headers = dict(response.headers)
+
+        final_url = str(response.url)
+        if cache is not None:
+            await cache.store(url, final_url, kind, response.charset_encoding, headers, body)
+        return FetchedDocument(kind, body, final_url, headers, response.charset_encoding, True)
+
+    @staticmethod
+    def _resolve_canonical_url(href: Optional[str], final_url: str) -> Optional[str]:
+        """
+        canonicalのhrefを絶対URLに解決
+
+        トップページを指す等、記事の正規URLとして不自然なものは採用しない。
+        """
+        if not href:
+            return None
+        canonical = urljoin(final_url, href)
+        try:
+            canonical_parts = urlsplit(canonical)
+            final_parts = urlsplit(final_url)
+        except ValueError:
+            return None
+        if canonical_parts.scheme not in ("http", "https") or not canonical_parts.netloc:
+            return None
+        # 全ページのcanonicalをトップページにしているサイトがあるため除外
+        if canonical_parts.path in ("", "/") and final_parts.path not in ("", "/"):
+            return None
+        return canonical
+
+    async def _download(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[str, bytes, httpx.Response]:
+        """
+        レスポンスをストリーミングで取得（種別ごとのサイズ上限付き）
+
+        先頭バイトからHTML/PDFを判定し、それ以外の種別は本文を読まずに中断する。
+        PDFは上限を超えた時点で中断し、HTMLは上限までの先頭部分のみを解析に回す。
+
+        Args:
+            headers: 追加のリクエストヘッダー（再検証用の条件付きヘッダー等）
+
+        Returns:
+            (種別 "html" | "pdf" | "not_modified", ボディ, レスポンス)
+
+        Raises:
+            NonRetryableError: 非対応の種別、またはPDFがサイズ上限を超えた場合
+        """
+        async with client.stream("GET", url, headers=headers) as response:
+            if response.status_code == 304 and headers:
+                return "not_modified", b"", response
+            HTTPClient.raise_for_status(response, "ArticleFetcher")
 
             content_type = response.headers.get('content-type', '').lower()
+            chunks = response.aiter_bytes()
+            buffer = bytearray()
 
-            # PDFの場合（複数の条件でチェック）
-            is_pdf = (
-                url.lower().endswith('.pdf') or
-                'application/pdf' in content_type or
-                'pdf' in content_type
-            )
-
-            if is_pdf:
-                print(f"Detected PDF: {url} (content-type: {content_type})")
-                return await self.pdf_extractor.extract_from_bytes(url, response.content)
-
-            # HTMLの場合
-            soup = BeautifulSoup(response.text, "lxml")
-
-            # タイトル
-            title_elem = soup.select_one(config["title_selector"])
-            title = title_elem.get_text(strip=True) if title_elem else ""
-
-            # 本文
-            content_elem = soup.select_one(config["content_selector"])
-            content = ""
-            if content_elem:
-                # スクリプトとスタイルを除去
-                for tag in content_elem.select("script, style, nav, footer, header"):
-                    tag.decompose()
-                content = content_elem.get_text(separator="\n", strip=True)
-
-            # 日付
-            published_date = None
-            date_elem = soup.select_one(config["date_selector"])
-            if date_elem:
-                date_text = date_elem.get_text(strip=True)
-                published_date = DateParser.parse(date_text, config["date_format"])
+            # 種別判定に必要な先頭部分を読む
+            async for chunk in chunks:
+                buffer.extend(chunk)
+                if len(buffer) >= self.SNIFF_BYTES:
+                    break
 
-            await asyncio.sleep(1)
+            kind = self._sniff_content_kind(url, content_type, bytes(buffer[:self.SNIFF_BYTES]))
+            if kind is None:
+                raise NonRetryableError(
+                    service_name="ArticleFetcher",
+                    error_code=ErrorCode.UNSUPPORTED_CONTENT_TYPE,
+                    message=f"Unsupported content type: {content_type or 'unknown'}",
+                    details={"url": url},
+                )
 
-            return {
-                "title": title,
-                "content": content[:5000],  # 最大5000文字
-                "url": url,
-                "published_date": published_date,
-            }
+            limit = self.max_pdf_bytes if kind == "pdf" else self.max_html_bytes
+            declared = response.headers.get('content-length', '')
+            if kind == "pdf" and declared.isdigit() and int(declared) > limit:
+                raise NonRetryableError(
+                    service_name="ArticleFetcher",
+                    error_code=ErrorCode.CONTENT_TOO_LARGE,
+                    message=f"PDF too large: {declared} bytes (limit {limit})",
+                    details={"url": url},
+                )
+
+            if len(buffer) <= limit:
+                async for chunk in chunks:
+                    buffer.extend(chunk)
+                    if len(buffer) > limit:
+                        break
+
+            if len(buffer) > limit:
+                if kind == "pdf":
+                    raise NonRetryableError(
+                        service_name="ArticleFetcher",
+                        error_code=ErrorCode.CONTENT_TOO_LARGE,
+                        message=f"PDF exceeded {limit} bytes",
+                        details={"url": url},
+                    )
+                # HTMLは先頭部分だけで本文・メタデータを抽出できるため切り詰めて続行
+                print(f"[WARN] HTML truncated to {limit} bytes: {url}")
+                del buffer[limit:]
+
+            return kind, bytes(buffer), response
+
+    def _sniff_content_kind(self, url: str, content_type: str, head: bytes) -> Optional[str]:
+        """先頭バイトとContent-Typeからコンテンツ種別を判定（非対応ならNone）"""
+        if head.lstrip()[:5] == b"%PDF-":
+            return "pdf"
+        if 'pdf' in content_type:
+            return "pdf"
+
+        head_lower = head.lstrip(b"\xef\xbb\xbf \t\r\n").lower()
+        if head_lower.startswith((b"<!doctype", b"<html", b"<head", b"<?xml", b"<!--")) or b"<html" in head_lower:
+            return "html"
+        if 'html' in content_type or 'xml' in content_type or content_type.startswith('text/'):
+            return "html"
+
+        # Content-Typeがない場合のみ拡張子で判定
+        if not content_type:
+            return "pdf" if url.lower().endswith('.pdf') else "html"
+        return None
@@ -0,0 +1,236 @@
+"""本文抽出エンジン（テキスト密度・リンク密度ベース）
+
+固定のCSSセレクタではページ全体やナビゲーション主体のテキストを拾いやすいため、
+readability/boilerpipeと同様の考え方で本文ブロックを推定する。
+
+1. JSON-LDに articleBody があればそれを優先
+2. 定型部分（script/nav/footer/広告・共有ボタン等）を除去
+3. 段落ごとのテキスト量を親・祖父要素に加点し、リンク密度で減点して最良のブロックを選択
+4. 最良ブロックと同程度のスコアを持つ兄弟ブロックを結合
+"""
+import json
+import re
+from typing import Dict, Iterable, List, Optional
+
+from lxml import html as lxml_html
+
+# 本文候補から常に除去するタグ
+BOILERPLATE_TAGS = [
+    "script", "style", "noscript", "template", "nav", "footer", "header", "aside",
+    "form", "iframe", "svg", "canvas", "button", "select", "input", "textarea",
+]
+
+# class/id がこれに一致する要素は定型部分とみなす
+NEGATIVE_PATTERN = re.compile(
+    r"comment|footer|sidebar|side-bar|menu|navi|breadcrumb|share|sns|social|related|recommend|"
+    r"banner|advert|\bad[-_]|\bads\b|promo|cookie|popup|modal|subscribe|newsletter|pagination|pager|"
+    r"widget|ranking|tag-?list|author-?box|footnote",
+    re.IGNORECASE,
+)
+# class/id がこれに一致する要素は本文である可能性が高い
+POSITIVE_PATTERN = re.compile(
+    r"article|body|content|entry|main|post|text|story|news|detail|release|honbun|kiji",
+    re.IGNORECASE,
+)
+
+# テキスト量を加点する段落相当の要素
+PARAGRAPH_TAGS = {"p", "pre", "td", "blockquote", "li", "dd", "h2", "h3", "h4"}
+# 本文ブロックの候補となる要素
+CANDIDATE_TAGS = {"div", "article", "section", "main", "td", "body", "blockquote"}
+
+# 段落として数える最小文字数
+MIN_PARAGRAPH_CHARS = 25
+# JSON-LDのarticleBodyを採用する最小文字数
+MIN_JSON_LD_BODY_CHARS = 200
+JSON_LD_ARTICLE_TYPES = {
+    "article", "newsarticle", "blogposting", "report", "pressrelease",
+    "techarticle", "scholarlyarticle", "analysisnewsarticle", "reportagenewsarticle",
+}
+
+
+def iter_json_ld(tree) -> Iterable[Dict]:
+    """JSON-LDのオブジェクトを列挙（@graph・配列は展開）"""
+    for script in tree.xpath('//script[@type="application/ld+json"]'):
+        raw = (script.text or "").strip()
+        if not raw:
+            continue
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            continue
+
+        stack = [data]
+        while stack:
+            item = stack.pop(0)
+            if isinstance(item, list):
+                stack.extend(item)
+            elif isinstance(item, dict):
+                yield item
+                graph = item.get("@graph")
+                if isinstance(graph, list):
+                    stack.extend(graph)
+
+
+def _json_ld_types(item: Dict) -> set:
+    types = item.get("@type", [])
+    if isinstance(types, str):
+        types = [types]
+    return {str(t).lower() for t in types if t}
+
+
+def extract_json_ld_article_body(tree) -> Optional[str]:
+    """JSON-LD（NewsArticle等）のarticleBodyを取得"""
+    for item in iter_json_ld(tree):
+        if not _json_ld_types(item) & JSON_LD_ARTICLE_TYPES:
+            continue
+        body = item.get("articleBody")
+        if isinstance(body, str) and len(body.strip()) >= MIN_JSON_LD_BODY_CHARS:
+            return body.strip()
+    return None
+
+
+def node_text(node) -> str:
+    """テキストノードを改行区切りで結合（空行は除去）"""
+    return "\n".join(t.strip() for t in node.itertext() if t and t.strip())
+
+
+def _class_weight(node) -> int:
+    """class/id による重み付け"""
+    weight = 0
+    for attr in (node.get("class"), node.get("id")):
+        if not attr:
+            continue
+        if NEGATIVE_PATTERN.search(attr):
+            weight -= 25
+        if POSITIVE_PATTERN.search(attr):
+            weight += 25
+    return weight
+
+
+def _link_density(node) -> float:
+    """要素内テキストのうちリンクテキストが占める割合"""
+    text_length = len("".join(node.itertext()).strip())
+    if not text_length:
+        return 0.0
+    link_length = sum(len("".join(a.itertext()).strip()) for a in node.iter("a"))
+    return min(link_length / text_length, 1.0)
+
+
+def strip_boilerplate(root) -> None:
+    """定型部分を除去（rootを直接変更）"""
+    for node in root.xpath(".//comment()"):
+        _drop(node)
+    for node in list(root.iter(*BOILERPLATE_TAGS)):
+        _drop(node)
+
+    for node in list(root.iter()):
+        if node is root or not isinstance(node.tag, str) or node.tag in ("html", "body"):
+            continue
+        attrs = f"{node.get('class', '')} {node.get('id', '')}"
+        if attrs.strip() and NEGATIVE_PATTERN.search(attrs) and not POSITIVE_PATTERN.search(attrs):
+            _drop(node)
+        elif node.get("hidden") is not None or node.get("aria-hidden") == "true":
+            _drop(node)
+
+
+def _drop(node) -> None:
+    """要素を除去（直後のテキストは残す）"""
+    parent = node.getparent()
+    if parent is None:
+        return
+    try:
+        node.drop_tree()
+    except AttributeError:
+        # HtmlElement以外（コメント等）
+        tail = node.tail
+        previous = node.getprevious()
+        if tail:
+            if previous is not None:
+                previous.tail = (previous.tail or "") + tail
+            else:
+                parent.text = (parent.text or "") + tail
+        parent.remove(node)
+
+
+def _score_candidates(root) -> Dict:
+    """段落のテキスト量を親・祖父要素に伝播してスコアを算出"""
+    scores: Dict = {}
+
+    def add(node, value: float) -> None:
+        if node is None or not isinstance(node.tag, str) or node.tag not in CANDIDATE_TAGS:
+            return
+        if node not in scores:
+            scores[node] = float(_class_weight(node))
+        scores[node] += value
+
+    for paragraph in root.iter(*PARAGRAPH_TAGS):
+        text = " ".join("".join(paragraph.itertext()).split())
+        if len(text) < MIN_PARAGRAPH_CHARS:
+            continue
+        # 読点・カンマの数と文字数で段落の「本文らしさ」を評価
+        score = 1.0 + len(re.findall(r"[,、，。]", text)) + min(len(text) / 100.0, 3.0)
+        parent = paragraph if paragraph.tag in CANDIDATE_TAGS else paragraph.getparent()
+        add(parent, score)
+        if parent is not None:
+            add(parent.getparent(), score / 2.0)
+
+    # リンク密度で減点
+    return {node: score * (1.0 - _link_density(node)) for node, score in scores.items()}
+
+
+def extract_main_content(tree) -> str:
+    """
+    lxmlのツリーから本文テキストを抽出
+
+    Args:
+        tree: lxml.html で解析したツリー、またはサイト別の本文セレクタで絞り込んだ要素
+            （直接変更される。本文ブロックの推定はこの要素の範囲内で行う）
+
+    Returns:
+        本文テキスト（見つからない場合は空文字）
+    """
+    # JSON-LD は <head> にあることが多いため、絞り込んだ要素ではなく文書全体から探す
+    document = tree.getroottree() if hasattr(tree, "getroottree") else tree
+    body = extract_json_ld_article_body(document)
+    if body:
+        return body
+
+    root = tree
+    strip_boilerplate(root)
+
+    scores = _score_candidates(root)
+    if not scores:
+        # 段落構造がないページはbody全体のテキスト
+        body_elem = root.find(".//body")
+        return node_text(body_elem if body_elem is not None else root)
+
+    best = max(scores, key=scores.get)
+    best_score = scores[best]
+
+    # 最良ブロックと同程度のスコアを持つ兄弟ブロックも本文に含める（渡された要素の外には広げない）
+    parent = best.getparent()
+    if parent is None or best is root:
+        return node_text(best)
+
+    threshold = max(10.0, best_score * 0.2)
+    parts: List[str] = []
+    for sibling in parent:
+        if not isinstance(sibling.tag, str):
+            continue
+        if sibling is best or scores.get(sibling, 0.0) >= threshold:
+            text = node_text(sibling)
+        elif sibling.tag == "p" and _link_density(sibling) < 0.25 and len(node_text(sibling)) >= 80:
+            text = node_text(sibling)
+        else:
+            continue
+        if text:
+            parts.append(text)
+
+    return "\n".join(parts)
+
+
+def parse_html(html: str):
+    """HTML文字列をlxmlのツリーに変換"""
+    # XML宣言付きの文字列はlxmlが受け付けないため除去
+    html = re.sub(r"^\s*<\?xml[^>]*\?>", "", html)
+    return lxml_html.document_fromstring(html or "<html></html>")
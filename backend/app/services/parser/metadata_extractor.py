@@ -0,0 +1,113 @@
+"""構造化メタデータから公開日を抽出
+
+LLMによる日付抽出の前に、HTML解析時に以下の情報から公開日を取得する。
+信頼度は high（公開日として明示）> medium（公開日の可能性が高い）> low（更新日時等の代替）。
+
+- high: article:published_time, JSON-LD datePublished, itemprop="datePublished"
+- medium: <time datetime>, og:*/Dublin Core の日付, pubdate 系 meta
+- low: article:modified_time 等の更新日時, HTTP Last-Modified
+"""
+import re
+from datetime import date, datetime
+from email.utils import parsedate_to_datetime
+from typing import Optional, Tuple
+
+from app.services.parser.content_extractor import iter_json_ld
+
+CONFIDENCE_HIGH = "high"
+CONFIDENCE_MEDIUM = "medium"
+CONFIDENCE_LOW = "low"
+
+# (XPath, 信頼度, ソース名) の優先順リスト
+META_DATE_SOURCES = [
+    ('//meta[@property="article:published_time"]/@content', CONFIDENCE_HIGH, "article:published_time"),
+    ('//meta[@itemprop="datePublished"]/@content', CONFIDENCE_HIGH, "itemprop:datePublished"),
+    ('//*[@itemprop="datePublished"]/@datetime', CONFIDENCE_HIGH, "itemprop:datePublished"),
+    ('//time[@pubdate]/@datetime', CONFIDENCE_MEDIUM, "time[pubdate]"),
+    ('//meta[@property="og:published_time" or @property="og:article:published_time"]/@content',
+     CONFIDENCE_MEDIUM, "og:published_time"),
+    ('//meta[@name="DC.date.issued" or @name="dc.date.issued" or @name="dcterms.issued"'
+     ' or @name="DCTERMS.issued"]/@content', CONFIDENCE_MEDIUM, "dc:issued"),
+    ('//meta[@name="DC.date" or @name="dc.date" or @name="dcterms.created" or @name="DCTERMS.created"'
+     ' or @name="DC.date.created"]/@content', CONFIDENCE_MEDIUM, "dc:date"),
+    ('//meta[@name="pubdate" or @name="publishdate" or @name="publish-date" or @name="date"'
+     ' or @name="sailthru.date" or @name="parsely-pub-date"]/@content', CONFIDENCE_MEDIUM, "meta:pubdate"),
+    ('//time/@datetime', CONFIDENCE_MEDIUM, "time[datetime]"),
+    ('//meta[@property="og:updated_time" or @property="article:modified_time"]/@content',
+     CONFIDENCE_LOW, "modified_time"),
+]
+
+ISO_DATE_PATTERN = re.compile(r"((?:19|20)\d{2})-(\d{1,2})-(\d{1,2})")
+
+
+def parse_iso_date(value: str) -> Optional[date]:
+    """ISO 8601形式（日時・タイムゾーン付きを含む）から日付部分を取得"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return datetime.fromisoformat(value).date()
+    except ValueError:
+        pass
+    match = ISO_DATE_PATTERN.search(value)
+    if match:
+        try:
+            return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+        except ValueError:
+            return None
+    return None
+
+
+def parse_http_date(value: Optional[str]) -> Optional[date]:
+    """HTTP日付（Last-Modified等）を日付に変換"""
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).date()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def _json_ld_published_date(tree) -> Optional[date]:
+    for item in iter_json_ld(tree):
+        value = item.get("datePublished") or item.get("dateCreated")
+        if isinstance(value, str):
+            parsed = parse_iso_date(value)
+            if parsed:
+                return parsed
+    return None
+
+
+def extract_published_date(
+    tree,
+    last_modified: Optional[str] = None,
+) -> Tuple[Optional[date], Optional[str], Optional[str]]:
+    """
+    構造化メタデータから公開日を抽出
+
+    Args:
+        tree: lxml.html で解析したツリー
+        last_modified: HTTPレスポンスのLast-Modifiedヘッダー
+
+    Returns:
+        (日付, 信頼度, ソース名)。見つからない場合は (None, None, None)
+    """
+    json_ld_checked = False
+    for xpath, confidence, source in META_DATE_SOURCES:
+        # JSON-LDの datePublished は high の meta の次に評価する
+        if confidence != CONFIDENCE_HIGH and not json_ld_checked:
+            json_ld_checked = True
+            json_ld_date = _json_ld_published_date(tree)
+            if json_ld_date:
+                return json_ld_date, CONFIDENCE_HIGH, "json-ld:datePublished"
+
+        for value in tree.xpath(xpath):
+            parsed = parse_iso_date(str(value))
+            if parsed:
+                return parsed, confidence, source
+
+    http_date = parse_http_date(last_modified)
+    if http_date:
+        return http_date, CONFIDENCE_LOW, "http:last-modified"
+
+    return None, None, None
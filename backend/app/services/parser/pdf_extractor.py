@@ -1,7 +1,6 @@
 import io
 from typing import Optional, Dict
 from datetime import date
-import re
 
 try:
     from PyPDF2 import PdfReader
@@ -9,6 +8,15 @@ try:
 except ImportError:
     PDF_AVAILABLE = False
 
+from app.utils.cpu_executor import CpuExecutor, CpuTaskTimeout
+from app.utils.date_scanner import find_date_in_url
+from app.utils.service_error import ErrorCode
+
+# PDFから抽出する最大文字数（記事本文として保存されるのは先頭5000文字のため、それ以上は読まない）
+PDF_MAX_CONTENT_CHARS = 5000
+# ワーカーの制限時間・メモリ上限による中断（ページ単位の失敗として握りつぶさず、タスク全体を打ち切る）
+_TASK_ABORT_ERRORS = (CpuTaskTimeout, MemoryError)
+
 
 class PdfExtractor:
     """PDFからテキストを抽出する共通クラス"""
@@ -18,16 +26,22 @@ class PdfExtractor:
         """PyPDF2が利用可能かチェック"""
         return PDF_AVAILABLE
 
-    async def extract_from_bytes(self, url: str, pdf_bytes: bytes) -> Optional[Dict]:
+    async def extract_from_bytes(
+        self,
+        url: str,
+        pdf_bytes: bytes,
+        max_chars: int = PDF_MAX_CONTENT_CHARS,
+    ) -> Optional[Dict]:
         """
         PDFバイトデータからテキストを抽出
 
         Args:
             url: PDF URL（ログとメタデータ用）
             pdf_bytes: PDFのバイトデータ
+            max_chars: 抽出する最大文字数
 
         Returns:
-            抽出結果 {title, content, url, published_date} または None
+            抽出結果 {title, content, url, published_date, date_confidence, date_source} または None
         """
         if not PDF_AVAILABLE:
             error_msg = f"PyPDF2 not available, cannot read PDF: {url}"
@@ -40,97 +54,153 @@ class PdfExtractor:
             return None
 
         try:
-            # PDFを読み込み
-            pdf_file = io.BytesIO(pdf_bytes)
-            reader = PdfReader(pdf_file)
-
-            # PDFページ数をログ
-            num_pages = len(reader.pages)
-            print(f"[INFO] PDF has {num_pages} pages: {url}")
-
-            # 全ページのテキストを抽出
-            text_content = []
-            for i, page in enumerate(reader.pages):
-                try:
-                    text = page.extract_text()
-                    if text:
-                        text_content.append(text)
-                except Exception as page_error:
-                    print(f"[WARN] Failed to extract text from page {i+1}: {page_error}")
-
-            full_text = "\n".join(text_content)
-
-            if not full_text.strip():
-                print(f"[WARN] No text extracted from PDF (might be image-based): {url}")
-                # 画像ベースのPDFの場合でも基本情報は返す
-                full_text = f"[PDF content could not be extracted - may be image-based PDF]\nURL: {url}"
-
-            # タイトルを推測（最初の行または PDFメタデータから）
-            title = ""
-            if reader.metadata and reader.metadata.title:
-                title = reader.metadata.title
-            elif full_text:
-                # 最初の非空白行をタイトルとする
-                lines = [line.strip() for line in full_text.split('\n') if line.strip()]
-                if lines:
-                    title = lines[0][:200]  # 最大200文字
-
-            if not title:
-                title = f"PDF Document - {url.split('/')[-1]}"
-
-            # URLから日付を抽出を試みる
-            published_date = self._extract_date_from_url(url)
-
-            print(f"[SUCCESS] PDF extracted: {len(full_text)} characters, title: {title[:50]}...")
-
-            return {
-                "title": title,
-                "content": full_text[:10000],  # PDFは最大10000文字
-                "url": url,
-                "published_date": published_date,
-            }
-
+            return await CpuExecutor.run(
+                extract_pdf_fields,
+                url,
+                pdf_bytes,
+                max_chars,
+                service_name="PdfExtractor",
+                error_code=ErrorCode.PDF_EXTRACT_ERROR,
+            )
         except Exception as e:
-            import traceback
             print(f"[ERROR] PDF extraction error ({url}): {e}")
-            print(f"[DEBUG] Traceback: {traceback.format_exc()}")
             return None
 
     def _extract_date_from_url(self, url: str) -> Optional[date]:
         """URLから日付を抽出"""
-        if not url:
-            return None
-
-        # Pattern: /newsYYYY/.../newsMMDD(.pdf)
-        match = re.search(r"/news(20\d{2})/.+?/news(\d{4})", url)
-        if match:
-            year = int(match.group(1))
-            month = int(match.group(2)[:2])
-            day = int(match.group(2)[2:])
+        return find_date_in_url(url)
+
+
+def _is_image_only_page(page) -> bool:
+    """フォントを持たず画像のみで構成されたページか判定（コンテンツストリームは解析しない）"""
+    try:
+        resources = page.get("/Resources")
+        resources = resources.get_object() if resources is not None else {}
+        if resources.get("/Font"):
+            return False
+        xobjects = resources.get("/XObject")
+        xobjects = xobjects.get_object() if xobjects is not None else {}
+        # Form XObjectは内部にテキストを持ちうるため、画像以外があれば抽出対象とする
+        for xobject in xobjects.values():
+            if xobject.get_object().get("/Subtype") != "/Image":
+                return False
+        return True
+    except _TASK_ABORT_ERRORS:
+        raise
+    except Exception:
+        return False
+
+
+def extract_pdf_fields(
+    url: str,
+    pdf_bytes: bytes,
+    max_chars: int = PDF_MAX_CONTENT_CHARS,
+) -> Optional[Dict]:
+    """
+    PDFバイトデータからテキストを抽出（ワーカープロセスで実行）
+
+    先頭ページから順に抽出し、max_chars文字に達した時点で打ち切る。
+    タイトルはページ内容に触れずメタデータから取得し、画像のみのページは抽出をスキップする。
+
+    Args:
+        url: PDF URL（ログとメタデータ用）
+        pdf_bytes: PDFのバイトデータ
+        max_chars: 抽出する最大文字数
+
+    Returns:
+        抽出結果 {title, content, url, published_date, date_confidence, date_source} または None
+    """
+    try:
+        # PDFを読み込み
+        pdf_file = io.BytesIO(pdf_bytes)
+        reader = PdfReader(pdf_file)
+
+        # PDFページ数をログ
+        num_pages = len(reader.pages)
+        print(f"[INFO] PDF has {num_pages} pages: {url}")
+
+        # タイトル（メタデータのみ参照）
+        title = ""
+        try:
+            if reader.metadata and reader.metadata.title:
+                title = str(reader.metadata.title).strip()
+        except _TASK_ABORT_ERRORS:
+            raise
+        except Exception as meta_error:
+            print(f"[WARN] Failed to read PDF metadata: {meta_error}")
+
+        # 文字数の上限に達するまでページ単位でテキストを抽出
+        text_content = []
+        total_chars = 0
+        pages_read = 0
+        skipped_pages = 0
+        for i in range(num_pages):
+            if total_chars >= max_chars:
+                break
             try:
-                return date(year, month, day)
-            except ValueError:
-                return None
-
-        # Pattern: YYYYMMDD in URL
-        return self._extract_date_from_text(url)
-
-    def _extract_date_from_text(self, text: str) -> Optional[date]:
-        """テキストから日付を抽出"""
-        if not text:
-            return None
-
-        patterns = [
-            r"(\d{4})[/-](\d{1,2})[/-](\d{1,2})",
-            r"(\d{4})年(\d{1,2})月(\d{1,2})日",
-            r"(\d{4})(\d{2})(\d{2})",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text)
-            if not match:
-                continue
+                page = reader.pages[i]
+                if _is_image_only_page(page):
+                    skipped_pages += 1
+                    continue
+                pages_read += 1
+                text = page.extract_text()
+                if text:
+                    text_content.append(text)
+                    total_chars += len(text) + 1
+            except _TASK_ABORT_ERRORS:
+                raise
+            except Exception as page_error:
+                print(f"[WARN] Failed to extract text from page {i+1}: {page_error}")
+
+        full_text = "\n".join(text_content)
+
+        if not full_text.strip():
+            print(f"[WARN] No text extracted from PDF (might be image-based): {url}")
+            # 画像ベースのPDFの場合でも基本情報は返す
+            full_text = f"[PDF content could not be extracted - may be image-based PDF]\nURL: {url}"
+        elif not title:
+            # 最初の非空白行をタイトルとする
+            lines = [line.strip() for line in full_text.split('\n') if line.strip()]
+            if lines:
+                title = lines[0][:200]  # 最大200文字
+
+        if not title:
+            title = f"PDF Document - {url.split('/')[-1]}"
+
+        # URLから日付を抽出を試みる（なければPDFの作成日時を代替値とする）
+        published_date = find_date_in_url(url)
+        date_confidence = "medium" if published_date else None
+        date_source = "url" if published_date else None
+        if not published_date:
             try:
-                return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
-            except ValueError:
-                continue
+                created = reader.metadata.creation_date if reader.metadata else None
+            except _TASK_ABORT_ERRORS:
+                raise
+            except Exception:
+                created = None
+            if created:
+                published_date = created.date()
+                date_confidence = "low"
+                date_source = "pdf:creation_date"
+
+        print(
+            f"[SUCCESS] PDF extracted: {len(full_text)} characters from {pages_read}/{num_pages} pages "
+            f"({skipped_pages} image-only skipped), title: {title[:50]}..."
+        )
+
+        return {
+            "title": title,
+            "content": full_text[:max_chars],
+            "url": url,
+            "published_date": published_date,
+            "date_confidence": date_confidence,
+            "date_source": date_source,
+        }
+
+    except _TASK_ABORT_ERRORS:
+        raise
+    except Exception as e:
+        import traceback
+        print(f"[ERROR] PDF extraction error ({url}): {e}")
+        print(f"[DEBUG] Traceback: {traceback.format_exc()}")
         return None
@@ -1,21 +1,130 @@
 from datetime import date, datetime
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Optional
 import os
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import and_, case, func, or_, select
 
 from app.models import Article, Company
 
+# サーバー側カーソルから一度に受け取る行数
+REPORT_FETCH_SIZE = 200
+# カテゴリ未設定の記事の見出し
+UNCATEGORIZED_LABEL = "その他"
+
 
 class ReportGenerator:
     """Markdownレポートを生成"""
-    
+
     def __init__(self, output_dir: str = "/app/reports"):
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
-    
+
+    @staticmethod
+    def build_filename(start_date: date, end_date: date) -> str:
+        return f"report_{start_date}_{end_date}_{datetime.now().strftime('%Y%m%d%H%M%S')}.md"
+
+    def _build_query(self, start_date: date, end_date: date):
+        """
+        有効な企業ごとに、期間内（発行日不明を含む）の不適切でない記事を企業・カテゴリ順に取得するクエリ
+
+        記事のない企業も「該当なし」と出力するため企業から外部結合する。
+        本文は要約がない記事の分だけ読み込む。
+        """
+        category_label = func.coalesce(func.nullif(Article.category, ""), UNCATEGORIZED_LABEL)
+        has_summary = func.coalesce(Article.summary, "") != ""
+        article_join = and_(
+            Article.company_id == Company.id,
+            Article.is_inappropriate == False,
+            or_(
+                Article.published_date.is_(None),
+                Article.published_date.between(start_date, end_date),
+            ),
+        )
+        return (
+            select(
+                Company.id.label("company_id"),
+                Company.name.label("company_name"),
+                Company.country,
+                Article.id.label("article_id"),
+                Article.title,
+                Article.summary,
+                case((has_summary, None), else_=Article.content).label("content"),
+                Article.category,
+                category_label.label("category_label"),
+                Article.business_area,
+                Article.tags,
+                Article.published_date,
+                Article.url,
+            )
+            .select_from(Company)
+            .outerjoin(Article, article_join)
+            .where(Company.is_active == True)
+            .order_by(
+                Company.id,
+                category_label,
+                Article.published_date.desc().nulls_last(),
+                Article.id.desc(),
+            )
+        )
+
+    async def iter_report(
+        self,
+        db: AsyncSession,
+        start_date: date,
+        end_date: date,
+    ) -> AsyncIterator[str]:
+        """
+        レポートを企業・記事単位の断片として順に生成
+
+        サーバー側カーソルで REPORT_FETCH_SIZE 行ずつ読むため、記事数によらずメモリ使用量は一定。
+        """
+        yield _lines([
+            f"# AI・DX事例調査レポート",
+            f"",
+            f"**調査期間**: {start_date} 〜 {end_date}",
+            f"**生成日時**: {datetime.now().strftime('%Y-%m-%d %H:%M')}",
+            f"",
+            f"---",
+            f"",
+        ])
+
+        query = self._build_query(start_date, end_date).execution_options(yield_per=REPORT_FETCH_SIZE)
+        result = await db.stream(query)
+
+        current_company_id: Optional[int] = None
+        current_category: Optional[str] = None
+        async for row in result:
+            lines: List[str] = []
+            if row.company_id != current_company_id:
+                if current_company_id is not None:
+                    lines.append("")
+                current_company_id = row.company_id
+                current_category = None
+                lines.append(f"# {row.company_name}")
+                if row.country:
+                    lines.append(f"**国**: {row.country}")
+                lines.append("")
+
+                if row.article_id is None:
+                    # 期間内の記事がない企業（外部結合で記事列がNULLの1行）
+                    lines.extend(["該当なし", "", "---", ""])
+                    yield _lines(lines)
+                    # 次の企業の前の空行は出力しない
+                    current_company_id = None
+                    continue
+
+            if row.category_label != current_category:
+                current_category = row.category_label
+                lines.append(f"## 【{current_category}】")
+                lines.append("")
+
+            lines.extend(_article_lines(row))
+            yield _lines(lines)
+
+        if current_company_id is not None:
+            yield _lines([""])
+
     async def generate(
         self,
         db: AsyncSession,
@@ -24,104 +133,61 @@ class ReportGenerator:
     ) -> str:
         """
         レポートを生成
-        
+
         Args:
             db: DBセッション
             start_date: 対象開始日
             end_date: 対象終了日
-        
+
         Returns:
             生成したレポートのファイルパス
         """
-        # 企業と記事を取得
-        query = select(Company).options(
-            selectinload(Company.articles)
-        ).where(Company.is_active == True)
-        
-        result = await db.execute(query)
-        companies = result.scalars().all()
-        
-        # レポート生成
-        report_lines = [
-            f"# AI・DX事例調査レポート",
-            f"",
-            f"**調査期間**: {start_date} 〜 {end_date}",
-            f"**生成日時**: {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-            f"",
-            f"---",
-            f"",
-        ]
-        
-        for company in companies:
-            # 期間内の記事をフィルタ（発行日不明は除外しない）
-            articles = [
-                a for a in company.articles
-                if (a.published_date is None)
-                or (start_date <= a.published_date <= end_date)
-            ]
-            
-            report_lines.append(f"# {company.name}")
-            if company.country:
-                report_lines.append(f"**国**: {company.country}")
-            report_lines.append("")
-
-            if not articles:
-                report_lines.append("該当なし")
-                report_lines.append("")
-                report_lines.append("---")
-                report_lines.append("")
-                continue
-            
-            # カテゴリごとにグループ化
-            by_category = {}
-            for article in articles:
-                cat = article.category or "その他"
-                if cat not in by_category:
-                    by_category[cat] = []
-                by_category[cat].append(article)
-            
-            for category, cat_articles in by_category.items():
-                report_lines.append(f"## 【{category}】")
-                report_lines.append("")
-                
-                for article in cat_articles:
-                    report_lines.append(f"### {article.title}")
-                    report_lines.append("")
-                    
-                    if article.summary:
-                        report_lines.append(article.summary)
-                        report_lines.append("")
-                    elif article.content:
-                        report_lines.append("## 本文")
-                        report_lines.append(article.content)
-                        report_lines.append("")
-                    
-                    # メタ情報
-                    report_lines.append("#### メタ情報")
-                    report_lines.append(f"- **カテゴリ**: {article.category or '未分類'}")
-                    report_lines.append(f"- **業務領域**: {article.business_area or '未分類'}")
-                    
-                    if article.tags:
-                        tags = " ".join([f"#{t.strip()}" for t in article.tags.split(",")])
-                        report_lines.append(f"- **タグ**: {tags}")
-                    
-                    if article.published_date:
-                        report_lines.append(f"- **発行日**: {article.published_date}")
-                    else:
-                        report_lines.append("- **発行日**: 不明")
-                    
-                    report_lines.append(f"- **ソース**: {article.url}")
-                    report_lines.append("")
-                    report_lines.append("---")
-                    report_lines.append("")
-            
-            report_lines.append("")
-        
-        # ファイル出力
-        filename = f"report_{start_date}_{end_date}_{datetime.now().strftime('%Y%m%d%H%M%S')}.md"
-        filepath = os.path.join(self.output_dir, filename)
-        
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write("\n".join(report_lines))
-        
+        filepath = os.path.join(self.output_dir, self.build_filename(start_date, end_date))
+        # 書き込み途中のファイルがレポート一覧に出ないよう、一時ファイルに書いてから置き換える
+        tmp_path = filepath + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                async for chunk in self.iter_report(db, start_date, end_date):
+                    f.write(chunk)
+            os.replace(tmp_path, filepath)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
         return filepath
+
+
+def _article_lines(row) -> List[str]:
+    lines = [f"### {row.title}", ""]
+
+    if row.summary:
+        lines.append(row.summary)
+        lines.append("")
+    elif row.content:
+        lines.append("## 本文")
+        lines.append(row.content)
+        lines.append("")
+
+    # メタ情報
+    lines.append("#### メタ情報")
+    lines.append(f"- **カテゴリ**: {row.category or '未分類'}")
+    lines.append(f"- **業務領域**: {row.business_area or '未分類'}")
+
+    if row.tags:
+        tags = " ".join([f"#{t}" for t in row.tags])
+        lines.append(f"- **タグ**: {tags}")
+
+    if row.published_date:
+        lines.append(f"- **発行日**: {row.published_date}")
+    else:
+        lines.append("- **発行日**: 不明")
+
+    lines.append(f"- **ソース**: {row.url}")
+    lines.append("")
+    lines.append("---")
+    lines.append("")
+    return lines
+
+
+def _lines(lines: List[str]) -> str:
+    return "".join(f"{line}\n" for line in lines)
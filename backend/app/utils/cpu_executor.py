@@ -0,0 +1,210 @@
+"""CPUバウンド処理（HTML解析・PDFテキスト抽出）用のプロセスプール
+
+BeautifulSoup/lxmlによる解析やPyPDF2によるテキスト抽出をイベントループ上で
+同期実行すると、その間APIと他のクロールがすべて止まる。
+ここではワーカープロセスで実行し、タスクごとのタイムアウトとメモリ上限を課す。
+
+ワーカーに渡す関数はモジュールトップレベルで定義し（pickle可能にするため）、
+生のバイト列を受け取り、抽出済みのdict等を返すこと。
+"""
+import asyncio
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:  # Windows
+    RESOURCE_AVAILABLE = False
+
+from app.config import get_settings
+from app.utils.service_error import NonRetryableError, ErrorCode
+
+
+class CpuTaskTimeout(Exception):
+    """ワーカー内でタスクの制限時間を超過した"""
+    pass
+
+
+def _init_worker(memory_limit_mb: int) -> None:
+    """ワーカープロセスの初期化（アドレス空間の上限を設定）"""
+    if RESOURCE_AVAILABLE and memory_limit_mb > 0:
+        limit = memory_limit_mb * 1024 * 1024
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _raise_timeout(signum, frame) -> None:
+    raise CpuTaskTimeout()
+
+
+def _run_task(func: Callable[..., Any], args: tuple, timeout: float) -> Any:
+    """ワーカー側でタスクを実行（SIGALRMで制限時間を強制）"""
+    use_alarm = timeout and timeout > 0 and hasattr(signal, "setitimer")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return func(*args)
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+class CpuExecutor:
+    """CPUバウンド処理をプロセスプールで実行する共通クラス"""
+
+    _executor: Optional[ProcessPoolExecutor] = None
+
+    # ワーカー側のタイムアウトが効かなかった場合の猶予（秒）
+    TIMEOUT_GRACE = 5.0
+    # タスクが実行中になったかを確認する間隔（秒）
+    START_POLL_INTERVAL = 0.5
+
+    @classmethod
+    def _get_executor(cls) -> ProcessPoolExecutor:
+        """プロセスプールを取得（初回呼び出し時に生成）"""
+        if cls._executor is None:
+            settings = get_settings()
+            workers = settings.cpu_executor_workers or os.cpu_count() or 1
+            cls._executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(settings.cpu_task_memory_mb,),
+                max_tasks_per_child=settings.cpu_executor_max_tasks_per_child or None,
+            )
+        return cls._executor
+
+    @classmethod
+    def _reset_executor(cls, executor: Optional[ProcessPoolExecutor] = None) -> None:
+        """
+        応答しない・壊れたプールを破棄（次回呼び出し時に再生成）
+
+        Args:
+            executor: 破棄するプール。既に別のプールに置き換わっていれば何もしない
+                （同じプールの破損を検知した複数のタスクが、再生成後のプールまで破棄しないように）
+        """
+        if executor is None:
+            executor = cls._executor
+        elif executor is not cls._executor:
+            return
+        cls._executor = None
+        if executor is None:
+            return
+        # 実行中のタスクは中断できないため、ワーカープロセスを直接終了させる
+        for process in list((getattr(executor, "_processes", None) or {}).values()):
+            try:
+                process.terminate()
+            except Exception:
+                pass
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    @classmethod
+    async def run(
+        cls,
+        func: Callable[..., Any],
+        *args,
+        timeout: Optional[float] = None,
+        service_name: str = "CpuExecutor",
+        error_code: ErrorCode = ErrorCode.CPU_TASK_FAILED,
+    ) -> Any:
+        """
+        関数をワーカープロセスで実行
+
+        Args:
+            func: 実行する関数（モジュールトップレベルで定義されたもの）
+            *args: 関数の引数（pickle可能であること）
+            timeout: 制限時間（秒）。Noneの場合は設定値
+            service_name: エラー時のサービス名
+            error_code: 実行失敗時のエラーコード
+
+        Returns:
+            関数の戻り値
+
+        Raises:
+            NonRetryableError: タイムアウト・メモリ超過・ワーカー異常終了時
+        """
+        if timeout is None:
+            timeout = get_settings().cpu_task_timeout
+
+        executor = cls._get_executor()
+        try:
+            return await cls._wait_with_backstop(executor, func, args, timeout)
+        except (CpuTaskTimeout, asyncio.TimeoutError) as e:
+            if isinstance(e, asyncio.TimeoutError):
+                # ワーカー内のタイムアウトが効かずに応答しないワーカーがいるため、プールごと作り直す
+                cls._reset_executor(executor)
+            raise NonRetryableError(
+                service_name=service_name,
+                error_code=ErrorCode.CPU_TASK_TIMEOUT,
+                message=f"{func.__name__} exceeded {timeout:.0f}s",
+            )
+        except MemoryError as e:
+            raise NonRetryableError(
+                service_name=service_name,
+                error_code=ErrorCode.CPU_TASK_MEMORY_EXCEEDED,
+                message=f"{func.__name__} exceeded memory limit",
+                original_error=e,
+            )
+        except BrokenProcessPool as e:
+            cls._reset_executor(executor)
+            raise NonRetryableError(
+                service_name=service_name,
+                error_code=error_code,
+                message=f"{func.__name__} worker terminated abruptly",
+                original_error=e,
+            )
+
+    @classmethod
+    async def _wait_with_backstop(
+        cls,
+        executor: ProcessPoolExecutor,
+        func: Callable[..., Any],
+        args: tuple,
+        timeout: float,
+    ) -> Any:
+        """
+        タスクの完了を待つ（ワーカー内のタイムアウトが効かなかった場合の保険付き）
+
+        キューで待っている時間は数えず、プールがタスクを実行中にしてから計測する。
+        実行中になったタスクも、ワーカーが1つ空くまで（最大 timeout + 猶予）キューに残りうるため、
+        保険の制限時間はその分を加えた長さとする。
+
+        Raises:
+            asyncio.TimeoutError: 実行中になってから保険の制限時間を過ぎても終わらない場合（ワーカーが応答しない）
+        """
+        loop = asyncio.get_running_loop()
+        concurrent_future = executor.submit(_run_task, func, args, timeout)
+        future = asyncio.wrap_future(concurrent_future)
+        # 制限時間なし（timeout が 0 以下）の場合は保険も設けない
+        backstop = (timeout + cls.TIMEOUT_GRACE) * 2 if timeout and timeout > 0 else None
+        started_at: Optional[float] = None
+        try:
+            while True:
+                if started_at is None or backstop is None:
+                    wait = cls.START_POLL_INTERVAL
+                else:
+                    wait = started_at + backstop - loop.time()
+                    if wait <= 0:
+                        raise asyncio.TimeoutError()
+                done, _ = await asyncio.wait({future}, timeout=wait)
+                if done:
+                    return future.result()
+                if started_at is None and concurrent_future.running():
+                    started_at = loop.time()
+        finally:
+            # 呼び出し側のキャンセル・タイムアウト時は、未実行ならキューから取り除く
+            if not future.done():
+                future.cancel()
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """プロセスプールを終了（アプリ終了時）"""
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=False, cancel_futures=True)
+            cls._executor = None
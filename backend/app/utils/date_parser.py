@@ -3,6 +3,8 @@ import re
 from datetime import datetime, date
 from typing import Optional, List
 
+from app.utils.date_scanner import find_date
+
 
 class DateParser:
     """日付文字列を解析する共通ユーティリティ"""
@@ -40,22 +42,15 @@ class DateParser:
         # フォーマットリストで試行
         for fmt in parse_formats:
             try:
-                return datetime.strptime(cleaned, fmt).date()
+                parsed = datetime.strptime(cleaned, fmt).date()
             except ValueError:
                 continue
+            # 英語月名等を除去した残りの数字列が誤って一致した場合（"Oct 13, 2025" → 1320-2-5 等）は採用しない
+            if parsed.year >= 1900:
+                return parsed
 
-        # 正規表現で YYYY-MM-DD 形式を抽出
-        match = re.search(r'(\d{4})[-/年.](\d{1,2})[-/月.](\d{1,2})', date_text)
-        if match:
-            try:
-                year = int(match.group(1))
-                month = int(match.group(2))
-                day = int(match.group(3))
-                return date(year, month, day)
-            except ValueError:
-                pass
-
-        return None
+        # 英語月名・和暦・日/月順等を含めてスキャン
+        return find_date(date_text)
 
     @classmethod
     def extract_from_text(cls, text: str, max_length: int = 500) -> Optional[date]:
@@ -69,35 +64,5 @@ class DateParser:
         Returns:
             最初に見つかった日付、または None
         """
-        if not text:
-            return None
-
         # 最初の部分だけを検索（パフォーマンス最適化）
-        search_text = text[:max_length]
-
-        # パターン1: YYYY年MM月DD日
-        match = re.search(r'(\d{4})年(\d{1,2})月(\d{1,2})日', search_text)
-        if match:
-            try:
-                return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
-            except ValueError:
-                pass
-
-        # パターン2: YYYY-MM-DD, YYYY/MM/DD, YYYY.MM.DD
-        match = re.search(r'(\d{4})[-/.](\d{1,2})[-/.](\d{1,2})', search_text)
-        if match:
-            try:
-                return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
-            except ValueError:
-                pass
-
-        # パターン3: YYYYMMDD
-        match = re.search(r'(\d{8})', search_text)
-        if match:
-            date_str = match.group(1)
-            try:
-                return datetime.strptime(date_str, "%Y%m%d").date()
-            except ValueError:
-                pass
-
-        return None
+        return find_date(text, max_length=max_length)
@@ -0,0 +1,338 @@
+"""多言語対応の日付スキャナ
+
+各所で重複していた日付の正規表現ループを1つにまとめたもの。
+ロケール別のパターン（プラグイン）を起動時に1本の正規表現へ結合・コンパイルし、
+テキストを1回走査するだけで最初の日付を見つける。
+
+対応形式:
+- ja_era: 令和6年4月1日, 令和元年5月1日, 平成31年4月30日, R6.4.1, H31.4.30
+- ja:     2024年4月1日
+- iso:    2024-04-01, 2024/4/1, 2024.04.01, 2024-04-01T10:00:00+09:00
+- compact: 20240401
+- en:     Oct 3, 2025 / October 3rd, 2025 / 3 October 2025 / 3rd of Oct. 2025
+- eu:     3 octobre 2025 / 3. Oktober 2025 / 3 de octubre de 2025
+- dmy:    03.10.2025, 03/10/2025, 10/03/2025（日/月の曖昧さを解決）
+"""
+import re
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable, Iterator, List, Match, Optional, Pattern, Tuple
+
+# 全角数字・記号を半角に変換（文字数は変わらないため位置はそのまま使える）
+_FULLWIDTH_TABLE = str.maketrans(
+    "０１２３４５６７８９／．－：　",
+    "0123456789/.-: ",
+)
+
+_DIGIT = re.compile(r"\d")
+
+# 元号の元年（西暦）
+ERA_BASE_YEARS = {
+    "令和": 2018, "R": 2018,
+    "平成": 1988, "H": 1988,
+}
+
+EN_MONTHS = {
+    "jan": 1, "january": 1, "feb": 2, "february": 2, "mar": 3, "march": 3,
+    "apr": 4, "april": 4, "may": 5, "jun": 6, "june": 6, "jul": 7, "july": 7,
+    "aug": 8, "august": 8, "sep": 9, "sept": 9, "september": 9,
+    "oct": 10, "october": 10, "nov": 11, "november": 11, "dec": 12, "december": 12,
+}
+
+# 仏・独・西の月名
+EU_MONTHS = {
+    "janvier": 1, "février": 2, "fevrier": 2, "mars": 3, "avril": 4, "mai": 5, "juin": 6,
+    "juillet": 7, "août": 8, "aout": 8, "septembre": 9, "octobre": 10,
+    "novembre": 11, "décembre": 12, "decembre": 12,
+    "januar": 1, "jänner": 1, "februar": 2, "märz": 3, "maerz": 3, "april": 4,
+    "juni": 6, "juli": 7, "oktober": 10, "dezember": 12,
+    "enero": 1, "febrero": 2, "marzo": 3, "abril": 4, "mayo": 5, "junio": 6,
+    "julio": 7, "agosto": 8, "septiembre": 9, "setiembre": 9, "octubre": 10,
+    "noviembre": 11, "diciembre": 12,
+}
+
+
+def _trie_regex(words) -> str:
+    """単語リストを接頭辞木の正規表現に変換（"jan(?:uary)?" のように分岐を減らして高速化）"""
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        terminal = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if terminal:
+            # 長い一致を優先するため、終端は省略可能として表現する
+            return f"(?:{body})?"
+        return body
+
+    return build(trie)
+
+
+_EN_MONTH = rf"(?:{_trie_regex(EN_MONTHS)})\.?"
+_EU_MONTH = rf"(?:{_trie_regex(EU_MONTHS)})"
+_YEAR = r"(?:19|20)\d{2}"
+_ORDINAL = r"(?:st|nd|rd|th)?"
+
+Candidates = List[Tuple[int, int, int]]
+
+
+@dataclass(frozen=True)
+class LocalePlugin:
+    """ロケール別の日付パターン
+
+    pattern 内の名前付きグループは "<name>_" で始めること
+    （結合後の正規表現内で一意にするため）。
+    build は一致結果（re.Match）から (年, 月, 日) の候補リストを返す。
+    候補が複数ある場合は曖昧とみなし、DateScanner が解決する。
+    """
+
+    name: str
+    pattern: str
+    build: Callable[[Match], Candidates]
+
+
+@dataclass(frozen=True)
+class DateMatch:
+    """スキャン結果"""
+
+    value: date
+    start: int
+    end: int
+    locale: str
+    ambiguous: bool = False
+
+
+def _build_era(m: Match) -> Candidates:
+    era = m.group("ja_era_era") or m.group("ja_era_abbr")
+    year = m.group("ja_era_year") or m.group("ja_era_abbr_year")
+    year = 1 if year == "元" else int(year)
+    month = m.group("ja_era_month") or m.group("ja_era_abbr_month")
+    day = m.group("ja_era_day") or m.group("ja_era_abbr_day")
+    return [(ERA_BASE_YEARS[era] + year, int(month), int(day))]
+
+
+def _build_ymd(prefix: str) -> Callable[[Match], Candidates]:
+    groups = (f"{prefix}_y", f"{prefix}_m", f"{prefix}_d")
+
+    def build(m: Match) -> Candidates:
+        year, month, day = m.group(*groups)
+        return [(int(year), int(month), int(day))]
+    return build
+
+
+def _build_en(m: Match) -> Candidates:
+    if m.group("en_mdy_m"):
+        month, day, year = m.group("en_mdy_m", "en_mdy_d", "en_mdy_y")
+    else:
+        month, day, year = m.group("en_dmy_m", "en_dmy_d", "en_dmy_y")
+    return [(int(year), EN_MONTHS[month.lower().rstrip(".")], int(day))]
+
+
+def _build_eu(m: Match) -> Candidates:
+    return [(int(m.group("eu_y")), EU_MONTHS[m.group("eu_m").lower()], int(m.group("eu_d")))]
+
+
+def _build_dmy(m: Match) -> Candidates:
+    first, second, year = (int(value) for value in m.group("dmy_a", "dmy_b", "dmy_y"))
+    day_first = (year, second, first)
+    month_first = (year, first, second)
+    if first > 12:
+        return [day_first]
+    if second > 12:
+        return [month_first]
+    if first == second:
+        return [day_first]
+    # 区切りが "." "-" の場合は欧州式（日が先）、"/" は米国式（月が先）を優先
+    if m.group("dmy_sep") == "/":
+        return [month_first, day_first]
+    return [day_first, month_first]
+
+
+# 判定順（同じ位置で複数のパターンが一致しうる場合は先のものを優先）
+DEFAULT_PLUGINS: List[LocalePlugin] = [
+    LocalePlugin(
+        "ja_era",
+        r"(?:(?P<ja_era_era>令和|平成)\s*(?P<ja_era_year>元|\d{1,2})\s*年\s*"
+        r"(?P<ja_era_month>\d{1,2})\s*月\s*(?P<ja_era_day>\d{1,2})\s*日"
+        r"|(?<![A-Za-z])(?P<ja_era_abbr>(?-i:[RH]))(?P<ja_era_abbr_year>\d{1,2})\."
+        r"(?P<ja_era_abbr_month>\d{1,2})\.(?P<ja_era_abbr_day>\d{1,2})(?![\d.]))",
+        _build_era,
+    ),
+    LocalePlugin(
+        "ja",
+        rf"(?<!\d)(?P<ja_y>{_YEAR})\s*年\s*(?P<ja_m>\d{{1,2}})\s*月\s*(?P<ja_d>\d{{1,2}})\s*日",
+        _build_ymd("ja"),
+    ),
+    LocalePlugin(
+        "iso",
+        rf"(?<!\d)(?P<iso_y>{_YEAR})(?P<iso_sep>[-/.])(?P<iso_m>\d{{1,2}})(?P=iso_sep)"
+        r"(?P<iso_d>\d{1,2})(?!\d)",
+        _build_ymd("iso"),
+    ),
+    LocalePlugin(
+        "compact",
+        rf"(?<!\d)(?P<compact_y>{_YEAR})(?P<compact_m>0[1-9]|1[0-2])"
+        r"(?P<compact_d>0[1-9]|[12]\d|3[01])(?!\d)",
+        _build_ymd("compact"),
+    ),
+    LocalePlugin(
+        "en",
+        rf"(?:\b(?P<en_mdy_m>{_EN_MONTH})\s+(?P<en_mdy_d>\d{{1,2}}){_ORDINAL},?\s+(?P<en_mdy_y>{_YEAR})"
+        rf"|(?<!\d)(?P<en_dmy_d>\d{{1,2}}){_ORDINAL}\s+(?:of\s+)?(?P<en_dmy_m>{_EN_MONTH}),?\s+"
+        rf"(?P<en_dmy_y>{_YEAR}))(?!\d)",
+        _build_en,
+    ),
+    LocalePlugin(
+        "eu",
+        rf"(?<!\d)(?P<eu_d>\d{{1,2}})(?:er)?\.?\s+(?:de\s+)?(?P<eu_m>{_EU_MONTH})\s+(?:de\s+)?"
+        rf"(?P<eu_y>{_YEAR})(?!\d)",
+        _build_eu,
+    ),
+    LocalePlugin(
+        "dmy",
+        rf"(?<![\d.\-/])(?P<dmy_a>\d{{1,2}})(?P<dmy_sep>[-/.])(?P<dmy_b>\d{{1,2}})(?P=dmy_sep)"
+        rf"(?P<dmy_y>{_YEAR})(?!\d)",
+        _build_dmy,
+    ),
+]
+
+# URL専用のパターン（判定順）
+URL_PATTERNS: List[Tuple[Pattern, Tuple[int, int, int]]] = [
+    # /newsYYYY/.../newsMMDD(.pdf)
+    (re.compile(r"/news((?:19|20)\d{2})/.+?/news(\d{2})(\d{2})"), (1, 2, 3)),
+    # /YYYY/MM/DD/ や /YYYY/MMDD/
+    (re.compile(r"/((?:19|20)\d{2})/(0?[1-9]|1[0-2])/(0?[1-9]|[12]\d|3[01])(?:[/_.\-]|$)"), (1, 2, 3)),
+    (re.compile(r"/((?:19|20)\d{2})/(0[1-9]|1[0-2])(0[1-9]|[12]\d|3[01])(?:[/_.\-]|$)"), (1, 2, 3)),
+    # YYYY-MM-DD, YYYY_MM_DD
+    (re.compile(r"(?<!\d)((?:19|20)\d{2})[-_](0?[1-9]|1[0-2])[-_](0?[1-9]|[12]\d|3[01])(?!\d)"), (1, 2, 3)),
+    # YYYYMMDD
+    (re.compile(r"(?<!\d)((?:19|20)\d{2})(0[1-9]|1[0-2])(0[1-9]|[12]\d|3[01])(?!\d)"), (1, 2, 3)),
+]
+
+
+class DateScanner:
+    """ロケールプラグインを結合した日付スキャナ"""
+
+    def __init__(self, plugins: Optional[List[LocalePlugin]] = None):
+        self.plugins = plugins or DEFAULT_PLUGINS
+        self.pattern = re.compile(
+            "|".join(f"(?P<{plugin.name}>{plugin.pattern})" for plugin in self.plugins),
+            re.IGNORECASE,
+        )
+        # 外側のグループが最後に閉じるため、match.lastgroup がプラグイン名になる
+        self._plugins_by_name = {plugin.name: plugin for plugin in self.plugins}
+
+    def scan(
+        self,
+        text: str,
+        max_length: Optional[int] = None,
+        reference: Optional[date] = None,
+    ) -> Iterator[DateMatch]:
+        """
+        テキスト中の日付を出現順に列挙
+
+        Args:
+            text: 検索対象のテキスト
+            max_length: 検索する最大文字数
+            reference: 曖昧な日付の解決に使う基準日（これより後の解釈は採用しない。
+                Noneの場合は今日）
+        """
+        for match, plugin, candidates in self._iter_candidates(text, max_length):
+            yield DateMatch(
+                value=self._resolve(candidates, reference),
+                start=match.start(),
+                end=match.end(),
+                locale=plugin.name,
+                ambiguous=len(candidates) > 1,
+            )
+
+    def find_date(
+        self,
+        text: str,
+        max_length: Optional[int] = None,
+        reference: Optional[date] = None,
+    ) -> Optional[date]:
+        """テキスト中の最初の日付を取得（見つからなければNone）"""
+        for _, _, candidates in self._iter_candidates(text, max_length):
+            return self._resolve(candidates, reference)
+        return None
+
+    def find_date_in_url(self, url: str) -> Optional[date]:
+        """URLのパス・ファイル名から日付を取得"""
+        if not url:
+            return None
+        for pattern, (year_group, month_group, day_group) in URL_PATTERNS:
+            for match in pattern.finditer(url):
+                try:
+                    return date(
+                        int(match.group(year_group)),
+                        int(match.group(month_group)),
+                        int(match.group(day_group)),
+                    )
+                except ValueError:
+                    continue
+        return None
+
+    def _iter_candidates(
+        self,
+        text: str,
+        max_length: Optional[int],
+    ) -> Iterator[Tuple[Match, LocalePlugin, List[date]]]:
+        """一致ごとに (一致結果, プラグイン, 有効な日付候補) を列挙"""
+        if not text:
+            return
+        if max_length is not None:
+            text = text[:max_length]
+        text = text.translate(_FULLWIDTH_TABLE)
+        # 数字を含まないテキストには日付がない
+        if not _DIGIT.search(text):
+            return
+
+        for match in self.pattern.finditer(text):
+            plugin = self._plugins_by_name[match.lastgroup]
+            candidates = self._valid_dates(plugin.build(match))
+            if candidates:
+                yield match, plugin, candidates
+
+    @staticmethod
+    def _valid_dates(candidates: Candidates) -> List[date]:
+        dates = []
+        for year, month, day in candidates:
+            try:
+                dates.append(date(year, month, day))
+            except ValueError:
+                continue
+        return dates
+
+    @staticmethod
+    def _resolve(candidates: List[date], reference: Optional[date]) -> date:
+        """曖昧な日付の解決（基準日より後の解釈を除外し、残りの先頭を採用）"""
+        if len(candidates) == 1:
+            return candidates[0]
+        reference = reference or date.today()
+        past = [candidate for candidate in candidates if candidate <= reference]
+        return past[0] if past else candidates[0]
+
+
+_default_scanner = DateScanner()
+
+
+def find_date(
+    text: str,
+    max_length: Optional[int] = None,
+    reference: Optional[date] = None,
+) -> Optional[date]:
+    """デフォルトのスキャナでテキスト中の最初の日付を取得"""
+    return _default_scanner.find_date(text, max_length=max_length, reference=reference)
+
+
+def find_date_in_url(url: str) -> Optional[date]:
+    """デフォルトのスキャナでURLから日付を取得"""
+    return _default_scanner.find_date_in_url(url)
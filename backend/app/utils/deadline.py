@@ -0,0 +1,128 @@
+"""階層的なデッドライン（ジョブ → 企業 → 記事 → 処理段階）
+
+各階層の時間予算を contextvars で子の処理に引き継ぐ。
+処理段階（記事取得・LLM呼び出し等）の実行時間は「自身の予算」と「親の残り時間」の小さい方に制限され、
+親の予算を使い切った場合はその段階を打ち切る。
+
+- deadline_scope: ジョブ・企業・記事の単位。実行中の処理は中断せず、子の段階の制限と境界での確認に使う
+  （DBセッションを使う処理を途中でキャンセルしないため）
+- run_with_deadline: 処理段階の単位。制限時間を過ぎたらキャンセルして DeadlineExceeded を送出
+- check_deadline: 親の予算を使い切っていれば DeadlineExceeded を送出（段階の間・ループの先頭で呼ぶ）
+"""
+import asyncio
+import math
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Awaitable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class Deadline:
+    """1階層分の締め切り"""
+
+    name: str
+    budget: float
+    started_at: float
+    expires_at: float
+    parent: Optional["Deadline"] = None
+
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+
+class DeadlineExceeded(asyncio.TimeoutError):
+    """時間予算を使い切った"""
+
+    def __init__(self, deadline: Deadline):
+        self.deadline = deadline
+        self.name = deadline.name
+        budget = "unlimited" if math.isinf(deadline.budget) else f"{deadline.budget:g}s"
+        super().__init__(f"{deadline.name} deadline exceeded (budget {budget}, elapsed {deadline.elapsed():.1f}s)")
+
+
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar("current_deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _current_deadline.get()
+
+
+def _new_deadline(name: str, budget: Optional[float]) -> Deadline:
+    """親の残り時間を超えない子の締め切りを作成（budget が None または 0 以下なら親の残り時間のみ）"""
+    parent = _current_deadline.get()
+    now = time.monotonic()
+    own_budget = budget if budget and budget > 0 else math.inf
+    expires_at = now + own_budget
+    if parent is not None:
+        expires_at = min(expires_at, parent.expires_at)
+    return Deadline(name=name, budget=own_budget, started_at=now, expires_at=expires_at, parent=parent)
+
+
+@contextmanager
+def deadline_scope(name: str, budget: Optional[float]) -> Iterator[Deadline]:
+    """
+    ジョブ・企業・記事単位の締め切りを設定
+
+    Args:
+        name: 階層名（"job" / "company" / "item" 等。DeadlineExceeded.name で判別に使う）
+        budget: この階層の予算（秒）。None または 0 以下なら親の残り時間のみ
+    """
+    deadline = _new_deadline(name, budget)
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def check_deadline() -> None:
+    """
+    現在の階層・その親のいずれかが予算切れなら打ち切る
+
+    Raises:
+        DeadlineExceeded: 予算切れの最も内側の階層
+    """
+    deadline = _current_deadline.get()
+    while deadline is not None:
+        if deadline.expired:
+            raise DeadlineExceeded(deadline)
+        deadline = deadline.parent
+
+
+async def run_with_deadline(awaitable: Awaitable[T], name: str, budget: Optional[float]) -> T:
+    """
+    処理段階を「自身の予算」と「親の残り時間」の小さい方で実行
+
+    Raises:
+        DeadlineExceeded: 制限時間内に終わらなかった場合（処理はキャンセルされる）
+    """
+    deadline = _new_deadline(name, budget)
+    if deadline.expired:
+        # 開始前に予算切れ（コルーチンは実行しない）
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        check_deadline()
+        raise DeadlineExceeded(deadline)
+
+    token = _current_deadline.set(deadline)
+    try:
+        timeout = deadline.remaining()
+        return await asyncio.wait_for(awaitable, timeout=None if math.isinf(timeout) else timeout)
+    except asyncio.TimeoutError as e:
+        # 子の段階の DeadlineExceeded や処理自体が送出したタイムアウトはそのまま伝える
+        if isinstance(e, DeadlineExceeded) or not deadline.expired:
+            raise
+        raise DeadlineExceeded(deadline) from None
+    finally:
+        _current_deadline.reset(token)
@@ -0,0 +1,362 @@
+"""HTTPレスポンスのディスクキャッシュ（RFC 9111 の簡易実装）
+
+記事ページの再取得（手動追加・タイムアウト後の再実行・バックフィル・デバッグ用スクリプト）を
+ローカル読み込み、または 304 Not Modified の軽い応答で済ませるためのキャッシュ。
+
+- 鮮度: Cache-Control（no-store / no-cache / max-age）、Expires、Last-Modified によるヒューリスティック
+- 再検証: ETag（If-None-Match）・Last-Modified（If-Modified-Since）による条件付きリクエスト
+- 保存: ボディはSHA-256で内容アドレス化し zlib 圧縮して保存（同じ内容は1つだけ保持）
+- 容量: 合計サイズの上限を超えたら最終アクセスが古い順（LRU）に削除
+"""
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+from app.config import get_settings
+
+# 保存するレスポンスヘッダー（鮮度計算・再検証・解析に必要なもののみ）
+STORED_HEADERS = ("content-type", "etag", "last-modified", "cache-control", "expires", "date", "age")
+
+# Last-Modified によるヒューリスティック鮮度の係数（RFC 9111 4.2.2 の推奨値）
+HEURISTIC_FRACTION = 0.1
+
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """Cache-Controlヘッダーをディレクティブの辞書に変換"""
+    directives: Dict[str, Optional[str]] = {}
+    for part in (value or "").split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip().strip('"') if arg else None
+    return directives
+
+
+def _parse_http_timestamp(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def freshness_lifetime(headers: Dict[str, str], now: float, heuristic_max_age: float) -> Optional[float]:
+    """
+    レスポンスの鮮度寿命（秒）を計算
+
+    Returns:
+        鮮度寿命。保存してはならない（no-store）場合はNone
+    """
+    directives = parse_cache_control(headers.get("cache-control"))
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0.0
+
+    age = 0.0
+    if (headers.get("age") or "").isdigit():
+        age = float(headers["age"])
+
+    max_age = directives.get("max-age")
+    if max_age is not None:
+        try:
+            return max(0.0, float(max_age) - age)
+        except ValueError:
+            return 0.0
+
+    response_date = _parse_http_timestamp(headers.get("date")) or now
+    expires = headers.get("expires")
+    if expires:
+        expires_at = _parse_http_timestamp(expires)
+        # 不正な Expires（"0" 等）は期限切れとして扱う
+        return max(0.0, expires_at - response_date - age) if expires_at else 0.0
+
+    last_modified = _parse_http_timestamp(headers.get("last-modified"))
+    if last_modified and last_modified < response_date:
+        return min((response_date - last_modified) * HEURISTIC_FRACTION, heuristic_max_age)
+    return 0.0
+
+
+@dataclass
+class HttpCacheEntry:
+    """キャッシュ済みレスポンスのメタデータ（ボディは別途読み込む）"""
+
+    url: str
+    final_url: str
+    kind: str
+    encoding: Optional[str]
+    headers: Dict[str, str] = field(default_factory=dict)
+    body_hash: str = ""
+    fresh_until: float = 0.0
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return (now or time.time()) < self.fresh_until
+
+    def validators(self) -> Dict[str, str]:
+        """再検証用の条件付きリクエストヘッダー"""
+        headers = {}
+        if self.headers.get("etag"):
+            headers["If-None-Match"] = self.headers["etag"]
+        if self.headers.get("last-modified"):
+            headers["If-Modified-Since"] = self.headers["last-modified"]
+        return headers
+
+
+class HttpCache:
+    """SQLiteの索引と内容アドレス化した圧縮ボディによるディスクキャッシュ"""
+
+    def __init__(self, directory: str, max_bytes: int, heuristic_max_age: float):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.heuristic_max_age = heuristic_max_age
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    # ---- 非同期API（ファイルI/O・圧縮はスレッドで実行） ----
+
+    async def lookup(self, url: str) -> Optional[HttpCacheEntry]:
+        return await asyncio.to_thread(self._lookup, url)
+
+    async def read_body(self, entry: HttpCacheEntry) -> Optional[bytes]:
+        return await asyncio.to_thread(self._read_body, entry)
+
+    async def store(
+        self,
+        url: str,
+        final_url: str,
+        kind: str,
+        encoding: Optional[str],
+        headers: Dict[str, str],
+        body: bytes,
+    ) -> None:
+        await asyncio.to_thread(self._store, url, final_url, kind, encoding, headers, body)
+
+    async def refresh(self, entry: HttpCacheEntry, headers: Dict[str, str]) -> HttpCacheEntry:
+        """304応答のヘッダーで鮮度を更新"""
+        return await asyncio.to_thread(self._refresh, entry, headers)
+
+    # ---- 内部実装 ----
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            (self.directory / "bodies").mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.directory / "index.sqlite3"), timeout=5, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS entries (
+                    url TEXT PRIMARY KEY,
+                    final_url TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    encoding TEXT,
+                    headers TEXT NOT NULL,
+                    body_hash TEXT NOT NULL,
+                    fresh_until REAL NOT NULL,
+                    last_access REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries(last_access);
+                CREATE INDEX IF NOT EXISTS idx_entries_body_hash ON entries(body_hash);
+                CREATE TABLE IF NOT EXISTS bodies (
+                    body_hash TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL
+                );
+                """
+            )
+            self._conn = conn
+        return self._conn
+
+    def _body_path(self, body_hash: str) -> Path:
+        return self.directory / "bodies" / body_hash[:2] / f"{body_hash}.z"
+
+    def _lookup(self, url: str) -> Optional[HttpCacheEntry]:
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT final_url, kind, encoding, headers, body_hash, fresh_until FROM entries WHERE url = ?",
+                    (url,),
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute("UPDATE entries SET last_access = ? WHERE url = ?", (time.time(), url))
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"[WARN] HTTP cache lookup failed: {e}")
+            return None
+        return HttpCacheEntry(
+            url=url,
+            final_url=row[0],
+            kind=row[1],
+            encoding=row[2],
+            headers=json.loads(row[3]),
+            body_hash=row[4],
+            fresh_until=row[5],
+        )
+
+    def _read_body(self, entry: HttpCacheEntry) -> Optional[bytes]:
+        try:
+            body = zlib.decompress(self._body_path(entry.body_hash).read_bytes())
+        except (OSError, zlib.error) as e:
+            # ボディが欠損・破損している場合はエントリごと捨てて再取得させる
+            print(f"[WARN] HTTP cache body unreadable ({entry.url}): {e}")
+            self._delete_entry(entry.url)
+            return None
+        if hashlib.sha256(body).hexdigest() != entry.body_hash:
+            self._delete_entry(entry.url)
+            return None
+        return body
+
+    def _store(
+        self,
+        url: str,
+        final_url: str,
+        kind: str,
+        encoding: Optional[str],
+        headers: Dict[str, str],
+        body: bytes,
+    ) -> None:
+        now = time.time()
+        stored_headers = {name: headers[name] for name in STORED_HEADERS if headers.get(name)}
+        lifetime = freshness_lifetime(stored_headers, now, self.heuristic_max_age)
+        if lifetime is None:
+            return
+        # 鮮度がなく再検証もできないレスポンスは保存しても再利用できない
+        if lifetime <= 0 and not ("etag" in stored_headers or "last-modified" in stored_headers):
+            return
+
+        body_hash = hashlib.sha256(body).hexdigest()
+        path = self._body_path(body_hash)
+        try:
+            if not path.exists():
+                compressed = zlib.compress(body, 6)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(f".tmp{threading.get_ident()}")
+                tmp_path.write_bytes(compressed)
+                os.replace(tmp_path, path)
+                size = len(compressed)
+            else:
+                size = path.stat().st_size
+
+            with self._lock:
+                conn = self._connect()
+                previous = conn.execute("SELECT body_hash FROM entries WHERE url = ?", (url,)).fetchone()
+                conn.execute(
+                    "INSERT OR IGNORE INTO bodies (body_hash, size) VALUES (?, ?)", (body_hash, size)
+                )
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO entries
+                        (url, final_url, kind, encoding, headers, body_hash, fresh_until, last_access)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        url,
+                        final_url,
+                        kind,
+                        encoding,
+                        json.dumps(stored_headers),
+                        body_hash,
+                        now + lifetime,
+                        now,
+                    ),
+                )
+                conn.commit()
+                if previous and previous[0] != body_hash:
+                    self._delete_orphan_bodies(conn, [previous[0]])
+                self._evict(conn)
+        except (OSError, sqlite3.Error) as e:
+            print(f"[WARN] HTTP cache store failed ({url}): {e}")
+
+    def _refresh(self, entry: HttpCacheEntry, headers: Dict[str, str]) -> HttpCacheEntry:
+        now = time.time()
+        # 304で返されたヘッダーで保存済みのヘッダーを更新（RFC 9111 4.3.4）
+        merged = dict(entry.headers)
+        merged.update({name: headers[name] for name in STORED_HEADERS if headers.get(name)})
+        lifetime = freshness_lifetime(merged, now, self.heuristic_max_age) or 0.0
+        entry.headers = merged
+        entry.fresh_until = now + lifetime
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "UPDATE entries SET headers = ?, fresh_until = ?, last_access = ? WHERE url = ?",
+                    (json.dumps(merged), entry.fresh_until, now, entry.url),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"[WARN] HTTP cache refresh failed ({entry.url}): {e}")
+        return entry
+
+    def _delete_entry(self, url: str) -> None:
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute("SELECT body_hash FROM entries WHERE url = ?", (url,)).fetchone()
+                conn.execute("DELETE FROM entries WHERE url = ?", (url,))
+                conn.commit()
+                if row:
+                    self._delete_orphan_bodies(conn, [row[0]])
+        except sqlite3.Error as e:
+            print(f"[WARN] HTTP cache delete failed ({url}): {e}")
+
+    def _delete_orphan_bodies(self, conn: sqlite3.Connection, body_hashes) -> None:
+        """どのエントリからも参照されなくなったボディを削除（ロック取得済みで呼ぶ）"""
+        for body_hash in body_hashes:
+            in_use = conn.execute("SELECT 1 FROM entries WHERE body_hash = ? LIMIT 1", (body_hash,)).fetchone()
+            if in_use:
+                continue
+            conn.execute("DELETE FROM bodies WHERE body_hash = ?", (body_hash,))
+            try:
+                self._body_path(body_hash).unlink()
+            except FileNotFoundError:
+                pass
+        conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """合計サイズが上限を超えていれば最終アクセスの古い順に削除（上限の9割まで）"""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM bodies").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        target = self.max_bytes * 0.9
+        evicted = 0
+        rows = conn.execute("SELECT url, body_hash FROM entries ORDER BY last_access").fetchall()
+        for url, body_hash in rows:
+            if total <= target:
+                break
+            conn.execute("DELETE FROM entries WHERE url = ?", (url,))
+            size = conn.execute("SELECT size FROM bodies WHERE body_hash = ?", (body_hash,)).fetchone()
+            self._delete_orphan_bodies(conn, [body_hash])
+            still_stored = conn.execute("SELECT 1 FROM bodies WHERE body_hash = ?", (body_hash,)).fetchone()
+            if size and not still_stored:
+                total -= size[0]
+            evicted += 1
+        conn.commit()
+        if evicted:
+            print(f"[INFO] HTTP cache evicted {evicted} entries (size now {total} bytes)")
+
+
+_cache: Optional[HttpCache] = None
+
+
+def get_http_cache() -> Optional[HttpCache]:
+    """設定に従った共有キャッシュを取得（無効化されている場合はNone）"""
+    global _cache
+    settings = get_settings()
+    if not settings.http_cache_enabled:
+        return None
+    if _cache is None:
+        _cache = HttpCache(
+            settings.http_cache_dir,
+            max_bytes=settings.http_cache_max_bytes,
+            heuristic_max_age=settings.http_cache_heuristic_max_age,
+        )
+    return _cache
@@ -1,7 +1,10 @@
 """共通HTTPクライアントユーティリティ"""
+import re
 import httpx
 from typing import Dict, Optional
 
+from app.utils.service_error import ErrorCode, RetryableError
+
 
 class HTTPClient:
     """HTTPリクエストの共通設定と実行"""
@@ -20,6 +23,9 @@ class HTTPClient:
         "Accept-Language": "ja,en-US;q=0.7,en;q=0.3",
     }
 
+    # 一時的な過負荷・アクセス制限を示すステータス（リトライ・サーキットブレーカーの失敗として扱う）
+    TRANSIENT_STATUS_CODES = {429, 502, 503, 504}
+
     @classmethod
     def get_headers(cls, additional_headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
         """
@@ -59,3 +65,44 @@ class HTTPClient:
             follow_redirects=follow_redirects,
             headers=cls.get_headers(additional_headers)
         )
+
+    @classmethod
+    def raise_for_status(cls, response: httpx.Response, service_name: str) -> None:
+        """
+        エラーステータスを例外に変換
+
+        Raises:
+            RetryableError: 429/502/503/504（ホスト側の一時的な問題）
+            httpx.HTTPStatusError: その他の4xx/5xx
+        """
+        if response.status_code in cls.TRANSIENT_STATUS_CODES:
+            raise RetryableError(
+                service_name=service_name,
+                error_code=ErrorCode.HTTP_ERROR,
+                message=f"HTTP {response.status_code}",
+                details={"url": str(response.url)},
+            )
+        response.raise_for_status()
+
+    @staticmethod
+    def decode_html(content: bytes, encoding: Optional[str] = None) -> str:
+        """
+        HTMLのバイト列を文字列に変換
+
+        Args:
+            content: レスポンスボディ
+            encoding: HTTPヘッダー等から得た文字コード（metaタグの指定を優先）
+
+        Returns:
+            デコードしたHTML
+        """
+        charset = None
+        match = re.search(br'charset=["\']?([a-zA-Z0-9_-]+)', content[:1000])
+        if match:
+            charset = match.group(1).decode("ascii", errors="ignore")
+        if not charset:
+            charset = encoding or "utf-8"
+        try:
+            return content.decode(charset, errors="replace")
+        except LookupError:
+            return content.decode("utf-8", errors="replace")
@@ -0,0 +1,33 @@
+"""非同期のレート制限（トークンバケット）"""
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """
+    複数のタスクで共有するトークンバケット
+
+    平均 rate 回/秒、瞬間的には burst 回まで許可する。
+    固定のsleepと違い、待ち時間は実際の呼び出し間隔に応じて決まる。
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """トークンを1つ消費（不足している場合は補充されるまで待つ）"""
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
@@ -1,9 +1,18 @@
 """リトライロジックのユーティリティ"""
 import asyncio
-from typing import TypeVar, Callable, Optional, List, Type
+import time
+from typing import Dict, TypeVar, Callable, Optional, List, Type
 from functools import wraps
+from urllib.parse import urlsplit
 
-from app.utils.service_error import RetryableError, NonRetryableError, ServiceError
+from app.config import get_settings
+from app.utils.service_error import (
+    CircuitOpenError,
+    ErrorCode,
+    RetryableError,
+    NonRetryableError,
+    ServiceError,
+)
 
 T = TypeVar('T')
 
@@ -17,7 +26,8 @@ class RetryConfig:
         initial_delay: float = 1.0,
         max_delay: float = 10.0,
         exponential_base: float = 2.0,
-        retryable_errors: Optional[List[Type[Exception]]] = None
+        retryable_errors: Optional[List[Type[Exception]]] = None,
+        circuit_breaker: Optional["CircuitBreaker"] = None,
     ):
         """
         Args:
@@ -26,12 +36,123 @@ class RetryConfig:
             max_delay: 最大待機時間（秒）
             exponential_base: 指数バックオフの基数
             retryable_errors: リトライ対象の例外クラスリスト
+            circuit_breaker: 試行前に確認するサーキットブレーカー（リトライ対象の例外を失敗として数える）
         """
         self.max_attempts = max_attempts
         self.initial_delay = initial_delay
         self.max_delay = max_delay
         self.exponential_base = exponential_base
         self.retryable_errors = retryable_errors or [RetryableError, TimeoutError, ConnectionError]
+        self.circuit_breaker = circuit_breaker
+
+
+class CircuitBreaker:
+    """
+    サーキットブレーカー（closed / open / half_open）
+
+    - closed: 通常どおり実行。連続失敗が failure_threshold 回に達すると open
+    - open: recovery_timeout 秒間は実行せず即座に CircuitOpenError
+    - half_open: 試行を1件だけ許可し、成功すれば closed、失敗すれば再び open
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 60.0):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_timeout = recovery_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+            return self.HALF_OPEN
+        return self._state
+
+    @property
+    def is_open(self) -> bool:
+        return self._state == self.OPEN
+
+    def before_call(self) -> None:
+        """
+        実行前の確認
+
+        Raises:
+            CircuitOpenError: open 中、または half_open で試行中の呼び出しがある場合
+        """
+        state = self.state
+        if state == self.CLOSED:
+            return
+        if state == self.HALF_OPEN and not self._trial_in_flight:
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = True
+            print(f"[CIRCUIT] {self.name}: half-open, trying one request")
+            return
+        retry_in = max(0.0, self.recovery_timeout - (time.monotonic() - self._opened_at))
+        raise CircuitOpenError(
+            service_name="CircuitBreaker",
+            error_code=ErrorCode.CIRCUIT_OPEN,
+            message=f"Circuit open for {self.name}",
+            details={"retry_in": round(retry_in, 1)},
+        )
+
+    def record_success(self) -> None:
+        if self._state != self.CLOSED:
+            print(f"[CIRCUIT] {self.name}: closed")
+        self._state = self.CLOSED
+        self._failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self._trial_in_flight = False
+        self._failures += 1
+        if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            if self._state != self.OPEN:
+                print(f"[CIRCUIT] {self.name}: open after {self._failures} failures "
+                      f"(retry in {self.recovery_timeout:.0f}s)")
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """成功・失敗のどちらとも判断できない終了（キャンセル等）で試行枠だけ返す"""
+        self._trial_in_flight = False
+
+
+class CircuitBreakerRegistry:
+    """ホストごとのサーキットブレーカー（プロセス内の全タスクで共有）"""
+
+    _breakers: Dict[str, CircuitBreaker] = {}
+
+    @classmethod
+    def get(cls, host: str) -> CircuitBreaker:
+        breaker = cls._breakers.get(host)
+        if breaker is None:
+            settings = get_settings()
+            breaker = CircuitBreaker(
+                host,
+                failure_threshold=settings.circuit_failure_threshold,
+                recovery_timeout=settings.circuit_recovery_timeout,
+            )
+            cls._breakers[host] = breaker
+        return breaker
+
+    @classmethod
+    def for_url(cls, url: str) -> Optional[CircuitBreaker]:
+        """URLのホストに対応するブレーカー（ホストが取れない場合はNone）"""
+        try:
+            host = (urlsplit(url).hostname or "").lower()
+        except ValueError:
+            return None
+        return cls.get(host) if host else None
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._breakers.clear()
 
 
 async def retry_async(
@@ -59,15 +180,26 @@ async def retry_async(
         config = RetryConfig()
 
     last_error = None
+    breaker = config.circuit_breaker
 
     for attempt in range(config.max_attempts):
+        if breaker is not None:
+            # open中のホストには試行せず即座に失敗させる
+            breaker.before_call()
         try:
-            return await func(*args, **kwargs)
+            result = await func(*args, **kwargs)
         except NonRetryableError:
             # リトライ不可のエラーは即座に再スロー
+            if breaker is not None:
+                breaker.release()
             raise
         except tuple(config.retryable_errors) as e:
             last_error = e
+            if breaker is not None:
+                breaker.record_failure()
+                if breaker.is_open:
+                    print(f"[RETRY] Circuit open for {breaker.name}, giving up: {e}")
+                    break
             if attempt < config.max_attempts - 1:
                 # 指数バックオフで待機
                 delay = min(
@@ -81,8 +213,19 @@ async def retry_async(
                 print(f"[RETRY] All {config.max_attempts} attempts failed")
         except Exception as e:
             # 予期しないエラー
+            if breaker is not None:
+                breaker.release()
             print(f"[ERROR] Unexpected error (not retryable): {e}")
             raise
+        except BaseException:
+            # キャンセル（タイムアウト等）
+            if breaker is not None:
+                breaker.release()
+            raise
+        else:
+            if breaker is not None:
+                breaker.record_success()
+            return result
 
     # すべての試行が失敗
     if last_error:
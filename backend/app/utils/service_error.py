@@ -9,6 +9,9 @@ class ErrorCode(str, Enum):
     FETCH_TIMEOUT = "FETCH_TIMEOUT"
     FETCH_FAILED = "FETCH_FAILED"
     HTTP_ERROR = "HTTP_ERROR"
+    CONTENT_TOO_LARGE = "CONTENT_TOO_LARGE"
+    UNSUPPORTED_CONTENT_TYPE = "UNSUPPORTED_CONTENT_TYPE"
+    CIRCUIT_OPEN = "CIRCUIT_OPEN"
 
     # LLM関連
     LLM_UNAVAILABLE = "LLM_UNAVAILABLE"
@@ -21,6 +24,11 @@ class ErrorCode(str, Enum):
     HTML_PARSE_ERROR = "HTML_PARSE_ERROR"
     DATE_EXTRACT_ERROR = "DATE_EXTRACT_ERROR"
 
+    # CPU処理（プロセスプール）関連
+    CPU_TASK_TIMEOUT = "CPU_TASK_TIMEOUT"
+    CPU_TASK_FAILED = "CPU_TASK_FAILED"
+    CPU_TASK_MEMORY_EXCEEDED = "CPU_TASK_MEMORY_EXCEEDED"
+
     # データベース関連
     DB_CONNECTION_ERROR = "DB_CONNECTION_ERROR"
     DB_QUERY_ERROR = "DB_QUERY_ERROR"
@@ -85,3 +93,8 @@ class RetryableError(ServiceError):
 class NonRetryableError(ServiceError):
     """リトライ不可のエラー"""
     pass
+
+
+class CircuitOpenError(NonRetryableError):
+    """サーキットブレーカーが開いているため実行しなかったエラー"""
+    pass
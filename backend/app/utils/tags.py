@@ -0,0 +1,29 @@
+"""記事タグの変換
+
+DBでは text[]（1要素1タグ）で保持し、APIでは従来どおりカンマ区切りの文字列でやり取りする。
+"""
+from typing import Iterable, List, Optional, Union
+
+
+def parse_tags(value: Union[str, Iterable[str], None]) -> List[str]:
+    """
+    カンマ区切りの文字列またはリストをタグのリストに変換
+
+    前後の空白・空要素を除き、重複は最初の1つだけ残す（順序は維持）。
+    """
+    if value is None:
+        return []
+    items = value.split(",") if isinstance(value, str) else value
+    tags: List[str] = []
+    for item in items:
+        tag = str(item).strip() if item is not None else ""
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags
+
+
+def format_tags(tags: Optional[Iterable[str]]) -> Optional[str]:
+    """タグのリストをカンマ区切りの文字列に変換（空の場合はNone）"""
+    if not tags:
+        return None
+    return ",".join(tags) or None
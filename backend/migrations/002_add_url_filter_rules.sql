@@ -0,0 +1,55 @@
+-- Add url_filter_rules table for DB-managed URL filtering (list pages, unreliable domains)
+-- Migration: 002_add_url_filter_rules
+-- Date: 2026-10-19
+-- Purpose: Replace the hardcoded list-article path patterns and unreliable domain list
+--          in ResearchAgent with rules that can be managed per company / region
+
+CREATE TABLE IF NOT EXISTS url_filter_rules (
+    id SERIAL PRIMARY KEY,
+    -- domain: ドメイン（サブドメインを含む）一致
+    -- path_prefix: パスの前方一致
+    -- path_contains: パスの部分一致
+    -- path_regex: パスの正規表現一致
+    rule_type VARCHAR(20) NOT NULL,
+    pattern VARCHAR(500) NOT NULL,
+    action VARCHAR(10) NOT NULL DEFAULT 'deny',
+    company_id INTEGER REFERENCES companies(id) ON DELETE CASCADE,
+    region VARCHAR(10),
+    reason VARCHAR(255),
+    is_active BOOLEAN NOT NULL DEFAULT TRUE,
+    created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT NOW() NOT NULL,
+    updated_at TIMESTAMP WITHOUT TIME ZONE DEFAULT NOW() NOT NULL,
+    CONSTRAINT ck_url_filter_rules_rule_type
+        CHECK (rule_type IN ('domain', 'path_prefix', 'path_contains', 'path_regex')),
+    CONSTRAINT ck_url_filter_rules_action CHECK (action IN ('allow', 'deny'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_url_filter_rules_company_id ON url_filter_rules(company_id);
+
+-- Add trigger for updated_at
+DROP TRIGGER IF EXISTS update_url_filter_rules_updated_at ON url_filter_rules;
+CREATE TRIGGER update_url_filter_rules_updated_at
+    BEFORE UPDATE ON url_filter_rules
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+-- Seed: patterns previously hardcoded in ResearchAgent
+INSERT INTO url_filter_rules (rule_type, pattern, action, reason)
+SELECT v.rule_type, v.pattern, 'deny', v.reason
+FROM (VALUES
+    ('path_contains', '/tags/', 'リスト記事（タグ一覧）'),
+    ('path_contains', '/tag/', 'リスト記事（タグ一覧）'),
+    ('path_contains', '/theme/', 'リスト記事（テーマ一覧）'),
+    ('path_contains', '/keyword/', 'リスト記事（キーワード一覧）'),
+    ('path_contains', '/category/', 'リスト記事（カテゴリ一覧）'),
+    ('path_contains', '/corner/', 'リスト記事（コーナー一覧）'),
+    ('path_contains', '/case', 'リスト記事（事例一覧）'),
+    ('path_contains', '/events', 'リスト記事（イベント一覧）'),
+    ('path_contains', '/insights', 'リスト記事（インサイト一覧）'),
+    ('domain', 'note.com', '信頼性の低いソース（個人ブログ）'),
+    ('domain', 'medium.com', '信頼性の低いソース（個人ブログ）')
+) AS v(rule_type, pattern, reason)
+WHERE NOT EXISTS (SELECT 1 FROM url_filter_rules);
+
+-- Rollback:
+-- DROP TABLE IF EXISTS url_filter_rules;
@@ -0,0 +1,21 @@
+-- Add url_aliases table mapping alias URLs (redirect sources, AMP/mobile pages) to canonical URLs
+-- Migration: 003_add_url_aliases
+-- Date: 2026-10-19
+-- Purpose: Deduplicate articles by canonical URL before fetching and before LLM analysis
+
+CREATE TABLE IF NOT EXISTS url_aliases (
+    -- 正規化済みの別名URL（検索結果・リダイレクト元等）
+    alias_url TEXT PRIMARY KEY,
+    -- 正規化済みの正規URL（リダイレクト先・<link rel="canonical">）
+    canonical_url TEXT NOT NULL,
+    -- redirect / canonical
+    source VARCHAR(20) NOT NULL,
+    resolved_at TIMESTAMP WITHOUT TIME ZONE DEFAULT NOW() NOT NULL,
+    expires_at TIMESTAMP WITHOUT TIME ZONE NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_url_aliases_canonical_url ON url_aliases(canonical_url);
+CREATE INDEX IF NOT EXISTS idx_url_aliases_expires_at ON url_aliases(expires_at);
+
+-- Rollback:
+-- DROP TABLE IF EXISTS url_aliases;
@@ -0,0 +1,26 @@
+-- Add indexes matching the article list ordering (published_date DESC NULLS LAST, id DESC)
+-- Migration: 004_add_article_list_indexes
+-- Date: 2026-10-19
+-- Purpose: Let GET /articles read pages straight from an index (keyset pagination with cursor)
+--          instead of scanning and sorting the whole filtered set for every page
+
+-- 一覧は常に is_inappropriate = false で絞り込むため部分インデックスにする
+-- CONCURRENTLY はトランザクション外で実行すること（psql へのパイプ実行ならそのままでよい）
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_articles_list_order
+    ON articles (published_date DESC NULLS LAST, id DESC)
+    WHERE is_inappropriate = false;
+
+-- 企業で絞り込んだ一覧用
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_articles_company_list_order
+    ON articles (company_id, published_date DESC NULLS LAST, id DESC)
+    WHERE is_inappropriate = false;
+
+-- 未レビュー記事の一覧用（レビュー待ちの消化で深いページまで読むため）
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_articles_unreviewed_list_order
+    ON articles (published_date DESC NULLS LAST, id DESC)
+    WHERE is_inappropriate = false AND is_reviewed = false;
+
+-- Rollback:
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_articles_list_order;
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_articles_company_list_order;
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_articles_unreviewed_list_order;
@@ -0,0 +1,167 @@
+-- Add article_rollups table kept up to date by triggers on articles / companies
+-- Migration: 005_add_article_rollups
+-- Date: 2026-10-19
+-- Purpose: Serve /articles/analysis-stats and /articles/analysis-coefficients from pre-aggregated counts
+--          instead of scanning the articles table on every dashboard load
+
+-- 不適切記事を除いた記事数を (企業, カテゴリ, 事業領域, 国, 公開月, 分析済み) ごとに保持する
+-- カテゴリ・事業領域・国の空文字は NULL にそろえて保持する
+CREATE TABLE IF NOT EXISTS article_rollups (
+    id BIGSERIAL PRIMARY KEY,
+    company_id INTEGER NOT NULL,
+    category VARCHAR(100),
+    business_area VARCHAR(100),
+    country VARCHAR(100),
+    -- 公開月の初日（公開日不明は NULL）
+    month DATE,
+    -- 要約・カテゴリ・事業領域・タグがすべて入っている記事
+    is_analyzed BOOLEAN NOT NULL,
+    article_count BIGINT NOT NULL,
+    CONSTRAINT article_rollups_company_id_fkey FOREIGN KEY (company_id) REFERENCES companies(id) ON DELETE CASCADE,
+    CONSTRAINT uq_article_rollups_key UNIQUE NULLS NOT DISTINCT
+        (company_id, category, business_area, country, month, is_analyzed)
+);
+
+-- 記事1件分の増減を反映（減算で0件になった行は削除）
+CREATE OR REPLACE FUNCTION article_rollups_apply(
+    p_company_id INTEGER,
+    p_category VARCHAR,
+    p_business_area VARCHAR,
+    p_month DATE,
+    p_is_analyzed BOOLEAN,
+    p_delta INTEGER
+)
+RETURNS VOID AS $$
+DECLARE
+    v_country VARCHAR(100);
+BEGIN
+    SELECT NULLIF(country, '') INTO v_country FROM companies WHERE id = p_company_id;
+
+    IF p_delta > 0 THEN
+        INSERT INTO article_rollups
+            (company_id, category, business_area, country, month, is_analyzed, article_count)
+        VALUES
+            (p_company_id, NULLIF(p_category, ''), NULLIF(p_business_area, ''), v_country, p_month, p_is_analyzed, p_delta)
+        ON CONFLICT (company_id, category, business_area, country, month, is_analyzed)
+        DO UPDATE SET article_count = article_rollups.article_count + EXCLUDED.article_count;
+    ELSE
+        UPDATE article_rollups
+        SET article_count = article_count + p_delta
+        WHERE company_id = p_company_id
+          AND category IS NOT DISTINCT FROM NULLIF(p_category, '')
+          AND business_area IS NOT DISTINCT FROM NULLIF(p_business_area, '')
+          AND country IS NOT DISTINCT FROM v_country
+          AND month IS NOT DISTINCT FROM p_month
+          AND is_analyzed = p_is_analyzed;
+
+        DELETE FROM article_rollups
+        WHERE company_id = p_company_id
+          AND article_count <= 0;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION articles_rollup_trigger()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND NOT OLD.is_inappropriate THEN
+        PERFORM article_rollups_apply(
+            OLD.company_id,
+            OLD.category,
+            OLD.business_area,
+            date_trunc('month', OLD.published_date)::date,
+            COALESCE(OLD.summary, '') <> '' AND COALESCE(OLD.category, '') <> ''
+                AND COALESCE(OLD.business_area, '') <> '' AND COALESCE(OLD.tags, '') <> '',
+            -1
+        );
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NOT NEW.is_inappropriate THEN
+        PERFORM article_rollups_apply(
+            NEW.company_id,
+            NEW.category,
+            NEW.business_area,
+            date_trunc('month', NEW.published_date)::date,
+            COALESCE(NEW.summary, '') <> '' AND COALESCE(NEW.category, '') <> ''
+                AND COALESCE(NEW.business_area, '') <> '' AND COALESCE(NEW.tags, '') <> '',
+            1
+        );
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 集計に関係する列の更新時のみ発火（レビュー済みフラグ・本文等の更新では何もしない）
+DROP TRIGGER IF EXISTS articles_rollup_insert_delete ON articles;
+CREATE TRIGGER articles_rollup_insert_delete
+    AFTER INSERT OR DELETE ON articles
+    FOR EACH ROW
+    EXECUTE FUNCTION articles_rollup_trigger();
+
+DROP TRIGGER IF EXISTS articles_rollup_update ON articles;
+CREATE TRIGGER articles_rollup_update
+    AFTER UPDATE OF company_id, category, business_area, published_date, summary, tags, is_inappropriate ON articles
+    FOR EACH ROW
+    EXECUTE FUNCTION articles_rollup_trigger();
+
+-- 企業の国が変わった場合はその企業の行の国を付け替える（企業内の行はすべて同じ国なので衝突しない）
+CREATE OR REPLACE FUNCTION companies_rollup_trigger()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE article_rollups
+    SET country = NULLIF(NEW.country, '')
+    WHERE company_id = NEW.id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS companies_rollup_country ON companies;
+CREATE TRIGGER companies_rollup_country
+    AFTER UPDATE OF country ON companies
+    FOR EACH ROW
+    WHEN (OLD.country IS DISTINCT FROM NEW.country)
+    EXECUTE FUNCTION companies_rollup_trigger();
+
+-- articles から全件を集計し直す（初回投入・不整合の修復用。scripts/rebuild_article_rollups.py から呼ぶ）
+CREATE OR REPLACE FUNCTION rebuild_article_rollups()
+RETURNS BIGINT AS $$
+DECLARE
+    v_rows BIGINT;
+BEGIN
+    -- 再構築中に記事が更新されて増減が失われないよう、集計が終わるまで書き込みを止める
+    LOCK TABLE articles IN SHARE MODE;
+    DELETE FROM article_rollups;
+
+    INSERT INTO article_rollups
+        (company_id, category, business_area, country, month, is_analyzed, article_count)
+    SELECT
+        a.company_id,
+        NULLIF(a.category, ''),
+        NULLIF(a.business_area, ''),
+        NULLIF(c.country, ''),
+        date_trunc('month', a.published_date)::date,
+        COALESCE(a.summary, '') <> '' AND COALESCE(a.category, '') <> ''
+            AND COALESCE(a.business_area, '') <> '' AND COALESCE(a.tags, '') <> '',
+        COUNT(*)
+    FROM articles a
+    JOIN companies c ON c.id = a.company_id
+    WHERE a.is_inappropriate = false
+    GROUP BY 1, 2, 3, 4, 5, 6;
+
+    GET DIAGNOSTICS v_rows = ROW_COUNT;
+    RETURN v_rows;
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT rebuild_article_rollups();
+
+-- Rollback:
+-- DROP TRIGGER IF EXISTS articles_rollup_insert_delete ON articles;
+-- DROP TRIGGER IF EXISTS articles_rollup_update ON articles;
+-- DROP TRIGGER IF EXISTS companies_rollup_country ON companies;
+-- DROP FUNCTION IF EXISTS rebuild_article_rollups();
+-- DROP FUNCTION IF EXISTS companies_rollup_trigger();
+-- DROP FUNCTION IF EXISTS articles_rollup_trigger();
+-- DROP FUNCTION IF EXISTS article_rollups_apply(INTEGER, VARCHAR, VARCHAR, DATE, BOOLEAN, INTEGER);
+-- DROP TABLE IF EXISTS article_rollups;
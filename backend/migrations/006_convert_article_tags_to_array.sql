@@ -0,0 +1,119 @@
+-- Convert articles.tags from a comma-joined VARCHAR(500) to TEXT[] with a GIN index
+-- Migration: 006_convert_article_tags_to_array
+-- Date: 2026-10-19
+-- Purpose: Exact tag matching (any / all of the given tags) served by an index lookup
+--          instead of LIKE '%tag%' substring scans ("AI" no longer matches "OpenAI")
+
+BEGIN;
+
+-- tags を参照するトリガー（migrations/005）は型変更の前に外し、変換後に作り直す
+DROP TRIGGER IF EXISTS articles_rollup_insert_delete ON articles;
+DROP TRIGGER IF EXISTS articles_rollup_update ON articles;
+
+-- "a, b,,a" → {a,b}（前後の空白・空要素を除き、重複は最初の1つだけ残す。空になった場合は NULL）
+CREATE OR REPLACE FUNCTION migrate_split_article_tags(p_tags TEXT)
+RETURNS TEXT[] AS $$
+    SELECT NULLIF(ARRAY(
+        SELECT tag
+        FROM (
+            SELECT btrim(t) AS tag, MIN(n) AS first_pos
+            FROM unnest(string_to_array(p_tags, ',')) WITH ORDINALITY AS u(t, n)
+            WHERE btrim(t) <> ''
+            GROUP BY btrim(t)
+        ) AS s
+        ORDER BY first_pos
+    ), '{}')
+$$ LANGUAGE sql IMMUTABLE;
+
+ALTER TABLE articles
+    ALTER COLUMN tags TYPE TEXT[] USING migrate_split_article_tags(tags);
+
+DROP FUNCTION migrate_split_article_tags(TEXT);
+
+-- 分析済みの判定を「タグが1つ以上ある」に変更
+CREATE OR REPLACE FUNCTION articles_rollup_trigger()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND NOT OLD.is_inappropriate THEN
+        PERFORM article_rollups_apply(
+            OLD.company_id,
+            OLD.category,
+            OLD.business_area,
+            date_trunc('month', OLD.published_date)::date,
+            COALESCE(OLD.summary, '') <> '' AND COALESCE(OLD.category, '') <> ''
+                AND COALESCE(OLD.business_area, '') <> '' AND COALESCE(cardinality(OLD.tags), 0) > 0,
+            -1
+        );
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NOT NEW.is_inappropriate THEN
+        PERFORM article_rollups_apply(
+            NEW.company_id,
+            NEW.category,
+            NEW.business_area,
+            date_trunc('month', NEW.published_date)::date,
+            COALESCE(NEW.summary, '') <> '' AND COALESCE(NEW.category, '') <> ''
+                AND COALESCE(NEW.business_area, '') <> '' AND COALESCE(cardinality(NEW.tags), 0) > 0,
+            1
+        );
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION rebuild_article_rollups()
+RETURNS BIGINT AS $$
+DECLARE
+    v_rows BIGINT;
+BEGIN
+    -- 再構築中に記事が更新されて増減が失われないよう、集計が終わるまで書き込みを止める
+    LOCK TABLE articles IN SHARE MODE;
+    DELETE FROM article_rollups;
+
+    INSERT INTO article_rollups
+        (company_id, category, business_area, country, month, is_analyzed, article_count)
+    SELECT
+        a.company_id,
+        NULLIF(a.category, ''),
+        NULLIF(a.business_area, ''),
+        NULLIF(c.country, ''),
+        date_trunc('month', a.published_date)::date,
+        COALESCE(a.summary, '') <> '' AND COALESCE(a.category, '') <> ''
+            AND COALESCE(a.business_area, '') <> '' AND COALESCE(cardinality(a.tags), 0) > 0,
+        COUNT(*)
+    FROM articles a
+    JOIN companies c ON c.id = a.company_id
+    WHERE a.is_inappropriate = false
+    GROUP BY 1, 2, 3, 4, 5, 6;
+
+    GET DIAGNOSTICS v_rows = ROW_COUNT;
+    RETURN v_rows;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER articles_rollup_insert_delete
+    AFTER INSERT OR DELETE ON articles
+    FOR EACH ROW
+    EXECUTE FUNCTION articles_rollup_trigger();
+
+CREATE TRIGGER articles_rollup_update
+    AFTER UPDATE OF company_id, category, business_area, published_date, summary, tags, is_inappropriate ON articles
+    FOR EACH ROW
+    EXECUTE FUNCTION articles_rollup_trigger();
+
+-- 空要素だけのタグ（"," 等）は NULL になり分析済みの判定が変わるため、集計を作り直す
+SELECT rebuild_article_rollups();
+
+COMMIT;
+
+-- タグの完全一致検索用（&& / @>）。CONCURRENTLY はトランザクション外で実行すること
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_articles_tags
+    ON articles USING GIN (tags);
+
+-- Rollback:
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_articles_tags;
+-- DROP TRIGGER IF EXISTS articles_rollup_insert_delete ON articles;
+-- DROP TRIGGER IF EXISTS articles_rollup_update ON articles;
+-- ALTER TABLE articles ALTER COLUMN tags TYPE VARCHAR(500) USING left(array_to_string(tags, ','), 500);
+-- （その後 005_add_article_rollups.sql の articles_rollup_trigger / rebuild_article_rollups / トリガー定義を再実行）
@@ -0,0 +1,39 @@
+-- Add full-text search (weighted tsvector) and trigram indexes for CJK text to articles
+-- Migration: 007_add_article_search
+-- Date: 2026-10-19
+-- Purpose: Back GET /articles/search with index lookups (English full-text ranking, substring
+--          search for Japanese / CJK text) instead of exporting the corpus and grepping it
+
+-- 日本語・中国語・韓国語は単語の区切りがなく tsvector では検索できないため、トライグラムの部分一致で検索する
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- タイトル(A) > 要約(B) > 本文(C) の重みをつけた英語の検索ベクトル（記事の更新時に自動で再計算）
+ALTER TABLE articles
+    ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(summary, '')), 'B')
+        || setweight(to_tsvector('english', coalesce(content, '')), 'C')
+    ) STORED;
+
+-- CONCURRENTLY はトランザクション外で実行すること（psql へのパイプ実行ならそのままでよい）
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_articles_search_vector
+    ON articles USING GIN (search_vector);
+
+-- CJK の部分一致（ILIKE '%語%'）用。列ごとのインデックスを BitmapOr で組み合わせる
+-- 3文字未満の語はトライグラムを抽出できないためインデックスでは絞り込めない
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_articles_title_trgm
+    ON articles USING GIN (title gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_articles_summary_trgm
+    ON articles USING GIN (summary gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_articles_content_trgm
+    ON articles USING GIN (content gin_trgm_ops);
+
+-- Rollback:
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_articles_content_trgm;
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_articles_summary_trgm;
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_articles_title_trgm;
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_articles_search_vector;
+-- ALTER TABLE articles DROP COLUMN IF EXISTS search_vector;
@@ -0,0 +1,49 @@
+-- Add table_versions change counters bumped by statement-level triggers
+-- Migration: 008_add_table_versions
+-- Date: 2026-10-19
+-- Purpose: Cheap version stamps for ETag / If-None-Match on read APIs, so unchanged frontend polls
+--          get 304 Not Modified without running the list / aggregate queries
+
+CREATE TABLE IF NOT EXISTS table_versions (
+    table_name VARCHAR(100) PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITHOUT TIME ZONE DEFAULT NOW() NOT NULL
+);
+
+-- 文（statement）単位で1回だけ加算する（一括更新でも1行の更新で済む）
+-- 同じテーブルへの書き込みは加算した行のロックでコミットまで直列化される
+CREATE OR REPLACE FUNCTION bump_table_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO table_versions (table_name, version, updated_at)
+    VALUES (TG_TABLE_NAME, 1, NOW())
+    ON CONFLICT (table_name)
+    DO UPDATE SET version = table_versions.version + 1, updated_at = NOW();
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+DECLARE
+    t TEXT;
+BEGIN
+    FOREACH t IN ARRAY ARRAY['articles', 'companies', 'source_urls', 'job_histories']
+    LOOP
+        INSERT INTO table_versions (table_name) VALUES (t) ON CONFLICT (table_name) DO NOTHING;
+        EXECUTE format('DROP TRIGGER IF EXISTS %I ON %I', t || '_bump_version', t);
+        EXECUTE format(
+            'CREATE TRIGGER %I AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON %I '
+            'FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version()',
+            t || '_bump_version', t
+        );
+    END LOOP;
+END;
+$$;
+
+-- Rollback:
+-- DROP TRIGGER IF EXISTS articles_bump_version ON articles;
+-- DROP TRIGGER IF EXISTS companies_bump_version ON companies;
+-- DROP TRIGGER IF EXISTS source_urls_bump_version ON source_urls;
+-- DROP TRIGGER IF EXISTS job_histories_bump_version ON job_histories;
+-- DROP FUNCTION IF EXISTS bump_table_version();
+-- DROP TABLE IF EXISTS table_versions;
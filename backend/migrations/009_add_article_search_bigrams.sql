@@ -0,0 +1,42 @@
+-- Add a CJK bigram index for Japanese / Chinese / Korean substring search on articles
+-- Migration: 009_add_article_search_bigrams
+-- Date: 2026-10-19
+-- Purpose: Let GET /articles/search narrow 2-character CJK terms (銀行, 融資, 生成 ...) with an index.
+--          The pg_trgm indexes from 007 cannot extract trigrams from terms shorter than 3 characters,
+--          so such queries fell back to a sequential scan of content
+
+-- テキスト中の CJK 文字2文字の組（バイグラム）の集合
+-- CJK 文字には大文字・小文字がないため、照合順序によらず検索語側（crud.article の _cjk_bigrams）と同じ結果になる
+CREATE OR REPLACE FUNCTION cjk_bigrams(p_text TEXT)
+RETURNS TEXT[] AS $$
+    SELECT COALESCE(array_agg(DISTINCT gram), '{}')
+    FROM (
+        SELECT substr(p_text, i, 2) AS gram
+        FROM generate_series(1, char_length(COALESCE(p_text, '')) - 1) AS i
+    ) grams
+    WHERE gram ~ '^[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uac00-\ud7af\uff66-\uff9f]{2}$'
+$$ LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE;
+
+-- 記事のタイトル・要約・本文のバイグラム（インデックスと検索条件で同じ式を使うこと）
+CREATE OR REPLACE FUNCTION article_search_bigrams(p_title TEXT, p_summary TEXT, p_content TEXT)
+RETURNS TEXT[] AS $$
+    SELECT cjk_bigrams(concat_ws(E'\n', p_title, p_summary, p_content))
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+
+-- 検索語のバイグラムをすべて含む記事（@>）を GIN インデックスで絞り込み、部分一致（ILIKE）はその記事だけで確認する
+-- CONCURRENTLY はトランザクション外で実行すること（psql へのパイプ実行ならそのままでよい）
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_articles_search_bigrams
+    ON articles USING GIN (article_search_bigrams(title, summary, content));
+
+-- 部分一致はバイグラムで絞り込むため、トライグラムのインデックスは不要（記事更新時の負荷を減らす）
+DROP INDEX CONCURRENTLY IF EXISTS idx_articles_content_trgm;
+DROP INDEX CONCURRENTLY IF EXISTS idx_articles_summary_trgm;
+DROP INDEX CONCURRENTLY IF EXISTS idx_articles_title_trgm;
+
+-- Rollback:
+-- CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_articles_title_trgm ON articles USING GIN (title gin_trgm_ops);
+-- CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_articles_summary_trgm ON articles USING GIN (summary gin_trgm_ops);
+-- CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_articles_content_trgm ON articles USING GIN (content gin_trgm_ops);
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_articles_search_bigrams;
+-- DROP FUNCTION IF EXISTS article_search_bigrams(TEXT, TEXT, TEXT);
+-- DROP FUNCTION IF EXISTS cjk_bigrams(TEXT);
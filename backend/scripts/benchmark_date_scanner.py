@@ -0,0 +1,125 @@
+"""
+Benchmark the date scanner against a labelled corpus.
+
+Reports how many samples resolve to the expected date (compared with the
+previous per-call regex loop) and the average time per call.
+
+Usage:
+    python scripts/benchmark_date_scanner.py --iterations 2000
+"""
+
+import argparse
+import re
+import sys
+import time
+from datetime import date
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+# Add project root to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.utils.date_scanner import DateScanner
+
+# 曖昧な日付の解決に使う基準日（結果を固定するため）
+REFERENCE_DATE = date(2025, 10, 19)
+
+# (テキスト, 期待値)
+CORPUS: List[Tuple[str, Optional[date]]] = [
+    # 日本語
+    ("2025年10月3日 三井住友銀行、生成AIを全行員に展開", date(2025, 10, 3)),
+    ("ニュースリリース 2024年 4月 1日", date(2024, 4, 1)),
+    ("２０２５年１月１５日　お知らせ", date(2025, 1, 15)),
+    ("令和7年10月3日 報道関係各位", date(2025, 10, 3)),
+    ("令和元年5月7日", date(2019, 5, 7)),
+    ("平成31年4月26日 ニュースリリース", date(2019, 4, 26)),
+    ("R7.3.31 公表", date(2025, 3, 31)),
+    ("H30.12.1 更新", date(2018, 12, 1)),
+    # ISO・数値
+    ("2025-10-03", date(2025, 10, 3)),
+    ("Published 2025/10/03 09:00", date(2025, 10, 3)),
+    ("2025.10.03 Press Release", date(2025, 10, 3)),
+    ("2025-10-03T09:00:00+09:00", date(2025, 10, 3)),
+    ("https://example.com/news/20251003_ai.html", date(2025, 10, 3)),
+    # 英語
+    ("Oct 3, 2025 — Bank launches AI assistant", date(2025, 10, 3)),
+    ("October 3rd, 2025", date(2025, 10, 3)),
+    ("Posted on 3 October 2025 by Newsroom", date(2025, 10, 3)),
+    ("Sept. 30, 2025", date(2025, 9, 30)),
+    ("3rd of March 2025", date(2025, 3, 3)),
+    ("NEW YORK, Dec 12 2024 /PRNewswire/", date(2024, 12, 12)),
+    # 欧州
+    ("Paris, le 3 octobre 2025", date(2025, 10, 3)),
+    ("Frankfurt, 3. Oktober 2025", date(2025, 10, 3)),
+    ("Madrid, 3 de octubre de 2025", date(2025, 10, 3)),
+    ("Pressemitteilung vom 15. März 2024", date(2024, 3, 15)),
+    ("03.10.2025 Pressemitteilung", date(2025, 10, 3)),
+    ("25/12/2024", date(2024, 12, 25)),
+    ("12/25/2024", date(2024, 12, 25)),
+    # 曖昧（"/" は月が先、"." は日が先、基準日より後の解釈は除外）
+    ("10/03/2025", date(2025, 10, 3)),
+    ("11/12/2024", date(2024, 11, 12)),
+    ("05.11.2025", date(2025, 5, 11)),
+    # 日付なし
+    ("AI-powered fraud detection goes live", None),
+    ("Order ID 12345678 shipped", None),
+    ("Version 2.1.3 release notes", None),
+]
+
+
+def legacy_extract(text: str) -> Optional[date]:
+    """以前の実装（呼び出しごとに正規表現を順に試す）"""
+    if not text:
+        return None
+    patterns = [
+        r"(\d{4})[/-](\d{1,2})[/-](\d{1,2})",
+        r"(\d{4})年(\d{1,2})月(\d{1,2})日",
+        r"(\d{4})\.(\d{1,2})\.(\d{1,2})",
+        r"(\d{4})(\d{2})(\d{2})",
+    ]
+    for pattern in patterns:
+        match = re.search(pattern, text)
+        if not match:
+            continue
+        try:
+            return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+        except ValueError:
+            continue
+    return None
+
+
+def evaluate(name: str, func: Callable[[str], Optional[date]], iterations: int, verbose: bool) -> None:
+    correct = 0
+    for text, expected in CORPUS:
+        actual = func(text)
+        if actual == expected:
+            correct += 1
+        elif verbose:
+            print(f"  [{name}] MISS {text!r}: expected={expected} actual={actual}")
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for text, _ in CORPUS:
+            func(text)
+    elapsed = time.perf_counter() - started
+    per_call_us = elapsed / (iterations * len(CORPUS)) * 1_000_000
+
+    print(f"{name:8s} correct={correct}/{len(CORPUS)}  {per_call_us:.2f} us/call")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the date scanner")
+    parser.add_argument("--iterations", type=int, default=1000, help="Timing iterations over the corpus")
+    parser.add_argument("--verbose", action="store_true", help="Print mismatches")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    scanner = DateScanner()
+    evaluate("legacy", legacy_extract, args.iterations, args.verbose)
+    evaluate("scanner", lambda text: scanner.find_date(text, reference=REFERENCE_DATE), args.iterations, args.verbose)
+
+
+if __name__ == "__main__":
+    main()
@@ -42,6 +42,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Print HTTP status and the first 1000 chars of HTML",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query DuckDuckGo (skip the local search result cache)",
+    )
     parser.add_argument(
         "--ai-only-llm",
         action="store_true",
@@ -101,7 +106,7 @@ async def main() -> None:
     print()
 
     # Create searcher with config
-    searcher = DuckDuckGoSearcher(config=config)
+    searcher = DuckDuckGoSearcher(config=config, use_cache=not args.no_cache)
 
     if not args.start_date or not args.end_date:
         if not args.timelimit:
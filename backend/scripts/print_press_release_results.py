@@ -27,6 +27,12 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--start-date", type=str, default=None, help="YYYY-MM-DD")
     parser.add_argument("--end-date", type=str, default=None, help="YYYY-MM-DD")
     parser.add_argument("--max-results", type=int, default=500, help="Max results to print")
+    parser.add_argument(
+        "--max-pages",
+        type=int,
+        default=None,
+        help="Max list pages to walk (pagination + year archives)",
+    )
     parser.add_argument(
         "--debug-html",
         action="store_true",
@@ -61,6 +67,7 @@ async def main() -> None:
         debug=args.debug_html,
         use_llm_fallback=args.use_llm,
         extract_date_with_llm=args.date_llm,
+        max_pages=args.max_pages,
     )
 
     print(f"Press list results: {len(results)}")
@@ -0,0 +1,31 @@
+"""
+Rebuild the dashboard rollup table (article_rollups) from the articles table.
+
+The rollup is normally kept up to date by triggers (migrations/005_add_article_rollups.sql);
+run this after bulk imports or if the dashboard counts look inconsistent.
+
+Usage:
+    python scripts/rebuild_article_rollups.py
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.core.database import AsyncSessionLocal
+from app.crud import article as crud_article
+
+
+async def main() -> None:
+    started = time.monotonic()
+    async with AsyncSessionLocal() as db:
+        rows = await crud_article.rebuild_article_rollups(db)
+    print(f"Rebuilt article_rollups: {rows} rows ({time.monotonic() - started:.1f}s)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())